@@ -0,0 +1,218 @@
+# Author: Satya Jhaveri
+#
+# A smooth function on an interval [a, b] can be approximated very closely by a polynomial
+#  written as a sum of Chebyshev polynomials, p(x) = c_0 T_0(t) + c_1 T_1(t) + ... + c_n T_n(t),
+#  where t = (2x - a - b) / (b - a) maps the interval onto [-1, 1] and T_k(cos θ) = cos(kθ).
+#  Interpolating the function at the Chebyshev points t_j = cos(πj / n) avoids the wild
+#  oscillations of interpolation at equally spaced points, and for smooth functions the
+#  coefficients c_k shrink geometrically, so a modest degree is often accurate to machine
+#  precision. The approximation can then be evaluated, integrated and root-found many times
+#  without calling the (possibly expensive) original function again.
+#
+# Since T_k(t_j) = cos(πjk / n), the coefficients are a discrete cosine transform of the function
+#  values, which is found in O(n log n) time with an FFT of the values reflected to a period of
+#  2n. The degree is chosen automatically: starting from 16, the number of points is doubled (the
+#  old points are a subset of the new ones, so they are reused) until the last few coefficients
+#  are negligible, and then the negligible tail is cut off.
+#
+# With the coefficients:
+#  - Clenshaw's algorithm evaluates the series with the recurrence of the Chebyshev polynomials,
+#    which is the analogue of Horner's method.
+#  - The integral over the whole interval is Clenshaw-Curtis quadrature, using
+#    ∫ T_k(t) dt = 2 / (1 - k²) over [-1, 1] for even k (and 0 for odd k).
+#  - The roots are the eigenvalues of the colleague matrix, the Chebyshev version of the
+#    companion matrix used by polynomial.py in the root finding methods.
+#
+
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+
+def _clenshaw(coefficients: np.ndarray, t: np.ndarray) -> np.ndarray:
+    # Evaluates the Chebyshev series at every value of t at once:
+    b1, b2 = np.zeros_like(t), np.zeros_like(t)
+    for c in coefficients[:0:-1]:
+        b1, b2 = c + 2 * t * b1 - b2, b1
+    return coefficients[0] + t * b1 - b2
+
+
+def _coefficients(values: np.ndarray) -> np.ndarray:
+    # The Chebyshev coefficients of the interpolant through values at t_j = cos(πj / n), j = 0, ..., n:
+    n = len(values) - 1
+    if n == 0:
+        return values.copy()
+    coefficients = np.fft.rfft(np.concatenate((values, values[-2:0:-1]))).real[:n + 1] / n
+    coefficients[0] /= 2
+    coefficients[n] /= 2
+    return coefficients
+
+
+class Chebyshev:
+    """
+    A Chebyshev interpolant of a function on an interval, with its degree chosen automatically.
+
+    Args:
+        f (Callable): A smooth function to approximate, which acts elementwise on an array of x values
+        a (float): The lower bound of the interval
+        b (float): The upper bound of the interval
+        degree (Optional[int], optional): A fixed degree to use. Defaults to None (chosen automatically).
+        tol (float, optional): The size of coefficient (relative to the largest) that is small enough to ignore. Defaults to 1e-14.
+        max_degree (int, optional): The largest degree to try when choosing the degree automatically. Defaults to 65536.
+
+    Raises:
+        ValueError: If a >= b, if the degree is negative, if tol is not greater than zero, or if max_degree is less than 16.
+    """
+
+    def __init__(self, f: Callable, a: float, b: float, degree: Optional[int] = None, tol: float = 1e-14, max_degree: int = 65536) -> None:
+        # Validating inputs:
+        if a >= b:
+            raise ValueError("Lower cannot be greater than or equal to upper.")
+
+        if degree is not None and degree < 0:
+            raise ValueError("The degree cannot be negative.")
+
+        if tol <= 0:
+            raise ValueError("tol must be greater than zero.")
+
+        if max_degree < 16:
+            raise ValueError("The maximum degree cannot be less than 16.")
+
+        self.a, self.b = a, b
+        self.evaluations = 0
+        self.converged = True
+
+        # Actual method:
+        if degree is not None:
+            t = np.cos(np.pi * np.arange(degree + 1) / degree) if degree > 0 else np.zeros(1)
+            self.coefficients = _coefficients(self._sample(f, t))
+            return
+
+        n = 16
+        values = self._sample(f, np.cos(np.pi * np.arange(n + 1) / n))
+        while True:
+            coefficients = _coefficients(values)
+            scale = np.max(np.abs(coefficients))
+            tail = np.abs(coefficients[-max(n // 8, 2):])
+            if scale == 0 or np.all(tail <= tol * scale):
+                break
+
+            if 2 * n > max_degree:
+                self.converged = False
+                break
+
+            # Doubling the number of points, where the new points fall between the old ones:
+            refined = np.empty(2 * n + 1)
+            refined[::2] = values
+            refined[1::2] = self._sample(f, np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n)))
+            values, n = refined, 2 * n
+
+        # Cutting off the negligible tail of the coefficients:
+        significant = np.nonzero(np.abs(coefficients) > tol * scale)[0]
+        self.coefficients = coefficients[:significant[-1] + 1] if len(significant) else coefficients[:1]
+
+    @classmethod
+    def _from_coefficients(cls, coefficients: np.ndarray, a: float, b: float) -> "Chebyshev":
+        approximation = cls.__new__(cls)
+        approximation.coefficients, approximation.a, approximation.b = coefficients, a, b
+        approximation.evaluations, approximation.converged = 0, True
+        return approximation
+
+    def _sample(self, f: Callable, t: np.ndarray) -> np.ndarray:
+        self.evaluations += len(t)
+        x = (self.a + self.b) / 2 + (self.b - self.a) / 2 * t
+        return np.broadcast_to(np.asarray(f(x), dtype=float), t.shape).copy()
+
+    @property
+    def degree(self) -> int:
+        return len(self.coefficients) - 1
+
+    def __call__(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Evaluates the approximation using Clenshaw's algorithm.
+
+        Args:
+            x (Union[float, np.ndarray]): The value(s) to evaluate the approximation at
+
+        Returns:
+            Union[float, np.ndarray]: The value of the approximation at each x value
+        """
+        t = (2 * np.asarray(x, dtype=float) - self.a - self.b) / (self.b - self.a)
+        result = _clenshaw(self.coefficients, t)
+        return result[()] if result.ndim == 0 else result
+
+    def derivative(self) -> "Chebyshev":
+        """
+        Finds the exact derivative of the approximation, which is another Chebyshev series of one degree lower.
+
+        Returns:
+            Chebyshev: The derivative, which can be evaluated in the same way as the approximation
+        """
+        n = self.degree
+        derivative = np.zeros(max(n, 1))
+        # Using c'_(k-1) = c'_(k+1) + 2k c_k, working down from the highest degree:
+        for k in range(n, 0, -1):
+            derivative[k - 1] = (derivative[k + 1] if k + 1 < n else 0) + 2 * k * self.coefficients[k]
+        derivative[0] /= 2
+        return Chebyshev._from_coefficients(derivative * 2 / (self.b - self.a), self.a, self.b)
+
+    def integrate(self, lower: Optional[float] = None, upper: Optional[float] = None) -> float:
+        """
+        Calculates the exact value of a definite integral of the approximation. Over the whole interval, this is
+         Clenshaw-Curtis quadrature of the original function.
+
+        Args:
+            lower (Optional[float], optional): The lower integral interval. Defaults to None (the start of the interval).
+            upper (Optional[float], optional): The upper integral interval. Defaults to None (the end of the interval).
+
+        Returns:
+            float: The approximated value of the integral
+        """
+        if lower is None and upper is None:
+            k = np.arange(0, self.degree + 1, 2)
+            return (self.b - self.a) / 2 * np.sum(self.coefficients[::2] * 2 / (1 - k**2))
+
+        # The antiderivative as a Chebyshev series, using ∫ T_k = (T_(k+1) / (k + 1) - T_(k-1) / (k - 1)) / 2:
+        c = np.concatenate((self.coefficients, [0, 0]))
+        k = np.arange(1, len(c) - 1)
+        antiderivative = np.zeros(len(c) - 1)
+        antiderivative[1:] = (c[:-2] - c[2:]) / (2 * k)
+        antiderivative[1] += c[0] / 2  # (∫ T_0 = T_1, and the c_0 term was only counted with half weight above)
+        antiderivative *= (self.b - self.a) / 2
+        lower, upper = (self.a if lower is None else lower), (self.b if upper is None else upper)
+        t = (2 * np.array([lower, upper], dtype=float) - self.a - self.b) / (self.b - self.a)
+        values = _clenshaw(antiderivative, t)
+        return values[1] - values[0]
+
+    def roots(self) -> np.ndarray:
+        """
+        Finds every real root of the approximation in its interval, as the eigenvalues of the colleague matrix.
+
+        Returns:
+            np.ndarray: The sorted roots
+        """
+        # Ignoring negligible leading coefficients, which would make the colleague matrix badly scaled:
+        coefficients = self.coefficients
+        significant = np.nonzero(np.abs(coefficients) > np.finfo(float).eps * np.max(np.abs(coefficients)))[0]
+        if len(significant) == 0 or significant[-1] == 0:
+            return np.array([])
+        coefficients = coefficients[:significant[-1] + 1]
+        n = len(coefficients) - 1
+
+        # x T_0 = T_1, x T_k = (T_(k-1) + T_(k+1)) / 2, and T_n is replaced using p(x) = 0:
+        colleague = np.zeros((n, n))
+        if n > 1:
+            colleague[0, 1] = 1
+            colleague[np.arange(1, n), np.arange(n - 1)] = 0.5
+            colleague[np.arange(1, n - 1), np.arange(2, n)] = 0.5
+        colleague[-1, :] -= coefficients[:-1] / (2 * coefficients[-1])
+        if n == 1:
+            colleague[0, 0] *= 2  # (x T_0 = T_1 has no factor of a half)
+
+        t = np.linalg.eigvals(colleague)
+        t = np.sort(np.clip(t.real[(np.abs(t.imag) <= 1e-8) & (np.abs(t.real) <= 1 + 1e-8)], -1, 1))
+
+        # Polishing with a Newton Raphson iteration:
+        derivative = self.derivative().coefficients * (self.b - self.a) / 2
+        t = np.clip(t - _clenshaw(self.coefficients, t) / np.where(_clenshaw(derivative, t) == 0, np.inf, _clenshaw(derivative, t)), -1, 1)
+        return (self.a + self.b) / 2 + (self.b - self.a) / 2 * t
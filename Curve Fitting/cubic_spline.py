@@ -0,0 +1,219 @@
+# Author: Satya Jhaveri
+#
+# A cubic spline interpolates a set of points (x_0, y_0), ..., (x_(n-1), y_(n-1)) with a separate
+#  cubic polynomial on each interval [x_i, x_(i+1)], chosen so that the curve and its first two
+#  derivatives are continuous at every interior point (knot).
+#
+# Writing M_i for the second derivative of the spline at x_i, h_i = x_(i+1) - x_i and
+#  δ_i = (y_(i+1) - y_i) / h_i, continuity of the first derivative at each interior knot gives:
+#  h_(i-1) M_(i-1) + 2(h_(i-1) + h_i) M_i + h_i M_(i+1) = 6(δ_i - δ_(i-1))
+# which is n - 2 equations for n unknowns. The two missing equations come from the end conditions:
+#  - natural: The second derivative is zero at both ends (M_0 = M_(n-1) = 0).
+#  - clamped: The first derivative at both ends is given.
+#  - not-a-knot: The third derivative is continuous at x_1 and x_(n-2), so the first two pieces
+#    (and the last two pieces) are the same cubic.
+# In every case the equations form a tridiagonal system, which the Thomas algorithm (Gaussian
+#  elimination without pivoting, which is stable here since the system is diagonally dominant)
+#  solves in O(n) time.
+#
+# The coefficients of each piece are stored in powers of (x - x_i), from the highest power to the
+#  lowest, so the spline is evaluated by finding each point's interval with a binary search
+#  (np.searchsorted) and using Horner's method on every point at once. The derivatives and the
+#  integral of each piece are also polynomials, so they can be found exactly.
+#
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+
+def _thomas(lower: np.ndarray, diagonal: np.ndarray, upper: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    # Solves a tridiagonal system, where lower[i] is the entry left of diagonal[i + 1] and upper[i] the entry right of diagonal[i]:
+    n = len(diagonal)
+    c, d = np.zeros(n), np.zeros(n)
+    c[0], d[0] = (upper[0] / diagonal[0] if n > 1 else 0), rhs[0] / diagonal[0]
+    for i in range(1, n):
+        denominator = diagonal[i] - lower[i - 1] * c[i - 1]
+        if i < n - 1:
+            c[i] = upper[i] / denominator
+        d[i] = (rhs[i] - lower[i - 1] * d[i - 1]) / denominator
+
+    # Back substitution:
+    for i in range(n - 2, -1, -1):
+        d[i] -= c[i] * d[i + 1]
+    return d
+
+
+def _horner(coefficients: np.ndarray, t: np.ndarray) -> np.ndarray:
+    # Evaluates the polynomial in each row of coefficients at the matching value of t:
+    result = coefficients[:, 0].copy()
+    for j in range(1, coefficients.shape[1]):
+        result = result * t + coefficients[:, j]
+    return result
+
+
+class CubicSpline:
+    """
+    A cubic spline that interpolates a set of points.
+
+    Args:
+        x (np.ndarray): The x values of the points, in strictly increasing order
+        y (np.ndarray): The y values of the points
+        boundary (str, optional): The end conditions, one of 'natural', 'clamped' or 'not-a-knot'. Defaults to 'natural'.
+        derivatives (Optional[Tuple[float, float]], optional): The first derivative at each end, used by 'clamped' splines.
+            Defaults to None.
+
+    Raises:
+        ValueError: If x and y are different sizes, if x is not strictly increasing, if the end conditions are not recognised,
+            if a clamped spline is not given the derivatives at its ends, or if there are too few points (two, or four for
+            not-a-knot end conditions).
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, boundary: str = "natural", derivatives: Optional[Tuple[float, float]] = None) -> None:
+        # Validating inputs:
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if x.ndim != 1 or x.shape != y.shape:
+            raise ValueError("The number of points in each vector must be equal.")
+
+        if np.any(np.diff(x) <= 0):
+            raise ValueError("The x values must be strictly increasing.")
+
+        if boundary not in ("natural", "clamped", "not-a-knot"):
+            raise ValueError("The boundary must be one of 'natural', 'clamped' or 'not-a-knot'.")
+
+        if boundary == "clamped" and derivatives is None:
+            raise ValueError("A clamped spline needs the first derivative at each end.")
+
+        if len(x) < (4 if boundary == "not-a-knot" else 2):
+            raise ValueError("There are not enough points for these end conditions.")
+
+        # Actual method:
+        n = len(x)
+        h = np.diff(x)
+        delta = np.diff(y) / h
+        M = np.zeros(n)
+
+        if boundary == "clamped":
+            # Every M_i is unknown, with the end derivatives giving the first and last equations:
+            lower = h.copy()
+            diagonal = np.concatenate(([2 * h[0]], 2 * (h[:-1] + h[1:]), [2 * h[-1]]))
+            upper = h.copy()
+            rhs = 6 * np.concatenate(([delta[0] - derivatives[0]], np.diff(delta), [derivatives[1] - delta[-1]]))
+            M = _thomas(lower, diagonal, upper, rhs)
+        elif n > 2:
+            # The interior equations for M_1, ..., M_(n-2):
+            lower = h[1:-1].copy()
+            diagonal = 2 * (h[:-1] + h[1:])
+            upper = h[1:-1].copy()
+            rhs = 6 * np.diff(delta)
+            if boundary == "not-a-knot":
+                # Substituting M_0 and M_(n-1) (which are fixed by M_1, M_2 and M_(n-3), M_(n-2)) into the first and last equations:
+                diagonal[0] = (h[0] + h[1]) * (h[0] + 2 * h[1]) / h[1]
+                upper[0] = (h[1]**2 - h[0]**2) / h[1]
+                diagonal[-1] = (h[-1] + h[-2]) * (h[-1] + 2 * h[-2]) / h[-2]
+                lower[-1] = (h[-2]**2 - h[-1]**2) / h[-2]
+            M[1:-1] = _thomas(lower, diagonal, upper, rhs)
+            if boundary == "not-a-knot":
+                M[0] = ((h[0] + h[1]) * M[1] - h[0] * M[2]) / h[1]
+                M[-1] = ((h[-1] + h[-2]) * M[-2] - h[-1] * M[-3]) / h[-2]
+
+        self.x = x
+        self.coefficients = np.column_stack([np.diff(M) / (6 * h), M[:-1] / 2, delta - h * (2 * M[:-1] + M[1:]) / 6, y[:-1]])
+        self._integrals = None
+
+    @classmethod
+    def _from_coefficients(cls, x: np.ndarray, coefficients: np.ndarray) -> "CubicSpline":
+        spline = cls.__new__(cls)
+        spline.x, spline.coefficients, spline._integrals = x, coefficients, None
+        return spline
+
+    def _locate(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Finds the piece used for each x value (the end pieces are extended outside the knots) and the offset into it:
+        i = np.clip(np.searchsorted(self.x, x, side="right") - 1, 0, len(self.x) - 2)
+        return i, x - self.x[i]
+
+    def __call__(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Evaluates the spline.
+
+        Args:
+            x (Union[float, np.ndarray]): The value(s) to evaluate the spline at
+
+        Returns:
+            Union[float, np.ndarray]: The value of the spline at each x value
+        """
+        x = np.asarray(x, dtype=float)
+        i, t = self._locate(x.ravel())
+        result = _horner(self.coefficients[i], t).reshape(x.shape)
+        return result[()] if result.ndim == 0 else result
+
+    def derivative(self, order: int = 1) -> "CubicSpline":
+        """
+        Finds the exact derivative of the spline, which is another piecewise polynomial.
+
+        Args:
+            order (int, optional): The order of the derivative. Defaults to 1.
+
+        Raises:
+            ValueError: If the order is negative.
+
+        Returns:
+            CubicSpline: The derivative, which can be evaluated in the same way as the spline
+        """
+        if order < 0:
+            raise ValueError("The order of the derivative cannot be negative.")
+
+        coefficients = self.coefficients
+        for _ in range(order):
+            powers = np.arange(coefficients.shape[1] - 1, 0, -1)
+            coefficients = np.column_stack([np.zeros(len(coefficients)), coefficients[:, :-1] * powers])
+        return CubicSpline._from_coefficients(self.x, coefficients)
+
+    def _antiderivative(self, x: np.ndarray) -> np.ndarray:
+        # The integral of the spline from the first knot to each x value:
+        powers = np.arange(self.coefficients.shape[1], 0, -1)
+        integrated = np.column_stack([self.coefficients / powers, np.zeros(len(self.coefficients))])
+        if self._integrals is None:
+            # The integral from the first knot to the start of each piece:
+            self._integrals = np.concatenate(([0], np.cumsum(_horner(integrated, np.diff(self.x)))))
+        i, t = self._locate(x)
+        return self._integrals[i] + _horner(integrated[i], t)
+
+    def integrate(self, a: Union[float, np.ndarray], b: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Calculates the exact value of a definite integral of the spline.
+
+        Args:
+            a (Union[float, np.ndarray]): The lower integral interval(s)
+            b (Union[float, np.ndarray]): The upper integral interval(s)
+
+        Returns:
+            Union[float, np.ndarray]: The value of the integral over each interval
+        """
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        result = (self._antiderivative(b.ravel()) - self._antiderivative(a.ravel())).reshape(a.shape)
+        return result[()] if result.ndim == 0 else result
+
+    def roots(self) -> np.ndarray:
+        """
+        Finds every real root of the spline between its first and last knots, by solving the cubic on each piece.
+
+        Returns:
+            np.ndarray: The sorted roots
+        """
+        h = np.diff(self.x)
+        roots = []
+        for i, coefficients in enumerate(self.coefficients):
+            coefficients = np.trim_zeros(coefficients, "f")
+            if len(coefficients) == 0:
+                roots.append(self.x[i])  # (The spline is zero over this whole piece)
+                continue
+            t = np.roots(coefficients)
+            t = t.real[np.abs(t.imag) <= 1e-8 * h[i]]
+            # (np.roots is only accurate to rounding, so a root on a knot can land just outside its piece)
+            t = t[(t >= -1e-12 * h[i]) & (t <= h[i] * (1 + 1e-12))]
+            roots.extend(self.x[i] + np.clip(t, 0, h[i]))
+
+        # A root on a knot is found by the pieces on both sides of it:
+        roots = np.sort(roots)
+        return roots[np.concatenate(([True], np.diff(roots) > 1e-12 * (self.x[-1] - self.x[0])))] if len(roots) else roots
@@ -0,0 +1,215 @@
+# Author: Satya Jhaveri
+#
+# Linear least squares fits a model y ≈ c_1 φ_1(x) + c_2 φ_2(x) + ... + c_p φ_p(x) to a set of data
+#  points, where the basis functions φ_j are fixed and only the coefficients c_j are unknown. The
+#  coefficients are chosen to minimise the sum of the squared residuals, Σ (y_i - model(x_i))².
+#
+# Writing A for the design matrix (A_ij = φ_j(x_i)), the problem is to minimise ||Ac - y||².
+#  The classic approach solves the normal equations (AᵀA)c = Aᵀy, but forming AᵀA squares the
+#  condition number of the problem, which loses a lot of precision for ill-conditioned bases such
+#  as high degree polynomials. Instead, these methods factorize A = QR, where Q has orthonormal
+#  columns and R is upper triangular, and solve Rc = Qᵀy, which is far more stable.
+#
+# A weighted fit minimises Σ w_i (y_i - model(x_i))², which is the same as scaling each row of A
+#  and y by √w_i. Polynomial fits use the basis x^p, ..., x, 1, so the coefficients are returned
+#  from the highest power of x to the lowest (the same order used by polynomial.py in the root
+#  finding methods).
+#
+# For data sets that are too large to fit in memory, the QR factorization can be built up one
+#  chunk of data at a time (TSQR). Stacking the triangular factor R of the data so far on top of
+#  the next chunk and factorizing again gives the same R as factorizing all of the data at once, so
+#  only a p by p matrix needs to be kept between chunks. The data is read through memory maps, so
+#  each chunk is only loaded from disk when it is used.
+#
+
+import os
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+
+def _solve(A: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    # Solves min ||A c - Y|| for each right hand side column of Y by QR factorization (A may be a stack of matrices).
+    # The columns of A are scaled to unit length first, which improves the conditioning of R:
+    scale = np.linalg.norm(A, axis=-2, keepdims=True)
+    scale[scale == 0] = 1
+    Q, R = np.linalg.qr(A / scale)
+    if np.any(np.abs(np.diagonal(R, axis1=-2, axis2=-1)) <= np.finfo(float).eps * A.shape[-2]):
+        raise ValueError("The design matrix does not have full column rank, so the fit is not unique.")
+    coefficients = np.linalg.solve(R, np.swapaxes(Q, -1, -2) @ Y)
+    return coefficients / np.swapaxes(scale, -1, -2)
+
+
+def _validate(x: np.ndarray, y: np.ndarray, p: int, weights: Optional[np.ndarray]) -> None:
+    if x.shape[-1] != y.shape[-1]:
+        raise ValueError("The number of points in each vector must be equal.")
+
+    if y.shape[-1] < p:
+        raise ValueError("There must be at least as many data points as coefficients.")
+
+    if weights is not None:
+        if weights.shape[-1] != y.shape[-1]:
+            raise ValueError("There must be one weight for each data point.")
+        if np.any(weights < 0):
+            raise ValueError("The weights cannot be negative.")
+
+
+def linear_least_squares(x: np.ndarray, y: np.ndarray, basis: List[Callable], weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fits a linear combination of basis functions to data using least squares (solved by QR factorization).
+
+    Args:
+        x (np.ndarray): The independent variable values
+        y (np.ndarray): The dependent variable values
+        basis (List[Callable]): The basis functions, each of which acts elementwise on an array of x values
+        weights (Optional[np.ndarray], optional): The weight of each data point. Defaults to None (all equal).
+
+    Raises:
+        ValueError: If there are no basis functions, if x and y (and the weights) are different sizes, if there are fewer data
+            points than basis functions, if any weight is negative, or if the basis functions are linearly dependent on the data.
+
+    Returns:
+        np.ndarray: The coefficient of each basis function
+    """
+    # Validating inputs:
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    weights = None if weights is None else np.asarray(weights, dtype=float)
+    if len(basis) == 0:
+        raise ValueError("There must be at least one basis function.")
+    _validate(x, y, len(basis), weights)
+
+    # Actual method:
+    A = np.column_stack([np.broadcast_to(phi(x), x.shape) for phi in basis])
+    if weights is not None:
+        root_w = np.sqrt(weights)
+        A, y = A * root_w[:, None], y * root_w
+    return _solve(A, y[:, None])[:, 0]
+
+
+def polynomial_fit(x: np.ndarray, y: np.ndarray, degree: int, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fits a polynomial to data using least squares (solved by QR factorization).
+
+    Args:
+        x (np.ndarray): The independent variable values
+        y (np.ndarray): The dependent variable values
+        degree (int): The degree of the polynomial to fit
+        weights (Optional[np.ndarray], optional): The weight of each data point. Defaults to None (all equal).
+
+    Raises:
+        ValueError: If the degree is negative, if x and y (and the weights) are different sizes, if there are not more data
+            points than the degree, if any weight is negative, or if there are not enough distinct x values.
+
+    Returns:
+        np.ndarray: The coefficients of the polynomial, from the highest power to the lowest
+    """
+    return polynomial_fit_batch(x, np.asarray(y)[None, :], degree, None if weights is None else np.asarray(weights)[None, :])[0]
+
+
+def polynomial_fit_batch(x: np.ndarray, y: np.ndarray, degree: int, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Fits a polynomial to each of many data series of the same length at once, using least squares.
+    If every series shares the same x values (and weights), the design matrix is only factorized once.
+
+    Args:
+        x (np.ndarray): The independent variable values, either shared by every series (length n), or one row per series (m by n)
+        y (np.ndarray): The dependent variable values, with one row per series (m by n)
+        degree (int): The degree of the polynomials to fit
+        weights (Optional[np.ndarray], optional): The weight of each data point, either shared by every series (length n),
+            or one row per series (m by n). Defaults to None (all equal).
+
+    Raises:
+        ValueError: If the degree is negative, if y is not two dimensional, if the arrays are different sizes, if there are not
+            more data points than the degree, if any weight is negative, or if there are not enough distinct x values.
+
+    Returns:
+        np.ndarray: An m by (degree + 1) array holding the coefficients of each polynomial, from the highest power to the lowest
+    """
+    # Validating inputs:
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    weights = None if weights is None else np.asarray(weights, dtype=float)
+    if degree < 0:
+        raise ValueError("The degree cannot be negative.")
+
+    if y.ndim != 2:
+        raise ValueError("y must have one row per data series.")
+    _validate(x, y, degree + 1, weights)
+
+    # Actual method:
+    A = x[..., None] ** np.arange(degree, -1, -1)  # The design (Vandermonde) matrix, or one per series
+    shared = x.ndim == 1 and (weights is None or weights.ndim == 1)
+    if weights is not None:
+        root_w = np.sqrt(weights)
+        A, y = A * root_w[..., None], y * root_w
+
+    if shared:
+        # One factorization, with every series as a separate right hand side:
+        return _solve(A, y.T).T
+    A = np.broadcast_to(A, y.shape + (degree + 1,))
+    return _solve(A, y[..., None])[..., 0]
+
+
+def _open(data: Union[np.ndarray, str, os.PathLike], dtype: np.dtype) -> np.ndarray:
+    # Memory maps a .npy file or a raw binary file, so that only the chunks being used are read into memory:
+    if isinstance(data, (str, os.PathLike)):
+        if str(data).endswith(".npy"):
+            return np.load(data, mmap_mode="r")
+        return np.memmap(data, dtype=dtype, mode="r")
+    return np.asarray(data)
+
+
+def chunked_least_squares(x: Union[np.ndarray, str, os.PathLike], y: Union[np.ndarray, str, os.PathLike], basis: List[Callable],
+                          weights: Optional[Union[np.ndarray, str, os.PathLike]] = None, chunk_size: int = 1_000_000,
+                          dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Fits a linear combination of basis functions to data that may be too large to fit in memory, using least squares.
+    The data is read in chunks, and a QR factorization is updated with each one (TSQR), so only O(p²) values (where p is
+    the number of basis functions) are kept between chunks.
+
+    Args:
+        x (Union[np.ndarray, str, os.PathLike]): The independent variable values, or the path to a .npy or raw binary file of them
+        y (Union[np.ndarray, str, os.PathLike]): The dependent variable values, or the path to a .npy or raw binary file of them
+        basis (List[Callable]): The basis functions, each of which acts elementwise on an array of x values
+        weights (Optional[Union[np.ndarray, str, os.PathLike]], optional): The weight of each data point, or the path to a
+            .npy or raw binary file of them. Defaults to None (all equal).
+        chunk_size (int, optional): The number of data points to read at once. Defaults to 1,000,000.
+        dtype (np.dtype, optional): The type of the values in raw binary files. Defaults to np.float64.
+
+    Raises:
+        ValueError: If there are no basis functions, if chunk_size is less than 1, if x and y (and the weights) are different
+            sizes, if there are fewer data points than basis functions, if any weight is negative, or if the basis functions
+            are linearly dependent on the data.
+
+    Returns:
+        np.ndarray: The coefficient of each basis function
+    """
+    # Validating inputs:
+    x, y = _open(x, dtype), _open(y, dtype)
+    weights = None if weights is None else _open(weights, dtype)
+    if len(basis) == 0:
+        raise ValueError("There must be at least one basis function.")
+
+    if chunk_size < 1:
+        raise ValueError("The chunk size cannot be less than one.")
+    p = len(basis)
+    _validate(x, y, p, None)  # (The weights are checked one chunk at a time, rather than reading them all at once)
+
+    if weights is not None and len(weights) != len(y):
+        raise ValueError("There must be one weight for each data point.")
+
+    # Actual method:
+    # R is the triangular factor of the augmented matrix [A y] for every chunk so far. Stacking it on top of the next
+    #  chunk and factorizing again gives the triangular factor for all of the data, and its last column holds Qᵀy:
+    R = np.zeros((0, p + 1))
+    for i in range(0, len(y), chunk_size):
+        x_chunk, y_chunk = np.asarray(x[i:i + chunk_size], dtype=float), np.asarray(y[i:i + chunk_size], dtype=float)
+        A = np.column_stack([np.broadcast_to(phi(x_chunk), x_chunk.shape) for phi in basis] + [y_chunk])
+        if weights is not None:
+            w_chunk = np.asarray(weights[i:i + chunk_size], dtype=float)
+            if np.any(w_chunk < 0):
+                raise ValueError("The weights cannot be negative.")
+            A *= np.sqrt(w_chunk)[:, None]
+        R = np.linalg.qr(np.vstack([R, A]), mode="r")
+
+    R = np.vstack([R, np.zeros((p + 1 - len(R), p + 1))])  # (In case there were fewer points than columns)
+    return _solve(R[:p, :p], R[:p, p:])[:, 0]
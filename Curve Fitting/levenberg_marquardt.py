@@ -0,0 +1,278 @@
+# Author: Satya Jhaveri
+#
+# The Levenberg-Marquardt method fits a model that depends nonlinearly on its parameters (such as
+#  an exponential decay a * exp(-b x), or a Gaussian peak) to data, by minimising the sum of the
+#  squared residuals r_i = model(x_i, p) - y_i.
+#
+# Each iteration linearizes the residuals around the current parameters using the Jacobian matrix
+#  J (J_ij = dr_i/dp_j), and solves for the step δ:
+#  (JᵀJ + λ diag(JᵀJ)) δ = -Jᵀr
+#  When the damping parameter λ is small this is a Gauss-Newton step, which converges quickly near
+#  the solution. When λ is large it becomes a short step in the steepest descent direction, which
+#  is slow but reliable far from the solution. λ is decreased after every step that reduces the
+#  sum of squares, and increased after every step that does not.
+#
+# Computing the Jacobian is usually the most expensive part of each iteration (finite differences
+#  cost one model evaluation per parameter). After an accepted step, the Jacobian can instead be
+#  corrected with Broyden's rank-one update, which makes it agree with the change in the residuals
+#  seen along the step. The full Jacobian is only recomputed every few iterations, or when a step
+#  fails, since a failed step may mean the approximation has drifted too far.
+#
+# Bounds on the parameters are enforced by holding any parameter that is at a bound (and would be
+#  pushed past it) fixed, and projecting each step back inside the bounds.
+#
+# The model is called as model(x, p), where p is a sequence of parameters (so p[0] is the first
+#  parameter). The batched method fits many independent problems at once by passing each
+#  parameter as a column of values (one per problem), so the same model code evaluates every
+#  problem in one vectorized call.
+#
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+
+@dataclass
+class FitResult:
+    """
+    The result of a nonlinear curve fitting method.
+
+    Attributes:
+        parameters (np.ndarray): The fitted parameters (one row per problem for batched fits)
+        cost (Union[float, np.ndarray]): The (weighted) sum of squared residuals of each fit
+        iterations (int): The number of iterations performed
+        evaluations (int): The number of (vectorized) evaluations of the model, including those used for finite differences
+        jacobian_evaluations (int): The number of times the full Jacobian was computed
+        converged (Union[bool, np.ndarray]): Whether each fit converged
+        elapsed (float): The time (in seconds) the method took to run
+    """
+    parameters: np.ndarray
+    cost: Union[float, np.ndarray]
+    iterations: int
+    evaluations: int
+    jacobian_evaluations: int
+    converged: Union[bool, np.ndarray]
+    elapsed: float
+
+
+def _dual_array() -> type:
+    # The dual numbers live with the other automatic differentiation code in the root finding methods, and are taken from
+    #  the numerical_methods package, so that there is only one DualArray class:
+    from numerical_methods.roots import DualArray
+    return DualArray
+
+
+def levenberg_marquardt(model: Callable, x: np.ndarray, y: np.ndarray, p0: np.ndarray, jacobian: Union[Callable, str] = "finite",
+                        weights: Optional[np.ndarray] = None, bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None, broyden: bool = True,
+                        recompute_every: int = 10, ftol: float = 1e-12, xtol: float = 1e-12, gtol: float = 1e-12, max_iter: int = 200,
+                        callback: Optional[Callable] = None) -> FitResult:
+    """
+    Fits a nonlinear model to data using the Levenberg-Marquardt method.
+
+    Args:
+        model (Callable): The model, called as model(x, p), where p is a sequence of parameters
+        x (np.ndarray): The independent variable values
+        y (np.ndarray): The dependent variable values
+        p0 (np.ndarray): The initial guess of the parameters
+        jacobian (Union[Callable, str], optional): How to compute the Jacobian of the model. Either a function called as
+            jacobian(x, p) that returns a list of the partial derivatives of the model with respect to each parameter, 'finite'
+            for forward differences, or 'dual' for automatic differentiation with dual numbers (in which case the model must
+            be written with NumPy operations). Defaults to 'finite'.
+        weights (Optional[np.ndarray], optional): The weight of each data point. Defaults to None (all equal).
+        bounds (Optional[Tuple[np.ndarray, np.ndarray]], optional): The lower and upper bounds of each parameter. Defaults to None.
+        broyden (bool, optional): Whether to update the Jacobian with Broyden's method between full recomputations. Defaults to True.
+        recompute_every (int, optional): The maximum number of Broyden updates before the full Jacobian is recomputed. Defaults to 10.
+        ftol (float, optional): The relative reduction in the sum of squares that is small enough to stop at. Defaults to 1e-12.
+        xtol (float, optional): The relative size of step that is small enough to stop at. Defaults to 1e-12.
+        gtol (float, optional): The size of gradient that is small enough to stop at. Defaults to 1e-12.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 200.
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the current
+            parameters and the sum of squared residuals. Defaults to None.
+
+    Raises:
+        ValueError: If x, y and the weights are different sizes, if there are fewer data points than parameters, if any weight
+            is negative, if the Jacobian method is not recognised, if the bounds are invalid, or if max_iter or
+            recompute_every are less than 1.
+
+    Returns:
+        FitResult: The fitted parameters, along with the sum of squared residuals and the work done.
+    """
+    y = np.asarray(y, dtype=float)
+    weights = None if weights is None else np.asarray(weights, dtype=float)[None, :]
+    result = levenberg_marquardt_batch(model, x, y[None, :], np.asarray(p0, dtype=float)[None, :], jacobian, weights, bounds, broyden,
+                                       recompute_every, ftol, xtol, gtol, max_iter,
+                                       None if callback is None else lambda i, P, cost: callback(i, P[0], float(cost[0])))
+    return FitResult(result.parameters[0], float(result.cost[0]), result.iterations, result.evaluations, result.jacobian_evaluations,
+                     bool(result.converged[0]), result.elapsed)
+
+
+def levenberg_marquardt_batch(model: Callable, x: np.ndarray, y: np.ndarray, p0: np.ndarray, jacobian: Union[Callable, str] = "finite",
+                              weights: Optional[np.ndarray] = None, bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None, broyden: bool = True,
+                              recompute_every: int = 10, ftol: float = 1e-12, xtol: float = 1e-12, gtol: float = 1e-12, max_iter: int = 200,
+                              callback: Optional[Callable] = None) -> FitResult:
+    """
+    Fits a nonlinear model to many independent data series at once using the Levenberg-Marquardt method.
+    Each parameter is passed to the model as a column of values (one row per series), so the residuals of every series are
+     evaluated with a single vectorized call to the model.
+
+    Args:
+        model (Callable): The model, called as model(x, p), where p is a sequence of parameters
+        x (np.ndarray): The independent variable values, either shared by every series (length n), or one row per series (m by n)
+        y (np.ndarray): The dependent variable values, with one row per series (m by n)
+        p0 (np.ndarray): The initial guess of the parameters, either shared by every series, or one row per series
+        jacobian (Union[Callable, str], optional): How to compute the Jacobian of the model (see levenberg_marquardt). Defaults to 'finite'.
+        weights (Optional[np.ndarray], optional): The weight of each data point. Defaults to None (all equal).
+        bounds (Optional[Tuple[np.ndarray, np.ndarray]], optional): The lower and upper bounds of each parameter. Defaults to None.
+        broyden (bool, optional): Whether to update the Jacobian with Broyden's method between full recomputations. Defaults to True.
+        recompute_every (int, optional): The maximum number of Broyden updates before the full Jacobian is recomputed. Defaults to 10.
+        ftol (float, optional): The relative reduction in the sum of squares that is small enough to stop at. Defaults to 1e-12.
+        xtol (float, optional): The relative size of step that is small enough to stop at. Defaults to 1e-12.
+        gtol (float, optional): The size of gradient that is small enough to stop at. Defaults to 1e-12.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 200.
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the current
+            parameters of every series and the sum of squared residuals of every series. Defaults to None.
+
+    Raises:
+        ValueError: If y is not two dimensional, if x, y and the weights are different sizes, if there are fewer data points than
+            parameters, if any weight is negative, if the Jacobian method is not recognised, if the bounds are invalid, or if
+            max_iter or recompute_every are less than 1.
+
+    Returns:
+        FitResult: The fitted parameters of each series, along with the sum of squared residuals of each series and the work done.
+    """
+    # Validating inputs:
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if y.ndim != 2:
+        raise ValueError("y must have one row per data series.")
+
+    m, n = y.shape
+    P = np.array(np.broadcast_to(np.asarray(p0, dtype=float), (m, np.shape(p0)[-1])))
+    n_params = P.shape[1]
+    if x.shape[-1] != n or (x.ndim == 2 and x.shape[0] != m):
+        raise ValueError("The number of points in each vector must be equal.")
+
+    if n < n_params:
+        raise ValueError("There must be at least as many data points as parameters.")
+
+    root_w = np.ones((1, n)) if weights is None else np.broadcast_to(np.sqrt(np.asarray(weights, dtype=float)), (m, n))
+    if weights is not None and np.any(np.asarray(weights) < 0):
+        raise ValueError("The weights cannot be negative.")
+
+    if not callable(jacobian) and jacobian not in ("finite", "dual"):
+        raise ValueError("The Jacobian must be a function, 'finite' or 'dual'.")
+
+    lower, upper = (-np.inf, np.inf) if bounds is None else (np.asarray(bounds[0], dtype=float), np.asarray(bounds[1], dtype=float))
+    if np.any(lower >= upper):
+        raise ValueError("Each lower bound must be less than the upper bound.")
+
+    if max_iter < 1 or recompute_every < 1:
+        raise ValueError("max_iter and recompute_every cannot be less than one.")
+
+    start = perf_counter()
+    evaluations = 0
+    jacobian_evaluations = 0
+
+    def columns(P: np.ndarray) -> list:
+        return [P[:, j, None] for j in range(n_params)]
+
+    def select(array: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        # The rows of an array with one row per series, or the whole array if it is shared by every series:
+        return array[rows] if array.ndim == 2 and array.shape[0] == m else array
+
+    def residuals(P: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        # The residuals of the series in rows (where P holds only the parameters of those series):
+        nonlocal evaluations
+        evaluations += 1
+        return select(root_w, rows) * (np.broadcast_to(model(select(x, rows), columns(P)), (len(P), n)) - y[rows])
+
+    def full_jacobian(P: np.ndarray, R: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        # The Jacobian of the series in rows (where P and R hold only the parameters and residuals of those series):
+        nonlocal evaluations, jacobian_evaluations
+        jacobian_evaluations += 1
+        k = len(P)
+        J = np.empty((k, n, n_params))
+        if callable(jacobian):
+            for j, partial in enumerate(jacobian(select(x, rows), columns(P))):
+                J[:, :, j] = select(root_w, rows) * np.broadcast_to(partial, (k, n))
+        elif jacobian == "dual":
+            DualArray = _dual_array()
+            for j in range(n_params):
+                p = columns(P)
+                p[j] = DualArray(p[j], np.ones_like(p[j]))
+                evaluations += 1
+                J[:, :, j] = select(root_w, rows) * np.broadcast_to(model(select(x, rows), p).derivative, (k, n))
+        else:
+            for j in range(n_params):
+                h = 1.5e-8 * np.maximum(np.abs(P[:, j]), 1.0)
+                h = np.where(P[:, j] + h > np.broadcast_to(upper, (m, n_params))[rows, j], -h, h)  # (Stepping backwards at an upper bound)
+                P_step = P.copy()
+                P_step[:, j] += h
+                J[:, :, j] = (residuals(P_step, rows) - R) / h[:, None]
+        return J
+
+    # Actual method:
+    P = np.clip(P, lower, upper)
+    everything = np.ones(m, dtype=bool)
+    R = residuals(P, everything)
+    cost = np.sum(R * R, axis=1)
+    J = full_jacobian(P, R, everything)
+    JtJ = np.einsum("mni,mnj->mij", J, J)
+    damping = 1e-3 * np.max(np.diagonal(JtJ, axis1=1, axis2=2), axis=1)
+    damping[damping == 0] = 1e-3
+    updates = np.zeros(m, dtype=int)  # The number of Broyden updates since the Jacobian was last computed
+    done = np.zeros(m, dtype=bool)
+    iterations = 0
+
+    while iterations < max_iter and not done.all():
+        iterations += 1
+        JtJ = np.einsum("mni,mnj->mij", J, J)
+        gradient = np.einsum("mni,mn->mi", J, R)
+
+        # Holding the parameters that are at a bound, and being pushed further past it, fixed for this step:
+        free = ~(((P <= lower) & (gradient > 0)) | ((P >= upper) & (gradient < 0)))
+        gradient = gradient * free
+        done |= np.max(np.abs(gradient), axis=1) <= gtol
+        if done.all():
+            if callback is not None:
+                callback(iterations, P.copy(), cost.copy())
+            break
+
+        # Solving for the damped step, and projecting it inside the bounds:
+        diagonal = np.maximum(np.diagonal(JtJ, axis1=1, axis2=2), 1e-12)
+        A = JtJ + damping[:, None, None] * (np.eye(n_params) * diagonal[:, None, :])
+        A = A * (free[:, :, None] & free[:, None, :]) + np.eye(n_params) * ~free[:, None, :]
+        step = np.linalg.solve(A, -gradient[..., None])[..., 0]
+        P_new = np.clip(P + step, lower, upper)
+        step = P_new - P
+
+        R_new = residuals(P_new, everything)
+        cost_new = np.sum(R_new * R_new, axis=1)
+        improved = ~done & (cost_new < cost)
+        small_step = np.linalg.norm(step, axis=1) <= xtol * (np.linalg.norm(P, axis=1) + xtol)
+        small_change = (cost - cost_new) <= ftol * cost
+
+        # Broyden's rank-one update of the Jacobian, using the change in residuals along the step:
+        step_squared = np.sum(step * step, axis=1)
+        step_squared[step_squared == 0] = 1
+        change = R_new - R - np.einsum("mni,mi->mn", J, step)
+        J_updated = J + change[:, :, None] * step[:, None, :] / step_squared[:, None, None]
+
+        # Accepting the steps that reduced the sum of squares:
+        P[improved], R[improved], cost[improved] = P_new[improved], R_new[improved], cost_new[improved]
+        damping = np.where(improved, np.maximum(damping / 3, 1e-15), damping * 2)
+        done |= (improved & small_change) | (~done & small_step)
+
+        # Choosing which problems get a Broyden update, and which need the full Jacobian recomputed:
+        approximate = improved & broyden & (updates < recompute_every)
+        recompute = ~done & ~approximate & (improved | (updates > 0))
+        J[approximate] = J_updated[approximate]
+        updates[approximate] += 1
+        if recompute.any():
+            J[recompute] = full_jacobian(P[recompute], R[recompute], recompute)
+            updates[recompute] = 0
+        if callback is not None:
+            callback(iterations, P.copy(), cost.copy())
+
+    return FitResult(P, cost, iterations, evaluations, jacobian_evaluations, done, perf_counter() - start)
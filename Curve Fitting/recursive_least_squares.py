@@ -0,0 +1,141 @@
+# Author: Satya Jhaveri
+#
+# Recursive least squares keeps a linear least squares fit up to date as new data points arrive,
+#  without refitting from scratch. It stores the current coefficients c and the matrix
+#  P = (AᵀA)⁻¹ for all of the data seen so far. When a new row a (the basis functions evaluated at
+#  the new x value) arrives with value y, the Sherman-Morrison formula updates both in O(p²) work,
+#  where p is the number of coefficients:
+#  k = Pa / (1 + aᵀPa)
+#  c = c + k (y - aᵀc)
+#  P = P - k aᵀP
+#
+# A forgetting factor λ (0 < λ ≤ 1) down-weights old data, so that a point seen k samples ago has
+#  weight λ^k. This lets the fit follow a model whose coefficients drift over time. With λ = 1,
+#  every point has equal weight and the result matches a batch least squares fit.
+#
+# A mini-batch of data points is added at once using the Woodbury identity, which is the same
+#  update with a small matrix in place of the scalar 1 + aᵀPa. Large batches are split into chunks
+#  of at most p points, so the cost stays at O(p²) per point.
+#
+# Since there is no data to start with, P starts as δI for a large δ, which is the same as a very
+#  weak prior that the coefficients are zero.
+#
+
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+class RecursiveLeastSquares:
+    """
+    A linear least squares fit of a combination of basis functions, which is updated as each new data point arrives.
+
+    Args:
+        basis (List[Callable]): The basis functions, each of which acts elementwise on an array of x values
+        forgetting (float, optional): The factor that the weight of every old data point is multiplied by when a new point
+            arrives. Defaults to 1.0 (no forgetting).
+        delta (float, optional): The initial scale of P, where a larger value means the starting coefficients (all zero)
+            have less influence on the fit. Defaults to 1e8.
+
+    Raises:
+        ValueError: If there are no basis functions, if the forgetting factor is not in the range (0, 1], or if delta is not
+            greater than zero.
+    """
+
+    def __init__(self, basis: List[Callable], forgetting: float = 1.0, delta: float = 1e8) -> None:
+        # Validating inputs:
+        if len(basis) == 0:
+            raise ValueError("There must be at least one basis function.")
+
+        if not 0 < forgetting <= 1:
+            raise ValueError("The forgetting factor must be greater than zero and at most one.")
+
+        if delta <= 0:
+            raise ValueError("Delta must be greater than zero.")
+
+        self.basis = list(basis)
+        self.forgetting = forgetting
+        self.coefficients = np.zeros(len(basis))
+        self.P = delta * np.eye(len(basis))
+        self.samples = 0
+
+    def _design(self, x: np.ndarray) -> np.ndarray:
+        return np.column_stack([np.broadcast_to(phi(x), x.shape) for phi in self.basis])
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Adds one data point, or a mini-batch of data points in the order they arrived, to the fit.
+
+        Args:
+            x (np.ndarray): The independent variable value(s)
+            y (np.ndarray): The dependent variable value(s)
+
+        Raises:
+            ValueError: If x and y are different sizes.
+
+        Returns:
+            np.ndarray: The updated coefficient of each basis function
+        """
+        x, y = np.atleast_1d(np.asarray(x, dtype=float)), np.atleast_1d(np.asarray(y, dtype=float))
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("The number of points in each vector must be equal.")
+
+        A = self._design(x)
+        p = len(self.basis)
+        for i in range(0, len(y), p):
+            self._update_chunk(A[i:i + p], y[i:i + p])
+        self.samples += len(y)
+        return self.coefficients.copy()
+
+    def _update_chunk(self, A: np.ndarray, y: np.ndarray) -> None:
+        # Woodbury update for k new rows, where the j-th row (of k) is weighted by λ^(k - 1 - j):
+        k = len(y)
+        decay = self.forgetting ** np.arange(k - 1, -1, -1)
+        P = self.P / self.forgetting ** k
+        PA = P @ A.T
+        S = np.diag(1 / decay) + A @ PA
+        gain = np.linalg.solve(S, PA.T).T  # P Aᵀ S⁻¹
+        self.coefficients = self.coefficients + gain @ (y - A @ self.coefficients)
+        P = P - gain @ PA.T
+        self.P = (P + P.T) / 2  # (Keeping P symmetric despite rounding errors)
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the current fit.
+
+        Args:
+            x (np.ndarray): The independent variable value(s)
+
+        Returns:
+            np.ndarray: The value of the fitted model at each x value
+        """
+        x = np.asarray(x, dtype=float)
+        return (self._design(np.atleast_1d(x)) @ self.coefficients).reshape(x.shape)
+
+    def snapshot(self) -> Dict:
+        """
+        Copies the state of the fit, so that it can be saved and restored later. The basis functions are not included.
+
+        Returns:
+            Dict: The coefficients, P, the forgetting factor and the number of data points seen
+        """
+        return {"coefficients": self.coefficients.copy(), "P": self.P.copy(), "forgetting": self.forgetting, "samples": self.samples}
+
+    def restore(self, state: Dict) -> None:
+        """
+        Restores a state previously returned by snapshot.
+
+        Args:
+            state (Dict): The state to restore
+
+        Raises:
+            ValueError: If the state does not match the number of basis functions.
+        """
+        p = len(self.basis)
+        coefficients, P = np.array(state["coefficients"], dtype=float), np.array(state["P"], dtype=float)
+        if coefficients.shape != (p,) or P.shape != (p, p):
+            raise ValueError("The state does not match the number of basis functions.")
+
+        self.coefficients, self.P = coefficients, P
+        self.forgetting = state["forgetting"]
+        self.samples = state["samples"]
@@ -2,6 +2,22 @@
 # Author: Satya Jhaveri
 
 import unittest
+import os
+import sys
+import tempfile
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)  # (So that the Levenberg-Marquardt method can find the dual numbers through the numerical_methods package)
+
+import numerical_methods
+from chebyshev import Chebyshev
+from cubic_spline import CubicSpline
+from least_squares import chunked_least_squares, linear_least_squares, polynomial_fit, polynomial_fit_batch
+import levenberg_marquardt as lm_module
+from levenberg_marquardt import levenberg_marquardt, levenberg_marquardt_batch
+from recursive_least_squares import RecursiveLeastSquares
 
 
 class TestCurveFit(unittest.TestCase):
@@ -15,6 +31,362 @@ class TestCurveFit(unittest.TestCase):
             print(e)
         print(f"Number of errors: {len(self.errorList)}")
         
+    def test_polynomial_fit(self) -> None:
+        actual_coefficients = np.array([0.5, -2, 1, 3])
+        acceptable_error = 1e-8
+        x = np.linspace(-3, 3, 1001)
+        y = np.polyval(actual_coefficients, x)
+        
+        # Testing method:
+        try:
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(polynomial_fit(x, y, 3) - actual_coefficients)), msg="Incorrect polynomial fit")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Weighted fit, where an outlier with zero weight should be ignored:
+        y_outlier = y.copy()
+        y_outlier[500] += 100
+        weights = np.ones_like(x)
+        weights[500] = 0
+        try:
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(polynomial_fit(x, y_outlier, 3, weights) - actual_coefficients)), msg="Incorrect weighted polynomial fit")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Fitting many series at once, with shared and separate x values:
+        rng = np.random.default_rng(0)
+        many_coefficients = rng.normal(size=(50, 4))
+        many_x = np.sort(rng.uniform(-1, 1, (50, 100)), axis=1)
+        for x_values in [x[:100], many_x]:
+            many_y = np.array([np.polyval(c, x_values if x_values.ndim == 1 else x_values[i]) for i, c in enumerate(many_coefficients)])
+            try:
+                self.assertGreaterEqual(acceptable_error, np.max(np.abs(polynomial_fit_batch(x_values, many_y, 3) - many_coefficients)), msg="Incorrect batched polynomial fit")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, polynomial_fit, x, y[:-1], 3)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when input vectors are of different size")
+        
+        try:
+            self.assertRaises(ValueError, polynomial_fit, x[:3], y[:3], 3)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when there are fewer data points than coefficients")
+        
+        try:
+            self.assertRaises(ValueError, polynomial_fit, x, y, 3, -weights)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when weights are negative")
+    
+    def test_chebyshev(self) -> None:
+        def f(x): return np.sin(5 * x) + np.exp(x / 3) * np.cos(x)
+        def df(x): return 5 * np.cos(5 * x) + np.exp(x / 3) * (np.cos(x) / 3 - np.sin(x))
+        def integral(x): return -np.cos(5 * x) / 5 + 0.3 * np.exp(x / 3) * (np.cos(x) + 3 * np.sin(x))
+        acceptable_error = 1e-10
+        x = np.linspace(-2, 7, 10001)
+        approximation = Chebyshev(f, -2, 7)
+        
+        # Testing method:
+        try:
+            self.assertTrue(approximation.converged, msg="Chebyshev approximation did not converge")
+            self.assertGreater(100, approximation.degree, msg=f"Chebyshev approximation degree too high: {approximation.degree}")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(approximation(x) - f(x))), msg="Incorrect Chebyshev approximation")
+            self.assertGreaterEqual(1e-8, np.max(np.abs(approximation.derivative()(x) - df(x))), msg="Incorrect Chebyshev approximation derivative")
+            self.assertAlmostEqual(integral(7) - integral(-2), approximation.integrate(), delta=acceptable_error, msg="Incorrect Clenshaw-Curtis integral")
+            self.assertAlmostEqual(integral(3) - integral(0), approximation.integrate(0, 3), delta=acceptable_error, msg="Incorrect Chebyshev approximation integral")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Every root in the interval should be found:
+        roots = approximation.roots()
+        sign_changes = np.count_nonzero(np.diff(np.sign(f(x))))
+        try:
+            self.assertEqual(sign_changes, len(roots), msg=f"Incorrect number of Chebyshev approximation roots: {roots}")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(f(roots))), msg="Incorrect Chebyshev approximation roots")
+            self.assertGreaterEqual(1e-12, np.max(np.abs(Chebyshev(lambda x: (x - 0.5) * (x - 0.2) * (x + 0.7), -1, 1, degree=3).roots() - [-0.7, 0.2, 0.5])),
+                                    msg="Incorrect roots of a fixed degree Chebyshev approximation")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # A function that is not smooth should stop at the maximum degree:
+        try:
+            self.assertFalse(Chebyshev(np.abs, -1, 1, max_degree=64).converged, msg="Chebyshev approximation of |x| claims to have converged")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, Chebyshev, f, 7, -2)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when lower bound is greater than upper bound")
+        
+        try:
+            self.assertRaises(ValueError, Chebyshev, f, -2, 7, -1)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when degree is negative")
+    
+    def test_chunked_least_squares(self) -> None:
+        basis = [np.sin, np.cos, lambda x: 1]
+        acceptable_error = 1e-10
+        rng = np.random.default_rng(0)
+        x = rng.uniform(-3, 3, 10001)
+        y = 2 * np.sin(x) - np.cos(x) + 0.5 + rng.normal(0, 0.1, x.size)
+        weights = rng.uniform(0, 1, x.size)
+        expected = linear_least_squares(x, y, basis, weights)
+        
+        # Reading the data from a .npy file and a raw binary file, in chunks that do not divide the data evenly:
+        with tempfile.TemporaryDirectory() as directory:
+            np.save(os.path.join(directory, "x.npy"), x)
+            y.astype(np.float32).tofile(os.path.join(directory, "y.bin"))
+            weights.astype(np.float32).tofile(os.path.join(directory, "weights.bin"))
+            result = chunked_least_squares(os.path.join(directory, "x.npy"), os.path.join(directory, "y.bin"), basis,
+                                           os.path.join(directory, "weights.bin"), chunk_size=999, dtype=np.float32)
+        expected_float32 = linear_least_squares(x, y.astype(np.float32), basis, weights.astype(np.float32))
+        try:
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(chunked_least_squares(x, y, basis, weights, chunk_size=1000) - expected)), msg="Incorrect chunked least squares fit")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(result - expected_float32)), msg="Incorrect chunked least squares fit from files")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, chunked_least_squares, x, y[:-1], basis)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when input vectors are of different size")
+        
+        try:
+            self.assertRaises(ValueError, chunked_least_squares, x, y, basis, -weights)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when weights are negative")
+        
+        try:
+            self.assertRaises(ValueError, chunked_least_squares, x, y, basis, chunk_size=0)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the chunk size is zero")
+    
+    def test_cubic_spline(self) -> None:
+        def f(x): return x**3 - 2 * x + 1
+        acceptable_error = 1e-9
+        x = np.sort(np.random.default_rng(0).uniform(-2, 3, 12))
+        x_test = np.linspace(-3, 4, 1001)
+        
+        # Clamped and not-a-knot splines should reproduce a cubic exactly (including outside the knots):
+        for spline in [CubicSpline(x, f(x), "clamped", (3 * x[0]**2 - 2, 3 * x[-1]**2 - 2)), CubicSpline(x, f(x), "not-a-knot")]:
+            try:
+                self.assertGreaterEqual(acceptable_error, np.max(np.abs(spline(x_test) - f(x_test))), msg="Incorrect cubic spline values")
+                self.assertGreaterEqual(acceptable_error, np.max(np.abs(spline.derivative()(x_test) - (3 * x_test**2 - 2))), msg="Incorrect cubic spline derivative")
+                self.assertAlmostEqual(16.25, spline.integrate(-2, 3), delta=acceptable_error, msg="Incorrect cubic spline integral")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # A natural spline has no curvature at its ends, and should still interpolate the points:
+        x = np.linspace(0, 10, 41)
+        spline = CubicSpline(x, np.sin(x))
+        try:
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(spline(x) - np.sin(x))), msg="Natural cubic spline does not interpolate the points")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(spline.derivative(2)(x[[0, -1]]))), msg="Natural cubic spline has curvature at its ends")
+            self.assertGreaterEqual(1e-3, np.max(np.abs(spline.roots() - np.pi * np.arange(4))), msg=f"Incorrect cubic spline roots: {spline.roots()}")
+            self.assertGreaterEqual(1e-3, abs(spline.integrate(0, np.pi) - 2), msg="Incorrect natural cubic spline integral")
+            self.assertTrue(np.allclose(spline.integrate([0, 1], [np.pi, 2]), [spline.integrate(0, np.pi), spline.integrate(1, 2)]), msg="Incorrect vectorised cubic spline integral")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Roots on the first and last knots are found too:
+        x = np.linspace(0, 2 * np.pi, 9)
+        try:
+            self.assertTrue(np.array_equal([0, 2], CubicSpline([0, 1, 2], [0, 1, 0]).roots()), msg=f"Incorrect cubic spline roots on the end knots: {CubicSpline([0, 1, 2], [0, 1, 0]).roots()}")
+            self.assertGreaterEqual(1e-12, np.max(np.abs(CubicSpline(x, np.sin(x)).roots() - np.pi * np.arange(3))), msg=f"Incorrect cubic spline roots: {CubicSpline(x, np.sin(x)).roots()}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, CubicSpline, x, np.sin(x)[:-1])
+        except AssertionError:
+            self.errorList.append("ValueError not raised when input vectors are of different size")
+        
+        try:
+            self.assertRaises(ValueError, CubicSpline, x[::-1], np.sin(x))
+        except AssertionError:
+            self.errorList.append("ValueError not raised when x values are not increasing")
+        
+        try:
+            self.assertRaises(ValueError, CubicSpline, x, np.sin(x), "clamped")
+        except AssertionError:
+            self.errorList.append("ValueError not raised when a clamped spline has no end derivatives")
+        
+        try:
+            self.assertRaises(ValueError, CubicSpline, x[:3], x[:3], "not-a-knot")
+        except AssertionError:
+            self.errorList.append("ValueError not raised when there are too few points for a not-a-knot spline")
+    
+    def test_levenberg_marquardt(self) -> None:
+        def model(x, p): return p[0] * np.exp(-p[1] * x) + p[2]
+        def jacobian(x, p): return [np.exp(-p[1] * x), -p[0] * x * np.exp(-p[1] * x), 1]
+        actual_parameters = np.array([3.0, 1.3, 0.5])
+        acceptable_error = 1e-6
+        x = np.linspace(0, 5, 200)
+        y = model(x, actual_parameters)
+        
+        # Testing every way of finding the Jacobian, with and without Broyden updates:
+        for method in [jacobian, "finite", "dual"]:
+            for broyden in [True, False]:
+                result = levenberg_marquardt(model, x, y, [1, 1, 0], method, broyden=broyden)
+                try:
+                    self.assertTrue(result.converged, msg="Levenberg-Marquardt method did not converge")
+                    self.assertGreaterEqual(acceptable_error, np.max(np.abs(result.parameters - actual_parameters)), msg=f"Incorrect Levenberg-Marquardt fit: {result.parameters}")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        
+        # Broyden updates should mean the full Jacobian is computed less often:
+        try:
+            self.assertLess(levenberg_marquardt(model, x, y, [1, 1, 0]).jacobian_evaluations, levenberg_marquardt(model, x, y, [1, 1, 0], broyden=False).jacobian_evaluations,
+                            msg="Broyden updates did not reduce the number of Jacobian evaluations")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # The callback should be called once per iteration, with the current parameters:
+        trace = []
+        result = levenberg_marquardt(model, x, y, [1, 1, 0], callback=lambda *values: trace.append(values))
+        try:
+            self.assertEqual(list(range(1, result.iterations + 1)), [values[0] for values in trace], msg="Levenberg-Marquardt callback not called once per iteration")
+            self.assertTrue(np.array_equal(result.parameters, trace[-1][1]) and result.cost == trace[-1][2], msg="Levenberg-Marquardt callback given incorrect parameters")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Keeping the parameters inside bounds:
+        result = levenberg_marquardt(model, x, y, [1, 1, 0], bounds=([0, 0, 0.6], [10, 10, 10]))
+        try:
+            self.assertTrue(result.converged, msg="Levenberg-Marquardt method with bounds did not converge")
+            self.assertEqual(0.6, result.parameters[2], msg=f"Levenberg-Marquardt method did not stop at the bound: {result.parameters}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Fitting many Gaussian peaks at once:
+        def gaussian(x, p): return p[0] * np.exp(-0.5 * ((x - p[1]) / p[2])**2)
+        rng = np.random.default_rng(0)
+        many_parameters = np.column_stack([rng.uniform(1, 3, 100), rng.uniform(-1, 1, 100), rng.uniform(0.5, 1.5, 100)])
+        x = np.linspace(-5, 5, 100)
+        many_y = gaussian(x, many_parameters.T[:, :, None])
+        result = levenberg_marquardt_batch(gaussian, x, many_y, [1.5, 0, 1], "dual")
+        try:
+            self.assertTrue(result.converged.all(), msg="Batched Levenberg-Marquardt method did not converge")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(result.parameters - many_parameters)), msg="Incorrect batched Levenberg-Marquardt fit")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Finite difference Jacobians should only be recomputed for the series that need them:
+        sizes = []
+        def counted_gaussian(x, p):
+            sizes.append(len(p[0]))
+            return gaussian(x, p)
+        result = levenberg_marquardt_batch(counted_gaussian, x, many_y, [1.5, 0, 1], broyden=False)
+        try:
+            self.assertTrue(result.converged.all(), msg="Batched Levenberg-Marquardt method with finite differences did not converge")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(result.parameters - many_parameters)), msg="Incorrect batched Levenberg-Marquardt fit with finite differences")
+            self.assertLess(min(sizes), len(many_y), msg="Jacobian recomputed for every series")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # The dual numbers should be the same ones the package exports:
+        try:
+            self.assertIs(numerical_methods.roots.DualArray, lm_module._dual_array(), msg="Levenberg-Marquardt method uses a second copy of DualArray")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, levenberg_marquardt, model, x, y[:-1], [1, 1, 0])
+        except AssertionError:
+            self.errorList.append("ValueError not raised when input vectors are of different size")
+        
+        try:
+            self.assertRaises(ValueError, levenberg_marquardt, model, x, y, [1, 1, 0], "secant")
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the Jacobian method is not recognised")
+    
+    def test_linear_least_squares(self) -> None:
+        # Fitting y = 2 sin(x) - 3 cos(x) + 0.5:
+        actual_coefficients = np.array([2, -3, 0.5])
+        acceptable_error = 1e-8
+        x = np.linspace(0, 10, 500)
+        y = 2 * np.sin(x) - 3 * np.cos(x) + 0.5
+        
+        try:
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(linear_least_squares(x, y, [np.sin, np.cos, lambda x: 1]) - actual_coefficients)), msg="Incorrect linear least squares fit")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Linearly dependent basis functions:
+        try:
+            self.assertRaises(ValueError, linear_least_squares, x, y, [np.sin, lambda x: 2 * np.sin(x)])
+        except AssertionError:
+            self.errorList.append("ValueError not raised when basis functions are linearly dependent")
+    
+    def test_recursive_least_squares(self) -> None:
+        basis = [lambda x: x**2, lambda x: x, lambda x: 1]
+        acceptable_error = 1e-6
+        rng = np.random.default_rng(0)
+        x = rng.uniform(-2, 2, 500)
+        y = 0.5 * x**2 - x + 2 + rng.normal(0, 0.1, 500)
+        
+        # One point at a time, and in mini-batches, should both match the batch least squares fit:
+        expected = linear_least_squares(x, y, basis)
+        single, batched = RecursiveLeastSquares(basis), RecursiveLeastSquares(basis)
+        for i in range(len(x)):
+            single.update(x[i], y[i])
+        for i in range(0, len(x), 64):
+            batched.update(x[i:i + 64], y[i:i + 64])
+        try:
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(single.coefficients - expected)), msg="Incorrect recursive least squares fit")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(batched.coefficients - expected)), msg="Incorrect mini-batch recursive least squares fit")
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(batched.predict(x) - np.column_stack([x**2, x, np.ones_like(x)]) @ expected)), msg="Incorrect recursive least squares prediction")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # A forgetting factor should follow coefficients that change:
+        fit = RecursiveLeastSquares(basis, forgetting=0.95)
+        fit.update(x, y)
+        fit.update(x[:400], 3 * x[:400] + 1)
+        try:
+            self.assertGreaterEqual(acceptable_error, np.max(np.abs(fit.coefficients - [0, 3, 1])), msg="Recursive least squares with forgetting did not follow the new model")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Restoring a snapshot should continue exactly where it left off:
+        state = single.snapshot()
+        single.update(x[:100], y[:100] + 5)
+        restored = RecursiveLeastSquares(basis)
+        restored.restore(state)
+        restored.update(x[:100], y[:100] + 5)
+        try:
+            self.assertGreaterEqual(1e-9, np.max(np.abs(restored.coefficients - single.coefficients)), msg="Restored recursive least squares state did not match")
+            self.assertEqual(600, restored.samples, msg="Restored recursive least squares sample count did not match")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, RecursiveLeastSquares, [])
+        except AssertionError:
+            self.errorList.append("ValueError not raised when there are no basis functions")
+        
+        try:
+            self.assertRaises(ValueError, RecursiveLeastSquares, basis, 0)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the forgetting factor is zero")
+        
+        try:
+            self.assertRaises(ValueError, RecursiveLeastSquares(basis).update, x, y[:-1])
+        except AssertionError:
+            self.errorList.append("ValueError not raised when input vectors are of different size")
+        
+        try:
+            self.assertRaises(ValueError, restored.restore, {"coefficients": [1, 2], "P": np.eye(2), "forgetting": 1, "samples": 0})
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the state does not match the basis")
 
 
 if __name__ == '__main__':
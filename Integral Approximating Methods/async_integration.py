@@ -0,0 +1,167 @@
+# Author: Satya Jhaveri
+#
+# Versions of the integral approximating methods for functions that are coroutines (defined with
+#  'async def'), such as functions that have to wait on a network request or another process to
+#  produce each value.
+#
+# Each of the composite rules evaluates the function at a fixed set of points that do not depend
+#  on each other, so rather than waiting for each evaluation to finish before starting the next,
+#  all of the evaluations are started together and awaited at once. A semaphore limits how many
+#  evaluations can be in progress at the same time, so the service providing the function values
+#  is not overwhelmed.
+#
+
+import asyncio
+from typing import Callable, List
+
+
+async def _evaluate(f: Callable, x: List[float], concurrency: int) -> List[float]:
+    # Evaluates f at every point concurrently, with at most 'concurrency' evaluations in progress at once:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def evaluate(point: float) -> float:
+        async with semaphore:
+            return await f(point)
+
+    return await asyncio.gather(*(evaluate(point) for point in x))
+
+
+async def async_rectangle(f: Callable, a: float, b: float, n: int, concurrency: int = 16) -> float:
+    """
+    Calculates the value of a definite integral of a coroutine function using the rectangle method.
+
+    Args:
+        f (Callable): A continuous coroutine function to integrate over
+        a (float): The lower integral interval
+        b (float): The upper integral interval
+        n (int): The number of rectangles to use in the approximation
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once. Defaults to 16.
+
+    Raises:
+        ValueError: If lower integral is higher than upper integral
+        ValueError: If the number of rectangles is less than 1
+        ValueError: If concurrency is less than 1
+
+    Returns:
+        float: The approximated value of the integral
+    """
+    # Checking Inputs:
+    if a > b:
+        raise ValueError("Lower integral interval must be lower than upper interval.")
+    if n < 1:
+        raise ValueError("The number of rectangles to use cannot be less than one")
+    if concurrency < 1:
+        raise ValueError("The concurrency cannot be less than one.")
+
+    # Actual method:
+    step = (b - a) / n
+    y = await _evaluate(f, [a + i * step for i in range(n)], concurrency)
+    return step * sum(y)
+
+
+async def async_trapezoidal(f: Callable, a: float, b: float, n: int, concurrency: int = 16) -> float:
+    """
+    Approximates the value of a definite integral of a coroutine function using the trapezoidal rule and a specified number of points.
+
+    Args:
+        f (Callable): A continuous coroutine function to integrate over
+        a (float): The lower integral interval
+        b (float): The upper integral interval
+        n (int): The number of points to use in the approximation
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once. Defaults to 16.
+
+    Raises:
+        ValueError: If lower integral is higher than upper integral
+        ValueError: If n is less than 2
+        ValueError: If concurrency is less than 1
+
+    Returns:
+        float: The approximated value of the integral
+    """
+    # Validating Inputs:
+    if n < 2:
+        raise ValueError("n must be greater than or equal to 2.")
+    if a > b:
+        raise ValueError("The lower bound of the integral cannot be more than the upper bound")
+    if concurrency < 1:
+        raise ValueError("The concurrency cannot be less than one.")
+
+    # Actual Method:
+    width = (b - a) / (n - 1)
+    y = await _evaluate(f, [a + i*width for i in range(n)], concurrency)
+    return (width / 2) * (y[0] + 2 * sum(y[1:-1]) + y[-1])
+
+
+async def async_simpsons_13(f: Callable, a: float, b: float, n: int, concurrency: int = 16) -> float:
+    """
+    Approximates the value of a definite integral of a coroutine function using the Simpson's 1/3 rule and a specified number of points.
+
+    Args:
+        f (Callable): A continuous coroutine function to integrate over
+        a (float): The lower integral interval
+        b (float): The upper integral interval
+        n (int): The number of points to use in the approximation
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once. Defaults to 16.
+
+    Raises:
+        ValueError: If lower integral is higher than upper integral
+        ValueError: If the n is even
+        ValueError: If n is less than three
+        ValueError: If concurrency is less than 1
+
+    Returns:
+        float: The approximated value of the integral
+    """
+    # Validating Inputs:
+    if n < 3:
+        raise ValueError("Cannot use less than 3 points.")
+    if n % 2 == 0:
+        raise ValueError("Cannot use an even number of points.")
+    if a > b:
+        raise ValueError("The lower bound of the integral cannot be more than the upper bound")
+    if concurrency < 1:
+        raise ValueError("The concurrency cannot be less than one.")
+
+    # Actual method:
+    width = (b - a) / (n - 1)
+    y = await _evaluate(f, [a + i*width for i in range(n)], concurrency)
+    return (width / 3) * (y[0] + 4 * sum(y[1:-1:2]) + 2 * sum(y[2:-1:2]) + y[-1])
+
+
+async def async_simpsons_38(f: Callable, a: float, b: float, n: int, concurrency: int = 16) -> float:
+    """
+    Approximates the value of a definite integral of a coroutine function using the Simpson's 3/8 rule and a specified number of points.
+
+    Args:
+        f (Callable): A continuous coroutine function to integrate over
+        a (float): The lower integral interval
+        b (float): The upper integral interval
+        n (int): The number of points to use in the approximation
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once. Defaults to 16.
+
+    Raises:
+        ValueError: If lower integral is higher than upper integral
+        ValueError: If the n is not congruent to four (mod 3)
+        ValueError: If n is less than four
+        ValueError: If concurrency is less than 1
+
+    Returns:
+        float: The approximated value of the integral
+    """
+    # Validating Inputs:
+    if n < 4:
+        raise ValueError("Cannot use less than 4 points.")
+    if (n - 1) % 3 != 0:
+        raise ValueError("Cannot use a value of n that is not congruent to 4 (mod 3).")
+    if a > b:
+        raise ValueError("The lower bound of the integral cannot be more than the upper bound")
+    if concurrency < 1:
+        raise ValueError("The concurrency cannot be less than one.")
+
+    # Actual Method:
+    width = (b - a) / (n - 1)
+    y = await _evaluate(f, [a + i*width for i in range(n)], concurrency)
+    sum1 = 3 * sum(y[1:-1:3])
+    sum2 = 3 * sum(y[2:-1:3])
+    sum3 = 2 * sum(y[3:-1:3])
+    return (3 * width / 8) * (y[0] + sum1 + sum2 + sum3 + y[-1])
@@ -0,0 +1,108 @@
+# Author: Satya Jhaveri
+#
+# A wrapper for an integrand that remembers the values it has already computed, so that an
+#  integral can be refined (for example Simpson's 1/3 rule with n = 101, then 201, then 401) while
+#  only evaluating the function at the new points.
+#
+# The composite rules place their points at a + i*(b - a)/(n - 1), and the same point reached from
+#  two different values of n is usually not exactly the same float (it can differ in the last
+#  bit), so the points cannot be remembered by their value directly. Instead, each point x is
+#  identified by the nearest dyadic fraction of the interval, that is, the integer k closest to
+#  (x - a) / (b - a) * 2^bits. With 40 bits, two points only share a key if they are less than
+#  about 1e-12 of the interval apart, which is far closer than any two points the methods use,
+#  while the tiny rounding errors in computing the same point always land in the same key (unless
+#  the point happens to lie almost exactly halfway between two dyadic fractions, which only costs
+#  an extra evaluation).
+#
+# The number of values remembered is bounded, and once it is reached the least recently used
+#  values are forgotten. NumPy arrays of points are also accepted, in which case only the points
+#  that are not remembered are passed to f (as one array).
+#
+
+from collections import OrderedDict
+from typing import Callable, Union
+
+import numpy as np
+
+
+class MemoizedIntegrand:
+    """
+    A function that remembers its values at the points of an interval, so that repeated and refined integrations over the
+     interval only evaluate f at new points.
+
+    Args:
+        f (Callable): The function to integrate
+        a (float): The lower integral interval
+        b (float): The upper integral interval
+        max_size (int, optional): The largest number of values to remember. Defaults to 1000000.
+        bits (int, optional): The number of binary digits of the fractions of the interval that identify a point. Defaults to 40.
+
+    Raises:
+        ValueError: If lower integral is higher than upper integral
+        ValueError: If max_size is less than 1
+        ValueError: If bits is not between 1 and 52
+    """
+
+    def __init__(self, f: Callable, a: float, b: float, max_size: int = 1_000_000, bits: int = 40) -> None:
+        # Validating inputs:
+        if a > b:
+            raise ValueError("The lower bound of the integral cannot be more than the upper bound")
+
+        if max_size < 1:
+            raise ValueError("The number of values to remember cannot be less than one.")
+
+        if not 1 <= bits <= 52:
+            raise ValueError("The number of bits must be between 1 and 52.")
+
+        self.f = f
+        self.a = a
+        self.b = b
+        self.max_size = max_size
+        self.scale = 2**bits / (b - a) if b > a else 0.0
+        self.values = OrderedDict()  # The remembered values, by the dyadic fraction of the interval at each point
+        self.hits = 0
+        self.evaluations = 0
+
+    def __call__(self, x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        if isinstance(x, np.ndarray):
+            return self._call_array(x)
+
+        key = round((x - self.a) * self.scale)
+        value = self.values.get(key)
+        if value is not None:
+            self.hits += 1
+            self.values.move_to_end(key)
+            return value
+
+        value = self.f(x)
+        self.evaluations += 1
+        self.values[key] = value
+        if len(self.values) > self.max_size:
+            self.values.popitem(last=False)
+        return value
+
+    def _call_array(self, x: np.ndarray) -> np.ndarray:
+        # Looks up every point, then evaluates f once on all the points that were not remembered:
+        keys = np.rint((x - self.a) * self.scale).astype(np.int64).ravel().tolist()
+        values = [self.values.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        self.hits += len(keys) - len(missing)
+
+        if len(missing) > 0:
+            new_values = np.asarray(self.f(x.ravel()[missing]))
+            self.evaluations += len(missing)
+            for i, value in zip(missing, new_values.tolist()):
+                values[i] = value
+                self.values[keys[i]] = value
+        for key in keys:
+            if key in self.values:
+                self.values.move_to_end(key)
+        while len(self.values) > self.max_size:
+            self.values.popitem(last=False)
+        return np.array(values).reshape(x.shape)
+
+    def clear(self) -> None:
+        """
+        Forgets every remembered value.
+        """
+        self.values.clear()
@@ -0,0 +1,179 @@
+# Author: Satya Jhaveri
+#
+# Versions of trapezoidal_vec and simpsons_13_vec for very large arrays of data (hundreds of
+#  millions of points), which split the sum over several processes, since a single process is
+#  limited by the memory bandwidth one core can use.
+#
+# The workers do not receive copies of x and y. Instead, each worker maps the same file into its
+#  own memory with np.memmap, and reads only its own slice. If x and y are already memory mapped
+#  files (np.memmap), those files are used directly, so nothing is copied at all; otherwise they
+#  are written once to temporary files (in /dev/shm where it exists, so they stay in memory),
+#  which are removed afterwards.
+#
+# The points are split into fixed size chunks of consecutive indices, each of which is summed by
+#  one worker. The trapezoid (or Simpson's rule term) for the point at index i needs the width
+#  x[i] - x[i-1], so each chunk also reads the last point of the previous chunk. Simpson's rule
+#  weights the points at odd indices by 4 and the points at even indices by 2, which is decided by
+#  each point's index in the whole array, so the chunks always start at an even index and pair the
+#  points exactly as simpsons_13_vec does. The partial sums are added in the order of the chunks
+#  (with math.fsum), so the result is the same every time, whatever the number of workers and
+#  whatever order they finish in.
+#
+# Unlike the methods they are based on, these methods do not sort the data (which would need a copy
+#  of it), so x must already be in increasing order.
+#
+
+import math
+import mmap
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+
+def _source(values: np.ndarray, files: List[str]) -> Tuple[str, str, int, int]:
+    # Finds (or creates) a file holding the values, as (filename, dtype, offset, length):
+    if isinstance(values, np.memmap) and isinstance(values.base, mmap.mmap) and values.ndim == 1 and values.flags.c_contiguous:
+        return values.filename, values.dtype.str, values.offset, len(values)
+
+    values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.NamedTemporaryFile(suffix=".npy", dir=directory, delete=False) as file:
+        files.append(file.name)
+        file.write(values.tobytes())
+    return file.name, values.dtype.str, 0, len(values)
+
+
+def _open(source: Union[np.ndarray, Tuple[str, str, int, int]]) -> np.ndarray:
+    if isinstance(source, np.ndarray):
+        return source
+    filename, dtype, offset, length = source
+    return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=(length,))
+
+
+def _partial_sum(rule: str, x_source, y_source, lower: int, upper: int) -> Tuple[float, bool]:
+    # Sums the terms for the points at indices lower to upper - 1, returning the sum and whether x was in increasing order:
+    x, y = _open(x_source), _open(y_source)
+    n = len(x)
+    start = max(lower, 1)
+    width = np.diff(np.asarray(x[start - 1:upper], dtype=np.float64))
+    values = np.asarray(y[start - 1:upper], dtype=np.float64)
+
+    if rule == "trapezoidal":
+        total = float(np.sum(width * (values[:-1] + values[1:]))) / 2
+    else:
+        weights = np.where(np.arange(start, upper) % 2 == 1, 4.0, 2.0)
+        if upper == n:
+            weights[-1] = 1.0
+        total = float(np.sum(weights * width * values[1:])) / 3
+        if lower == 0:
+            total += (float(x[1]) - float(x[0])) / 3 * float(y[0])
+    return total, bool(np.all(width >= 0))
+
+
+def _parallel_sum(rule: str, x, y, workers: Optional[int], chunk_size: int) -> float:
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    chunk_size += chunk_size % 2  # (So that every chunk starts at an even index)
+    n = len(x)
+    bounds = [(lower, min(lower + chunk_size, n)) for lower in range(0, n, chunk_size)]
+
+    files = []
+    try:
+        if workers == 0:
+            x_source, y_source = np.asarray(x), np.asarray(y)
+            partial_sums = [_partial_sum(rule, x_source, y_source, lower, upper) for lower, upper in bounds]
+        else:
+            x_source, y_source = _source(x, files), _source(y, files)
+            with ProcessPoolExecutor(min(workers, len(bounds))) as pool:
+                partial_sums = list(pool.map(_partial_sum, [rule] * len(bounds), [x_source] * len(bounds), [y_source] * len(bounds),
+                                             *zip(*bounds)))
+    finally:
+        for file in files:
+            os.remove(file)
+
+    if not all(increasing for _, increasing in partial_sums):
+        raise ValueError("The independent variable values must be in increasing order.")
+    return math.fsum(total for total, _ in partial_sums)
+
+
+def parallel_trapezoidal_vec(x: Union[List[float], np.ndarray], y: Union[List[float], np.ndarray], workers: Optional[int] = None,
+                             chunk_size: int = 2**20) -> float:
+    """
+    Approximates the value of an integral using the trapezoidal method on discrete data, summed by several processes.
+
+    Args:
+        x (Union[List[float], np.ndarray]): The independent variable values, in increasing order
+        y (Union[List[float], np.ndarray]): The dependent variable values
+        workers (Optional[int], optional): The number of worker processes, where 0 sums in this process. Defaults to None
+            (the number of CPUs).
+        chunk_size (int, optional): The number of points each worker sums at a time. Defaults to 2^20.
+
+    Raises:
+        ValueError: If there is a different number of independent variable values than dependent variable values
+        ValueError: If there is only one point
+        ValueError: If the number of workers is negative, or chunk_size is less than 2
+        ValueError: If the independent variable values are not in increasing order
+
+    Returns:
+        float: The approximated value of the integral
+    """
+    # Validating inputs:
+    if len(x) != len(y):
+        raise ValueError("The number of points in each vector must be equal.")
+
+    if len(x) < 2:
+        raise ValueError("Cannot integrate on less than two data points.")
+
+    if workers is not None and workers < 0:
+        raise ValueError("The number of workers cannot be negative.")
+
+    if chunk_size < 2:
+        raise ValueError("The chunk size cannot be less than two.")
+
+    # Actual method:
+    return _parallel_sum("trapezoidal", x, y, workers, chunk_size)
+
+
+def parallel_simpsons_13_vec(x: Union[List[float], np.ndarray], y: Union[List[float], np.ndarray], workers: Optional[int] = None,
+                             chunk_size: int = 2**20) -> float:
+    """
+    Approximates the value of an integral using the Simpson's 1/3 method on discrete data, summed by several processes.
+
+    Args:
+        x (Union[List[float], np.ndarray]): The independent variable values, in increasing order
+        y (Union[List[float], np.ndarray]): The dependent variable values
+        workers (Optional[int], optional): The number of worker processes, where 0 sums in this process. Defaults to None
+            (the number of CPUs).
+        chunk_size (int, optional): The number of points each worker sums at a time (rounded up to an even number).
+            Defaults to 2^20.
+
+    Raises:
+        ValueError: If there is a different number of independent variable values than dependent variable values
+        ValueError: If there is less than three data points
+        ValueError: If there is an even number of data points
+        ValueError: If the number of workers is negative, or chunk_size is less than 2
+        ValueError: If the independent variable values are not in increasing order
+
+    Returns:
+        float: The approximated value of the integral
+    """
+    # Validating inputs:
+    if len(x) != len(y):
+        raise ValueError("The number of points in each vector must be equal.")
+
+    if len(x) < 3:
+        raise ValueError("Cannot integrate on less than three data points.")
+
+    if len(x) % 2 == 0:
+        raise ValueError("Cannot integrate on an even number of points.")
+
+    if workers is not None and workers < 0:
+        raise ValueError("The number of workers cannot be negative.")
+
+    if chunk_size < 2:
+        raise ValueError("The chunk size cannot be less than two.")
+
+    # Actual method:
+    return _parallel_sum("simpsons_13", x, y, workers, chunk_size)
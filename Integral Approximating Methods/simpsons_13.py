@@ -50,8 +50,8 @@ def simpsons_13(f: Callable, a: float, b: float, n: int) -> float:
     width = (b - a) / (n - 1)
     x = [a + i*width for i in range(n)]  # linearly spaced vector of x values between a and b
     
-    odd_sum = 2* sum([f(i) for i in x[3:-3:2]])
-    even_sum = 4 * sum([f(i) for i in x[2:-2:2]])
+    odd_sum = 4 * sum([f(i) for i in x[1:-1:2]])
+    even_sum = 2 * sum([f(i) for i in x[2:-1:2]])
     integral = (width / 3) * (f(a) + odd_sum + even_sum + f(b))
     return integral
 
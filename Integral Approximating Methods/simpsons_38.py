@@ -48,9 +48,9 @@ def simpsons_38(f: Callable, a: float, b: float, n: int) -> float:
     x = [a + i*width for i in range(n)]  # linearly spaced vector of x values between a and b
     
     # Evaluating the sums:
-    sum1 = 3 * sum([f(i) for i in x[1:-3:3]])
-    sum2 = 3 * sum([f(i) for i in x[2:-2:3]])
-    sum3 = 2 * sum([f(i) for i in x[3:-4:3]])
+    sum1 = 3 * sum([f(i) for i in x[1:-1:3]])
+    sum2 = 3 * sum([f(i) for i in x[2:-1:3]])
+    sum3 = 2 * sum([f(i) for i in x[3:-1:3]])
     
     # Summing the overall integral:
     integral = (3 * width / 8) * (f(a) + sum1 + sum2 + sum3 + f(b))
@@ -2,9 +2,18 @@
 # Author: Satya Jhaveri
 
 import unittest
+import asyncio
+import math
+import os
+import tempfile
+import numpy as np
+from async_integration import async_rectangle, async_trapezoidal, async_simpsons_13, async_simpsons_38
+from memoized_integrand import MemoizedIntegrand
+from parallel_integration import parallel_trapezoidal_vec, parallel_simpsons_13_vec
 from rectangle_method import rectangle, rectangle_vec
 from simpsons_13 import simpsons_13, simpsons_13_vec
 from simpsons_38 import simpsons_38, simpsons_38_vec
+from tanh_sinh import tanh_sinh
 from trapezoidal_method import trapezoidal, trapezoidal_vec
 
 
@@ -247,6 +256,169 @@ class TestIntegralApprox(unittest.TestCase):
         except AssertionError:
             self.errorList.append("Simpson's 3/8 method with vector input did not raise ValueError when input vectors are different sizes")
     
+    def test_async_methods(self) -> None:
+        in_progress, most_in_progress = [0], [0]
+        def f(x): return x**3 + x*x
+        async def async_f(x):
+            in_progress[0] += 1
+            most_in_progress[0] = max(most_in_progress[0], in_progress[0])
+            await asyncio.sleep(0)
+            in_progress[0] -= 1
+            return f(x)
+        a, b = 0, 4
+        concurrency = 8
+        actual_value = 4**4 / 4 + 4**3 / 3
+        
+        # Simpson's rules are exact for cubics, and every method should agree with its synchronous version:
+        for name, method, async_method, n, acceptable_error in [("Rectangle", rectangle, async_rectangle, 100, 2), ("Trapezoidal", trapezoidal, async_trapezoidal, 101, 0.01),
+                                                                 ("Simpson's 1/3", simpsons_13, async_simpsons_13, 7, 1e-10), ("Simpson's 3/8", simpsons_38, async_simpsons_38, 7, 1e-10)]:
+            most_in_progress[0] = 0
+            value = asyncio.run(async_method(async_f, a, b, n, concurrency))
+            try:
+                self.assertGreaterEqual(acceptable_error, abs(actual_value - value), msg=f"Incorrect asynchronous {name} method")
+                self.assertGreaterEqual(1e-10, abs(method(f, a, b, n) - value), msg=f"Asynchronous {name} method does not agree with the synchronous version")
+                self.assertTrue(1 < most_in_progress[0] <= concurrency, msg=f"Asynchronous {name} method did not evaluate concurrently within the limit")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            # testing invalid integral bounds:
+            try:
+                self.assertRaises(ValueError, asyncio.run, async_method(async_f, b, a, n))
+            except AssertionError:
+                self.errorList.append(f"ValueError not raised in asynchronous {name} method when lower integral bound > upper integral bound")
+    
+    def test_memoized_integrand(self) -> None:
+        calls = [0]
+        def f(x):
+            calls[0] += 1
+            return math.exp(-x*x)
+        a, b = -1.3, 2.9
+        
+        # Refining n should only evaluate f at the new points, and give the same values as without memoization:
+        memoized = MemoizedIntegrand(f, a, b)
+        for method, sizes in [(simpsons_13, [101, 201, 401]), (trapezoidal, [101, 201, 401])]:
+            for n in sizes:
+                try:
+                    self.assertEqual(method(lambda x: math.exp(-x*x), a, b, n), method(memoized, a, b, n), msg="Memoized integrand changed the integral")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        try:
+            self.assertEqual(401, calls[0], msg="Memoized integrand evaluated f at points it had already evaluated")
+            self.assertEqual(401, memoized.evaluations, msg="Incorrect memoized integrand evaluation count")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Arrays of points should only pass the new points to f:
+        vectorized = MemoizedIntegrand(np.sin, 0, 1)
+        x = np.linspace(0, 1, 11)
+        try:
+            self.assertTrue(np.array_equal(np.sin(x), vectorized(x)), msg="Incorrect memoized integrand values for an array")
+            self.assertTrue(np.allclose(np.sin(np.linspace(0, 1, 21)), vectorized(np.linspace(0, 1, 21)), rtol=1e-15, atol=0), msg="Incorrect memoized integrand values for an array")
+            self.assertEqual((21, 11), (vectorized.evaluations, vectorized.hits), msg="Memoized integrand evaluated an array at points it had already evaluated")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # The number of values remembered should be bounded:
+        small = MemoizedIntegrand(f, a, b, max_size=50)
+        simpsons_13(small, a, b, 101)
+        try:
+            self.assertEqual(50, len(small.values), msg="Memoized integrand remembered more values than its maximum")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values:
+        for args in [(b, a), (a, b, 0), (a, b, 10, 60)]:
+            try:
+                self.assertRaises(ValueError, MemoizedIntegrand, f, *args)
+            except AssertionError:
+                self.errorList.append(f"ValueError not raised for memoized integrand with arguments {args}")
+    
+    def test_parallel_methods(self) -> None:
+        rng = np.random.default_rng(3)
+        x = np.sort(rng.uniform(0, 3, 2001))
+        y = np.exp(-x) * np.cos(4 * x)
+        
+        for name, method, parallel_method in [("trapezoidal", trapezoidal_vec, parallel_trapezoidal_vec), ("Simpson's 1/3", simpsons_13_vec, parallel_simpsons_13_vec)]:
+            expected = method(list(x), list(y))
+            
+            # The same value as the method it is based on, and exactly the same value for any number of workers:
+            values = [parallel_method(x, y, workers, chunk_size) for workers in [0, 2] for chunk_size in [99, 100, 4000]]
+            try:
+                self.assertGreaterEqual(1e-12, abs(expected - values[0]), msg=f"Incorrect parallel {name} method")
+                self.assertEqual(values[:3], values[3:], msg=f"Parallel {name} method depends on the number of workers")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            # Using memory mapped files directly:
+            with tempfile.TemporaryDirectory() as directory:
+                mapped = []
+                for i, values in enumerate([x, y]):
+                    array = np.memmap(os.path.join(directory, f"{i}.dat"), dtype=np.float64, mode="w+", shape=values.shape)
+                    array[:] = values
+                    array.flush()
+                    mapped.append(np.memmap(array.filename, dtype=np.float64, mode="r", shape=values.shape))
+                    del array
+                try:
+                    self.assertGreaterEqual(1e-12, abs(expected - parallel_method(*mapped, workers=2, chunk_size=256)), msg=f"Incorrect parallel {name} method on memory mapped files")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+                del mapped
+            
+            # Passing invalid values:
+            for args in [(x[::-1], y), (x, y[:-2]), (x[:1], y[:1]), (x, y, -1), (x, y, 0, 1)]:
+                try:
+                    self.assertRaises(ValueError, parallel_method, *args)
+                except AssertionError:
+                    self.errorList.append(f"ValueError not raised in parallel {name} method with invalid arguments")
+        
+        try:
+            self.assertRaises(ValueError, parallel_simpsons_13_vec, x[:-1], y[:-1])
+        except AssertionError:
+            self.errorList.append("ValueError not raised in parallel Simpson's 1/3 method with an even number of points")
+    
+    def test_tanh_sinh(self) -> None:
+        calls = [0]
+        def counted(f):
+            def g(x):
+                calls[0] += 1
+                return f(x)
+            return g
+        
+        # Integrands with singularities at the ends, and infinite intervals, should reach double precision in a few hundred evaluations:
+        for name, f, a, b, actual_value in [("smooth", math.exp, 0, 1, math.e - 1), ("1/sqrt(x)", lambda x: 1 / math.sqrt(x), 0, 1, 2),
+                                            ("log(x)", math.log, 0, 1, -1), ("log(x)log(1-x)", lambda x: math.log(x) * math.log(1 - x), 0, 1, 2 - math.pi**2 / 6),
+                                            ("semi-infinite", lambda x: 1 / (1 + x*x), 0, math.inf, math.pi / 2),
+                                            ("negative semi-infinite", math.exp, -math.inf, 0, 1),
+                                            ("infinite", lambda x: math.exp(-x*x), -math.inf, math.inf, math.sqrt(math.pi))]:
+            calls[0] = 0
+            value = tanh_sinh(counted(f), a, b)
+            try:
+                self.assertGreaterEqual(1e-14, abs(actual_value - value), msg=f"Incorrect tanh-sinh quadrature of {name} integrand")
+                self.assertGreaterEqual(400, calls[0], msg=f"Tanh-sinh quadrature of {name} integrand used too many evaluations")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # Integrands concentrated near one end, which are zero at some of the first points (so they should not cut off that end):
+        for name, f, actual_value, acceptable_error in [("sharp peak", lambda x: math.exp(-1e4 * x), 1e-4, 1e-18),
+                                                        ("zero past x = 0.01", lambda x: max(0.0, 0.01 - x), 5e-5, 1e-12),
+                                                        ("zero before x = 0.99", lambda x: max(0.0, x - 0.99), 5e-5, 1e-12)]:
+            try:
+                self.assertGreaterEqual(acceptable_error, abs(actual_value - tanh_sinh(f, 0, 1)), msg=f"Incorrect tanh-sinh quadrature of {name} integrand")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        try:
+            self.assertEqual(0, tanh_sinh(math.exp, 1, 1), msg="Incorrect tanh-sinh quadrature over an empty interval")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values:
+        for args in [(1, 0), (0, 1, 0), (0, 1, 1e-10, -1)]:
+            try:
+                self.assertRaises(ValueError, tanh_sinh, math.exp, *args)
+            except AssertionError:
+                self.errorList.append(f"ValueError not raised in tanh-sinh quadrature with arguments {args}")
+    
     
 if __name__ == '__main__':
     suite = unittest.TestLoader().loadTestsFromTestCase(TestIntegralApprox)
@@ -38,7 +38,7 @@ def trapezoidal(f: Callable, a: float, b: float, n: int) -> float:
     width = (b - a) / (n - 1)  # This is the width of each trapezoidal segment
     x = [a + i*width for i in range(n)]  # A vector of n linearly spaced x values between a and b
     
-    return (width / 2) * (f(a) + 2 * sum([f(point) for point in x[2:-2]]) + f(x[-1]))
+    return (width / 2) * (f(a) + 2 * sum([f(point) for point in x[1:-1]]) + f(x[-1]))
     
 
 def trapezoidal_vec(x: List[float], y: List[float]) -> float:
@@ -13,9 +13,9 @@
 #  algebraic equations.
 #
 #
-from typing import Callable, Tuple, List
+from typing import Callable, Optional, Tuple, List
 from math import floor
-def forward_euler(df: Callable, initial_x: float, final_x: float, initial_y: float, step: float) -> Tuple[List[float]]:
+def forward_euler(df: Callable, initial_x: float, final_x: float, initial_y: float, step: float, callback: Optional[Callable] = None) -> Tuple[List[float]]:
     """
     Approximates the solution to an ordinary differential equation using Euler's method on the derivative of the original function
 
@@ -25,6 +25,7 @@ def forward_euler(df: Callable, initial_x: float, final_x: float, initial_y: flo
         final_x (float):            The value of x at the final point
         initial_y (float):          The value of y at the initial point
         step(float):                The step size to use when approximating each solution point
+        callback(Optional[Callable]): A function called after each step with the step number, x and the approximated y. Defaults to None.
 
     Raises:
         ValueError:                 If the final x value is less than the initial x value
@@ -56,6 +57,8 @@ def forward_euler(df: Callable, initial_x: float, final_x: float, initial_y: flo
     for i in range(n - 1):
         h = x[i + 1] - x[i]
         y[i + 1] = y[i] + df(x[i], y[i]) * h
+        if callback is not None:
+            callback(i + 1, x[i + 1], y[i + 1])
     
     return x, y
 
@@ -10,10 +10,10 @@
 #
 # Corrector Step: y_(i+1) = y_i + 0.5 * h * (f(t_i, y_i) + f(t_(i+1), y_g))
 #
-from typing import Callable, Tuple, List
+from typing import Callable, Optional, Tuple, List
 from math import floor
 
-def heun(df: Callable, initial_x: float, final_x: float, initial_y: float, step: float) -> Tuple[List[float]]:
+def heun(df: Callable, initial_x: float, final_x: float, initial_y: float, step: float, callback: Optional[Callable] = None) -> Tuple[List[float]]:
     """
     Approximates the solution to an ordinary differential equation using Heun's method on the derivative of the original function
 
@@ -23,6 +23,7 @@ def heun(df: Callable, initial_x: float, final_x: float, initial_y: float, step:
         final_x (float):            The value of x at the final point
         initial_y (float):          The value of y at the initial point
         step(float):                The step size to use when approximating each solution point
+        callback(Optional[Callable]): A function called after each step with the step number, x and the approximated y. Defaults to None.
 
     Raises:
         ValueError:                 If the final x value is less than the initial x value
@@ -56,6 +57,8 @@ def heun(df: Callable, initial_x: float, final_x: float, initial_y: float, step:
         yg = y[i] + h * df(x[i], y[i])
         avg_grad = 0.5 * (df(x[i],y[i]) + df(x[i + 1], yg))
         y[i + 1] = y[i] + h * avg_grad
+        if callback is not None:
+            callback(i + 1, x[i + 1], y[i + 1])
     
     return x, y
 
@@ -11,10 +11,10 @@
 # Corrector Step: y_(i+1) = y_i + h * (f(t_(i + 0.5), y_(i + 0.5)))
 #
 #
-from typing import Callable, Tuple, List
+from typing import Callable, Optional, Tuple, List
 from math import floor
 
-def midpoint(df: Callable, initial_x: float, final_x: float, initial_y: float, step: float) -> Tuple[List[float]]:
+def midpoint(df: Callable, initial_x: float, final_x: float, initial_y: float, step: float, callback: Optional[Callable] = None) -> Tuple[List[float]]:
     """
     Approximates the solution to an ordinary differential equation using the midpoint method on the derivative of the original function
 
@@ -24,6 +24,7 @@ def midpoint(df: Callable, initial_x: float, final_x: float, initial_y: float, s
         final_x (float):            The value of x at the final point
         initial_y (float):          The value of y at the initial point
         step(float):                The step size to use when approximating each solution point
+        callback(Optional[Callable]): A function called after each step with the step number, x and the approximated y. Defaults to None.
 
     Raises:
         ValueError:                 If the final x value is less than the initial x value
@@ -57,6 +58,8 @@ def midpoint(df: Callable, initial_x: float, final_x: float, initial_y: float, s
         yh = y[i] + (h / 2) * df(x[i], y[i])
         xh = x[i] + h / 2
         y[i + 1] = y[i] + h * df(xh, yh)
+        if callback is not None:
+            callback(i + 1, x[i + 1], y[i + 1])
     
     return x, y
 
@@ -19,6 +19,19 @@ class TestODE(unittest.TestCase):
             print(e)
         print(f"Number of errors: {len(self.errorList)}")
         
+    def testCallbacks(self) -> None:
+        def f(x,y):
+            return y
+        
+        # The callback should be called after every step, with the values being returned:
+        for name, method in [("forward Euler", forward_euler), ("Heun", heun), ("midpoint", midpoint)]:
+            trace = []
+            x, y = method(f, 0, 1, 1, 0.01, callback=lambda *values: trace.append(values))
+            try:
+                self.assertEqual([(i, x[i], y[i]) for i in range(1, len(x))], trace, msg=f"{name} method callback not called correctly")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+    
     def testEuler(self) -> None:
         def f(x,y):
             return y
@@ -0,0 +1,298 @@
+# Author: Satya Jhaveri
+#
+# Versions of the root finding methods for functions that are coroutines (defined with
+#  'async def'), such as functions that have to wait on a network request or another process to
+#  produce each value.
+#
+# Most iterations of a root finding method depend on the result of the previous one, but some
+#  evaluations are independent of each other and can be in progress at the same time:
+#  - The function values at both ends of the starting interval (or the starting secant pair).
+#  - The points inside the interval on each iteration of the bisection method. Rather than halving
+#    the interval, the interval can be split into (points + 1) pieces at once by evaluating several
+#    points together, which takes fewer rounds of waiting to reach the same precision.
+#  - Every point of the grid used to scan an interval for brackets, and the refinement of each of
+#    those brackets.
+# A semaphore limits how many evaluations can be in progress at the same time, so the service
+#  providing the function values is not overwhelmed.
+#
+
+import asyncio
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
+
+from root_result import RootResult
+
+
+def _limit(f: Callable, concurrency: int) -> Callable:
+    # Wraps f so that at most 'concurrency' evaluations are in progress at once:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(x: float) -> float:
+        async with semaphore:
+            return await f(x)
+
+    return limited
+
+
+async def _bisect(evaluate: Callable, lower: float, upper: float, f_lower: float, f_upper: float, precision: float, points: int,
+                  xtol: float, max_iter: int, max_evals: Optional[int]) -> RootResult:
+    # The bisection method, splitting the interval into (points + 1) pieces on each iteration:
+    start = perf_counter()
+    evaluations = 0
+    iterations = 0
+    message = ""
+    best, f_best = (lower, f_lower) if abs(f_lower) <= abs(f_upper) else (upper, f_upper)
+
+    while abs(f_best) > precision and upper - lower > xtol:
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+
+        if max_evals is not None and evaluations + points > max_evals:
+            message = "The evaluation budget was used up."
+            break
+
+        width = (upper - lower) / (points + 1)
+        x = [lower + i * width for i in range(1, points + 1)]
+        if x[0] == lower or x[-1] == upper:
+            message = "The interval cannot be split any further."
+            break
+
+        y = await asyncio.gather(*(evaluate(point) for point in x))
+        evaluations += points
+        iterations += 1
+
+        # Choosing the piece of the interval that contains the root:
+        x, y = [lower] + x + [upper], [f_lower] + list(y) + [f_upper]
+        i = next(j for j in range(1, len(x)) if y[j - 1] * y[j] <= 0)
+        lower, upper, f_lower, f_upper = x[i - 1], x[i], y[i - 1], y[i]
+        best, f_best = (lower, f_lower) if abs(f_lower) <= abs(f_upper) else (upper, f_upper)
+
+    return RootResult(best, iterations, evaluations, not message, perf_counter() - start, message)
+
+
+async def async_bisection(f: Callable, lower: float, upper: float, precision: float, points: int = 1, concurrency: int = 16,
+                          xtol: float = 0.0, max_iter: int = 1000, max_evals: Optional[int] = None) -> RootResult:
+    """
+    Approximates the root to a coroutine function using the bisection method.
+
+    Args:
+        f (Callable): A continuous coroutine function to approximate a root of
+        lower (float): The lower bound of the interval which contains the root
+        upper (float): The upper bound of the interval which contains the root
+        precision (float): The maximum amount of error that is acceptable in method results
+        points (int, optional): The number of points to evaluate concurrently on each iteration, splitting the interval
+            into (points + 1) pieces. Defaults to 1 (the plain bisection method).
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once. Defaults to 16.
+        xtol (float, optional): The width of interval that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+
+    Returns:
+        RootResult: Value which, when passed to f, returns a number of magnitude < precision, along with
+            the number of iterations and function evaluations used.
+
+    Raises:
+        ValueError: If precision is not greater than 0, if f(lower) and f(upper) are of the same sign, if lower == upper,
+            if points or concurrency are less than 1, if xtol is negative, or if either budget is less than 1.
+    """
+    # Validating inputs:
+    if lower >= upper:
+        raise ValueError("Lower cannot be greater than or equal to upper.")
+
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if points < 1 or concurrency < 1:
+        raise ValueError("The number of points and the concurrency cannot be less than one.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+
+    start = perf_counter()
+    evaluate = _limit(f, concurrency)
+    if max_evals == 1:  # (The evaluation budget is checked before every evaluation of f)
+        f_lower = f_upper = await evaluate(lower)
+        evaluations = 1
+    else:
+        f_lower, f_upper = await asyncio.gather(evaluate(lower), evaluate(upper))
+        evaluations = 2
+        if f_lower * f_upper > 0:
+            raise ValueError("f(lower) and f(upper) must have different signs.")
+
+    # Actual method:
+    result = await _bisect(evaluate, lower, upper, f_lower, f_upper, precision, points, xtol, max_iter,
+                           None if max_evals is None else max_evals - evaluations)
+    return RootResult(result.root, result.iterations, result.evaluations + evaluations, result.converged, perf_counter() - start,
+                      result.message)
+
+
+async def async_secant(f: Callable, x1: float, x2: float, precision: float, concurrency: int = 16, xtol: float = 0.0,
+                       max_iter: int = 1000, max_evals: Optional[int] = None) -> RootResult:
+    """
+    Approximates the root to a coroutine function using the secant method.
+
+    Args:
+        f (Callable): A continuous coroutine function to approximate a root of
+        x1 (float): The lower bound of the interval which contains the root
+        x2 (float): The upper bound of the interval which contains the root
+        precision (float): The maximum amount of error that is acceptable in method results
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once. Defaults to 16.
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+
+    Returns:
+        RootResult: Value which, when passed to f, returns a number of magnitude < precision, along with
+            the number of iterations and function evaluations used.
+
+    Raises:
+        ValueError: If x1 and x2 are equal, if f(x1) and f(x2) have different signs, if Precision is not greater than zero,
+            if concurrency is less than 1, if xtol is negative, or if either budget is less than 1.
+    """
+    # Validating Inputs:
+    if x1 == x2:
+        raise ValueError("x1 and x2 cannot be the same value.")
+
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if concurrency < 1:
+        raise ValueError("The concurrency cannot be less than one.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+
+    start = perf_counter()
+    evaluate = _limit(f, concurrency)
+    if max_evals == 1:  # (The evaluation budget is checked before every evaluation of f)
+        f1 = await evaluate(x1)
+        x2, f2 = x1, f1
+        evaluations = 1
+    else:
+        f1, f2 = await asyncio.gather(evaluate(x1), evaluate(x2))  # The starting pair is evaluated together
+        evaluations = 2
+        if f1 * f2 >= 0:
+            raise ValueError("x1 and x2 must have different signs.")
+
+    # Actual Method:
+    iterations = 0
+    converged = abs(f2) <= precision
+    message = ""
+
+    while not converged:
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+
+        if max_evals is not None and evaluations >= max_evals:
+            message = "The evaluation budget was used up."
+            break
+
+        if f2 == f1:
+            message = "The secant is flat, so it has no root."
+            break
+
+        x_next = (x1 * f2 - x2 * f1) / (f2 - f1)
+        f_next = await evaluate(x_next)
+        evaluations += 1
+        iterations += 1
+
+        # Updating the series of x values:
+        step = x_next - x2
+        x1, f1 = x2, f2
+        x2, f2 = x_next, f_next
+
+        converged = abs(f2) <= precision or abs(step) <= xtol
+
+    return RootResult(x2, iterations, evaluations, converged, perf_counter() - start, message)
+
+
+async def async_find_brackets(f: Callable, lower: float, upper: float, n: int = 100, concurrency: int = 16) -> List[Tuple[float, float]]:
+    """
+    Finds the intervals that contain a root of a coroutine function, by evaluating it concurrently on a grid of points
+     and looking for sign changes.
+
+    Args:
+        f (Callable): A continuous coroutine function to find the roots of
+        lower (float): The lower bound of the interval to search
+        upper (float): The upper bound of the interval to search
+        n (int, optional): The number of subintervals in the grid. Defaults to 100.
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once. Defaults to 16.
+
+    Raises:
+        ValueError: If lower >= upper, or if n or concurrency are less than 1.
+
+    Returns:
+        List[Tuple[float, float]]: The intervals (a, b) where f(a) and f(b) have different signs, or where f(a) = 0
+    """
+    brackets, _ = await _scan(_limit(f, concurrency), lower, upper, n)
+    return [(a, b) for a, b, _, _ in brackets]
+
+
+async def _scan(evaluate: Callable, lower: float, upper: float, n: int) -> Tuple[List[Tuple[float, float, float, float]], int]:
+    # Evaluates the grid concurrently, returning each bracket with its function values, and the number of evaluations:
+    if lower >= upper:
+        raise ValueError("Lower cannot be greater than or equal to upper.")
+
+    if n < 1:
+        raise ValueError("The number of grid points cannot be less than one.")
+
+    width = (upper - lower) / n
+    x = [lower + i * width for i in range(n)] + [upper]
+    y = await asyncio.gather(*(evaluate(point) for point in x))
+    brackets = [(x[i], x[i + 1], y[i], y[i + 1]) for i in range(n) if y[i] == 0 or y[i] * y[i + 1] < 0]
+    if y[-1] == 0:
+        brackets.append((x[-2], x[-1], y[-2], y[-1]))
+    return brackets, n + 1
+
+
+async def async_find_all_roots(f: Callable, lower: float, upper: float, precision: float, n: int = 100, points: int = 1,
+                               concurrency: int = 16, xtol: float = 0.0, max_iter: int = 1000) -> RootResult:
+    """
+    Approximates all of the roots of a coroutine function in an interval. The grid used to find the brackets is evaluated
+     concurrently, and then every bracket is refined concurrently with the bisection method.
+
+    Args:
+        f (Callable): A continuous coroutine function to find the roots of
+        lower (float): The lower bound of the interval to search
+        upper (float): The upper bound of the interval to search
+        precision (float): The maximum amount of error that is acceptable in method results
+        n (int, optional): The number of subintervals in the grid. Defaults to 100.
+        points (int, optional): The number of points to evaluate concurrently on each iteration of the bisection method. Defaults to 1.
+        concurrency (int, optional): The maximum number of evaluations of f in progress at once, shared by every bracket. Defaults to 16.
+        xtol (float, optional): The width of interval that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations of the bisection method per bracket. Defaults to 1000.
+
+    Raises:
+        ValueError: If precision is not greater than 0, if lower >= upper, or if n, points or concurrency are less than 1.
+
+    Returns:
+        RootResult: A sorted list of every root found, with the largest number of iterations used for any bracket,
+            and the total number of function evaluations.
+    """
+    # Validating inputs:
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if points < 1 or concurrency < 1:
+        raise ValueError("The number of points and the concurrency cannot be less than one.")
+
+    # Actual method:
+    start = perf_counter()
+    evaluate = _limit(f, concurrency)
+    brackets, evaluations = await _scan(evaluate, lower, upper, n)
+    results = await asyncio.gather(*(_bisect(evaluate, a, b, fa, fb, precision, points, xtol, max_iter, None)
+                                     for a, b, fa, fb in brackets))
+
+    roots = sorted(result.root for result in results)
+    iterations = max((result.iterations for result in results), default=0)
+    evaluations += sum(result.evaluations for result in results)
+    converged = all(result.converged for result in results)
+    return RootResult(roots, iterations, evaluations, converged, perf_counter() - start)
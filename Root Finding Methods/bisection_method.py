@@ -9,10 +9,14 @@
 #  above process repeatedly until the method produces a value that meets the precision required.
 #
 
-from typing import Callable  # (For type hinting function)
+from time import perf_counter
+from typing import Callable, Optional  # (For type hinting function)
 
+from root_result import RootResult
 
-def bisection(f: Callable, lower: float, upper: float, precision: float) -> float:
+
+def bisection(f: Callable, lower: float, upper: float, precision: float, xtol: float = 0.0, max_iter: int = 1000, max_evals: Optional[int] = None,
+              callback: Optional[Callable] = None) -> RootResult:
     """
     Approximates the root to a function using the bisection method.
 
@@ -21,37 +25,81 @@ def bisection(f: Callable, lower: float, upper: float, precision: float) -> floa
         lower (float): The lower bound of the interval which contains the root
         upper (float): The upper bound of the interval which contains the root
         precision (float): The maximum amount of error that is acceptable in method results
+        xtol (float, optional): The width of interval that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the root and the value of f there. Defaults to None.
 
     Returns:
-        (float): Value which, when passed to f, returns a number of magnitude < precision.
+        (RootResult): Value which, when passed to f, returns a number of magnitude < precision, along with
+            the number of iterations and function evaluations used.
         
     Raises:
-        ValueError: If precision is not greater than 0, if f(lower) and f(upper) are of the same sign, or if lower == upper.
+        ValueError: If precision is not greater than 0, if f(lower) and f(upper) are of the same sign, if lower == upper,
+            if xtol is negative, or if either budget is less than 1.
     """
     
     # Validating inputs:
     if lower >= upper:
         raise ValueError("Lower cannot be greater than or equal to upper.")
     
-    if f(lower) * f(upper) > 0:
-        raise ValueError("f(lower) and f(upper) must have different signs.")
-    
     if precision <= 0:
         raise ValueError("Precision cannot be zero or negative.")
     
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+    
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+    
+    start = perf_counter()
+    f_lower = f(lower)  # Each endpoint is only ever evaluated once
+    evaluations = 1
+    if max_evals == 1:  # (The evaluation budget is checked before every evaluation of f)
+        f_upper = f_lower
+    else:
+        f_upper = f(upper)
+        evaluations += 1
+        if f_lower * f_upper > 0:
+            raise ValueError("f(lower) and f(upper) must have different signs.")
+    
     # Actual method:
-    mid = (lower + upper) / 2  # Split the interval into two smaller intervals
+    mid, f_mid = (lower, f_lower) if abs(f_lower) <= abs(f_upper) else (upper, f_upper)  # The best estimate so far
+    if abs(f_mid) > precision and (max_evals is None or evaluations < max_evals):
+        mid = (lower + upper) / 2  # Split the interval into two smaller intervals
+        f_mid = f(mid)
+        evaluations += 1
+    iterations = 0
+    message = ""
     
-    while abs(f(mid)) > precision:  # Loop until the precision is met
+    while abs(f_mid) > precision and upper - lower > xtol:  # Loop until the precision is met
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+        
+        if max_evals is not None and evaluations >= max_evals:
+            message = "The evaluation budget was used up."
+            break
+        
         # Choosing the range for the new interval:
-        if f(lower) * f(mid) < 0:
-            upper = mid
+        if f_lower * f_mid < 0:
+            upper, f_upper = mid, f_mid
         else:
-            lower = mid
-            
+            lower, f_lower = mid, f_mid
+        
         # Set mid to the middle of the new interval:
-        mid = (lower + upper) / 2
+        next_mid = (lower + upper) / 2
+        if next_mid == lower or next_mid == upper:
+            message = "The interval cannot be split any further."
+            break
+        
+        mid = next_mid
+        f_mid = f(mid)
+        evaluations += 1
+        iterations += 1
+        if callback is not None:
+            callback(iterations, mid, f_mid)
     
-    return mid
-
+    return RootResult(mid, iterations, evaluations, not message, perf_counter() - start, message)
 
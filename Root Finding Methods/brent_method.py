@@ -0,0 +1,144 @@
+# Author: Satya Jhaveri
+#
+# Brent's method is a hybrid root finding method that combines the reliability of the
+#  bisection method with the speed of the open methods.
+# Like the bisection method, it is given two values a and b for which f(a) and f(b) have
+#  differing signs, and it always keeps the root bracketed between two points. On each
+#  iteration it attempts an inverse quadratic interpolation step (fitting a sideways parabola
+#  x = g(y) through the last three points and using g(0) as the next guess), or a secant step
+#  when only two distinct points are available. If the interpolated guess falls outside the
+#  bracket, or if the bracket is not shrinking quickly enough, a bisection step is used instead.
+# This means the method is never slower than bisection, and near the root it converges
+#  superlinearly, usually reaching machine precision in only a handful of function evaluations.
+#
+
+from math import copysign
+from sys import float_info
+from time import perf_counter
+from typing import Callable, Optional  # (For type hinting function)
+
+from root_result import RootResult
+
+
+def brent(f: Callable, lower: float, upper: float, precision: float, xtol: float = 0.0, max_iter: int = 1000, max_evals: Optional[int] = None,
+          callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates the root to a function using Brent's method.
+
+    Args:
+        f (Callable): A continuous function to approximate a root of
+        lower (float): The lower bound of the interval which contains the root
+        upper (float): The upper bound of the interval which contains the root
+        precision (float): The maximum amount of error that is acceptable in method results
+        xtol (float, optional): The width of bracket that is small enough to stop at. Defaults to 0.0,
+            which stops once the bracket has shrunk to machine precision.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the root and the value of f there. Defaults to None.
+
+    Returns:
+        RootResult: The approximated root, along with the number of iterations and function evaluations used.
+
+    Raises:
+        ValueError: If precision is not greater than 0, if f(lower) and f(upper) are of the same sign, if lower == upper,
+            if xtol is negative, or if either budget is less than 1.
+    """
+    # Validating inputs:
+    if lower >= upper:
+        raise ValueError("Lower cannot be greater than or equal to upper.")
+
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+
+    start = perf_counter()
+    a, b = lower, upper
+    fa = f(a)
+    evaluations = 1
+    if max_evals == 1:  # (The evaluation budget is checked before every evaluation of f, so only f(lower) can be found)
+        converged = abs(fa) <= precision
+        return RootResult(a, 0, evaluations, converged, perf_counter() - start, "" if converged else "The evaluation budget was used up.")
+    fb = f(b)
+    evaluations += 1
+
+    if fa * fb > 0:
+        raise ValueError("f(lower) and f(upper) must have different signs.")
+
+    # Actual method:
+    # b is the best estimate of the root, a is the previous estimate, and c is the point
+    #  that keeps the root bracketed between b and c:
+    c, fc = b, fb
+    d = e = b - a  # The last step taken, and the step before that
+    iterations = 0
+    converged = False
+    message = ""
+
+    while True:
+        # Making sure the root is bracketed between b and c:
+        if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
+            c, fc = a, fa
+            d = e = b - a
+
+        # Making sure b is the best estimate:
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * float_info.epsilon * abs(b) + 0.5 * xtol
+        half_width = 0.5 * (c - b)
+
+        if abs(fb) <= precision or abs(half_width) <= tol:
+            converged = True
+            break
+
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+
+        if max_evals is not None and evaluations >= max_evals:
+            message = "The evaluation budget was used up."
+            break
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Attempting an interpolation step:
+            s = fb / fa
+            if a == c:
+                # Only two distinct points, so use the secant method:
+                p = 2 * half_width * s
+                q = 1 - s
+            else:
+                # Inverse quadratic interpolation:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * half_width * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            # Only accepting the interpolation if it stays inside the bracket and the steps are shrinking:
+            if 2 * p < min(3 * half_width * q - abs(tol * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = half_width
+        else:
+            # Falling back to bisection:
+            d = e = half_width
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else copysign(tol, half_width)
+        fb = f(b)
+        evaluations += 1
+        iterations += 1
+        if callback is not None:
+            callback(iterations, b, fb)
+
+    return RootResult(b, iterations, evaluations, converged, perf_counter() - start, message)
@@ -0,0 +1,180 @@
+# Author: Satya Jhaveri
+#
+# Continuation (or 'path following') tracks how the root of a function f(x, p) moves as a
+#  parameter p is changed. Rather than solving f(x, p) = 0 from scratch for every value of p,
+#  each solve is warm-started from the root found at the previous parameter value.
+#
+# Differentiating f(x(p), p) = 0 with respect to p gives the tangent to the path of roots:
+#  dx/dp = -(df/dp) / (df/dx)
+#  so after finding the root x_k at p_k, a good guess for the root at p_(k+1) is the predictor
+#  step x_k + (p_(k+1) - p_k) * dx/dp. A few Newton Raphson iterations (the corrector) then move
+#  this guess onto the path. When the path is smooth the predictor is already very close, so each
+#  root usually only needs one or two corrector iterations.
+#
+# If the corrector is slow to converge, the step in p is split into smaller substeps. A turning
+#  point (where the path of roots folds back on itself, so df/dx = 0 and no root exists just past
+#  it) is detected when df/dx changes sign along the path, or when the step in p cannot be made
+#  small enough for the corrector to converge.
+#
+# The derivatives df/dx and df/dp can be given, or are otherwise found by automatic
+#  differentiation (see dual_numbers.py).
+#
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
+
+from dual_numbers import Dual
+
+
+@dataclass
+class ContinuationResult:
+    """
+    The result of the continuation method.
+
+    Attributes:
+        parameters (List[float]): The parameter values that a root was found for
+        roots (List[float]): The root found at each parameter value
+        iterations (List[int]): The number of corrector iterations used for each parameter value
+        evaluations (int): The total number of evaluations of f and its derivatives
+        converged (bool): Whether a root was found for every requested parameter value
+        turning_points (List[float]): The parameter values at which a turning point was detected
+        elapsed (float): The time (in seconds) the method took to run
+    """
+    parameters: List[float]
+    roots: List[float]
+    iterations: List[int]
+    evaluations: int
+    converged: bool
+    turning_points: List[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def continuation(f: Callable, x0: float, parameters: List[float], precision: float, df_dx: Optional[Callable] = None,
+                 df_dp: Optional[Callable] = None, max_iter: int = 8, max_halvings: int = 10, callback: Optional[Callable] = None) -> ContinuationResult:
+    """
+    Tracks the root of f(x, p) as p moves through a sequence of values, using tangent predictor steps and Newton Raphson
+     corrector steps.
+
+    Args:
+        f (Callable): A continuous function of two variables (x, p) to track a root of
+        x0 (float): An initial guess of the root at the first parameter value
+        parameters (List[float]): The parameter values to find the root at, in order
+        precision (float): The maximum amount of error that is acceptable in method results
+        df_dx (Optional[Callable], optional): The partial derivative of f with respect to x. Defaults to None,
+            which uses automatic differentiation.
+        df_dp (Optional[Callable], optional): The partial derivative of f with respect to p. Defaults to None,
+            which uses automatic differentiation.
+        max_iter (int, optional): The maximum number of corrector iterations per step before the step is split. Defaults to 8.
+        max_halvings (int, optional): The maximum number of times a step can be split before stopping. Defaults to 10.
+        callback (Optional[Callable], optional): A function called each time the root is found at one of the parameter
+            values, with the number of parameter values done so far, the parameter value and the root. Defaults to None.
+
+    Raises:
+        ValueError: If precision is not greater than zero, if there are no parameter values, or if max_iter is less than 1.
+
+    Returns:
+        ContinuationResult: The roots found at each parameter value, along with the work done and any turning points found.
+            If the path of roots cannot be followed any further, the roots found so far are returned.
+    """
+    # Validating Inputs:
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if len(parameters) == 0:
+        raise ValueError("There must be at least one parameter value.")
+
+    if max_iter < 1:
+        raise ValueError("The maximum number of iterations cannot be less than one.")
+
+    start = perf_counter()
+    evaluations = 0
+
+    def value_and_dx(x: float, p: float) -> Tuple[float, float]:
+        nonlocal evaluations
+        if df_dx is not None:
+            evaluations += 2
+            return f(x, p), df_dx(x, p)
+        evaluations += 1
+        y = f(Dual(x, 1.0), p)
+        return (y.value, y.derivative) if isinstance(y, Dual) else (y, 0.0)
+
+    def dp(x: float, p: float) -> float:
+        nonlocal evaluations
+        evaluations += 1
+        if df_dp is not None:
+            return df_dp(x, p)
+        y = f(x, Dual(p, 1.0))
+        return y.derivative if isinstance(y, Dual) else 0.0
+
+    def correct(x: float, p: float, iterations: int) -> Tuple[float, float, int, bool]:
+        # Newton Raphson iterations at a fixed parameter value, returning the root, df/dx there, and the iterations used:
+        fx, fx_x = value_and_dx(x, p)
+        for i in range(iterations + 1):
+            if abs(fx) <= precision:
+                return x, fx_x, i, True
+            if i == iterations or fx_x == 0:
+                break
+            x -= fx / fx_x
+            fx, fx_x = value_and_dx(x, p)
+        return x, fx_x, iterations, False
+
+    # Actual Method:
+    # Solving cold at the first parameter value:
+    x, fx_x, iterations, converged = correct(x0, parameters[0], max_iter * (max_halvings + 1))
+    result = ContinuationResult([], [], [], 0, converged)
+    if not converged:
+        result.evaluations, result.elapsed = evaluations, perf_counter() - start
+        return result
+    result.parameters.append(parameters[0])
+    result.roots.append(x)
+    result.iterations.append(iterations)
+    if callback is not None:
+        callback(1, parameters[0], x)
+
+    p = parameters[0]
+    max_step = float("inf")  # The largest step in p to take
+    for target in parameters[1:]:
+        iterations = 0
+        halvings = 0
+        while p != target:
+            h = max(-max_step, min(max_step, target - p))
+
+            # Predictor step along the tangent:
+            x_guess = x - h * dp(x, p) / fx_x if fx_x != 0 else x
+
+            # Corrector step:
+            x_new, fx_x_new, used, converged = correct(x_guess, p + h, max_iter)
+            iterations += used
+            if not converged:
+                max_step = abs(h) / 2
+                halvings += 1
+                if halvings > max_halvings or p + max_step == p:
+                    # The path cannot be followed any further, so this is most likely a turning point:
+                    result.turning_points.append(p)
+                    result.converged = False
+                    break
+                continue
+
+            if fx_x_new * fx_x < 0:
+                # df/dx changed sign, so the path folded back somewhere in this step:
+                result.turning_points.append(p + h / 2)
+
+            p, x, fx_x = p + h, x_new, fx_x_new
+            halvings = 0
+            # Taking bigger steps when the corrector is fast, and smaller steps when it slows down:
+            if used <= 1:
+                max_step = 2 * max_step
+            elif used > max_iter // 2:
+                max_step = abs(h) / 2
+
+        if not result.converged:
+            break
+        result.parameters.append(target)
+        result.roots.append(x)
+        result.iterations.append(iterations)
+        if callback is not None:
+            callback(len(result.roots), target, x)
+
+    result.evaluations, result.elapsed = evaluations, perf_counter() - start
+    return result
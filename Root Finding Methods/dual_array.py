@@ -0,0 +1,119 @@
+# Author: Satya Jhaveri
+#
+# A vectorized version of the dual numbers in dual_numbers.py.
+# Instead of storing one value and one derivative, a DualArray stores a NumPy array of values
+#  and a NumPy array of the corresponding derivatives, so a whole batch of dual numbers can be
+#  pushed through a function at once. DualArray hooks into NumPy's ufunc machinery, so any
+#  function written using NumPy operations (np.sin, np.exp, **, /, ...) can be differentiated
+#  elementwise with a single vectorized call.
+#
+
+from typing import Callable, Tuple
+
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+
+# The derivatives of the supported single argument ufuncs, in terms of the input value:
+_UNARY_DERIVATIVES = {
+    np.negative: lambda v: -np.ones_like(v),
+    np.positive: lambda v: np.ones_like(v),
+    np.absolute: lambda v: np.sign(v),
+    np.square: lambda v: 2 * v,
+    np.sqrt: lambda v: 0.5 / np.sqrt(v),
+    np.exp: lambda v: np.exp(v),
+    np.log: lambda v: 1 / v,
+    np.sin: lambda v: np.cos(v),
+    np.cos: lambda v: -np.sin(v),
+    np.tan: lambda v: 1 / np.cos(v) ** 2,
+    np.arctan: lambda v: 1 / (1 + v * v),
+    np.sinh: lambda v: np.cosh(v),
+    np.cosh: lambda v: np.sinh(v),
+    np.tanh: lambda v: 1 / np.cosh(v) ** 2,
+}
+
+# Comparisons only look at the values, and return ordinary boolean arrays:
+_COMPARISONS = (np.less, np.less_equal, np.greater, np.greater_equal, np.equal, np.not_equal)
+
+
+class DualArray(NDArrayOperatorsMixin):
+    """
+    An array of dual numbers, stored as an array of values and an array of derivatives.
+
+    Attributes:
+        value (np.ndarray): The real parts of the numbers (the values of the function)
+        derivative (np.ndarray): The dual parts of the numbers (the derivatives of the function)
+    """
+
+    def __init__(self, value: np.ndarray, derivative: np.ndarray = None) -> None:
+        self.value = np.asarray(value, dtype=float)
+        self.derivative = np.zeros_like(self.value) if derivative is None else np.asarray(derivative, dtype=float)
+
+    def __repr__(self) -> str:
+        return f"DualArray({self.value!r}, {self.derivative!r})"
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index) -> "DualArray":
+        return DualArray(self.value[index], self.derivative[index])
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if "out" in kwargs:
+            raise TypeError(f"DualArray does not support out= in {ufunc.__name__} (or in-place operators such as +=), since the derivatives "
+                            f"would not be stored. Assign the result instead (x = x + y rather than x += y).")
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        values = [x.value if isinstance(x, DualArray) else np.asarray(x) for x in inputs]
+        derivatives = [x.derivative if isinstance(x, DualArray) else 0.0 for x in inputs]
+
+        if ufunc in _COMPARISONS:
+            return ufunc(*values)
+
+        if ufunc in _UNARY_DERIVATIVES:
+            (u,), (du,) = values, derivatives
+            return DualArray(ufunc(u), _UNARY_DERIVATIVES[ufunc](u) * du)
+
+        if len(inputs) != 2:
+            return NotImplemented
+        (u, v), (du, dv) = values, derivatives
+
+        if ufunc is np.add:
+            return DualArray(u + v, du + dv)
+        if ufunc is np.subtract:
+            return DualArray(u - v, du - dv)
+        if ufunc is np.multiply:
+            return DualArray(u * v, u * dv + v * du)
+        if ufunc is np.true_divide:
+            return DualArray(u / v, (du * v - u * dv) / (v * v))
+        if ufunc is np.power:
+            value = u ** v
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # (u^c)' = c u^(c-1) u' wherever the exponent is constant (which is also correct at u = 0, where log(u) is not):
+                power_rule = np.where(v == 0, 0.0, v * u ** (v - 1)) * du
+                if not isinstance(inputs[1], DualArray):
+                    return DualArray(value, power_rule)
+                # (u^v)' = u^v * (v' ln(u) + v u' / u) elsewhere:
+                general = value * (dv * np.log(u) + v * du / u)
+            return DualArray(value, np.where(dv == 0, power_rule, general))
+        return NotImplemented
+
+
+def values_and_derivatives(f: Callable, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates a vectorized function and its derivative at an array of points, using a single call to the function.
+
+    Args:
+        f (Callable): A differentiable function, written using NumPy operations, that acts elementwise on an array
+        x (np.ndarray): The points to evaluate the function and its derivative at
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The values of f(x), and the values of f'(x)
+    """
+    x = np.asarray(x, dtype=float)
+    y = f(DualArray(x, np.ones_like(x)))
+    if isinstance(y, DualArray):
+        return y.value, y.derivative
+    y = np.broadcast_to(np.asarray(y, dtype=float), x.shape)
+    return y, np.zeros_like(x)  # (f does not depend on x)
@@ -0,0 +1,239 @@
+# Author: Satya Jhaveri
+#
+# Dual numbers are numbers of the form a + bε, where ε is a number that is not zero, but
+#  for which ε² = 0. Substituting a + ε into the Taylor series of a function gives:
+#  f(a + ε) = f(a) + f'(a)ε + (f''(a)/2)ε² + ... = f(a) + f'(a)ε
+#  so evaluating a function on a dual number produces both the value of the function and its
+#  derivative at the same time. This is called forward-mode automatic differentiation.
+# Unlike finite differences, the derivative is exact (up to rounding error), and it only takes
+#  one call to the function to find both values.
+#
+# Any function built from the arithmetic operators and the functions in this file can be
+#  differentiated this way, without needing to write out its derivative by hand.
+#
+
+import math
+from typing import Callable, Tuple, Union
+
+
+class Dual:
+    """
+    A dual number, value + derivative * ε, where ε² = 0.
+
+    Attributes:
+        value (float): The real part of the number (the value of the function)
+        derivative (float): The dual part of the number (the derivative of the function)
+    """
+    __slots__ = ("value", "derivative")
+
+    def __init__(self, value: float, derivative: float = 0.0) -> None:
+        self.value = value
+        self.derivative = derivative
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value}, {self.derivative})"
+
+    # Arithmetic:
+    def __add__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.derivative + other.derivative)
+        return Dual(self.value + other, self.derivative)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.derivative - other.derivative)
+        return Dual(self.value - other, self.derivative)
+
+    def __rsub__(self, other: float) -> "Dual":
+        return Dual(other - self.value, -self.derivative)
+
+    def __mul__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.value * other.derivative + self.derivative * other.value)
+        return Dual(self.value * other, self.derivative * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value, (self.derivative * other.value - self.value * other.derivative) / (other.value * other.value))
+        return Dual(self.value / other, self.derivative / other)
+
+    def __rtruediv__(self, other: float) -> "Dual":
+        return Dual(other / self.value, -other * self.derivative / (self.value * self.value))
+
+    def __pow__(self, other: Union["Dual", float]) -> "Dual":
+        if isinstance(other, Dual):
+            # (u^v)' = u^v * (v' ln(u) + v u' / u)
+            value = self.value ** other.value
+            return Dual(value, value * (other.derivative * math.log(self.value) + other.value * self.derivative / self.value))
+        if other == 0:
+            return Dual(1.0, 0.0)
+        return Dual(self.value ** other, other * self.value ** (other - 1) * self.derivative)
+
+    def __rpow__(self, other: float) -> "Dual":
+        value = other ** self.value
+        return Dual(value, value * math.log(other) * self.derivative)
+
+    def __neg__(self) -> "Dual":
+        return Dual(-self.value, -self.derivative)
+
+    def __pos__(self) -> "Dual":
+        return self
+
+    def __abs__(self) -> "Dual":
+        return self if self.value >= 0 else -self
+
+    # Comparisons (only the value is compared):
+    def __eq__(self, other: object) -> bool:
+        return self.value == (other.value if isinstance(other, Dual) else other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __lt__(self, other: Union["Dual", float]) -> bool:
+        return self.value < (other.value if isinstance(other, Dual) else other)
+
+    def __le__(self, other: Union["Dual", float]) -> bool:
+        return self.value <= (other.value if isinstance(other, Dual) else other)
+
+    def __gt__(self, other: Union["Dual", float]) -> bool:
+        return self.value > (other.value if isinstance(other, Dual) else other)
+
+    def __ge__(self, other: Union["Dual", float]) -> bool:
+        return self.value >= (other.value if isinstance(other, Dual) else other)
+
+    __hash__ = None
+
+    # NumPy's functions call these methods on objects they do not know, so np.sin(x) also works on dual numbers:
+    def sqrt(self) -> "Dual":
+        return sqrt(self)
+
+    def exp(self) -> "Dual":
+        return exp(self)
+
+    def log(self) -> "Dual":
+        return log(self)
+
+    def sin(self) -> "Dual":
+        return sin(self)
+
+    def cos(self) -> "Dual":
+        return cos(self)
+
+    def tan(self) -> "Dual":
+        return tan(self)
+
+    def arcsin(self) -> "Dual":
+        return asin(self)
+
+    def arccos(self) -> "Dual":
+        return acos(self)
+
+    def arctan(self) -> "Dual":
+        return atan(self)
+
+    def sinh(self) -> "Dual":
+        return sinh(self)
+
+    def cosh(self) -> "Dual":
+        return cosh(self)
+
+    def tanh(self) -> "Dual":
+        return tanh(self)
+
+
+# Elementary functions, which accept either dual numbers or ordinary numbers:
+def sqrt(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        value = math.sqrt(x.value)
+        return Dual(value, x.derivative / (2 * value))
+    return math.sqrt(x)
+
+
+def exp(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        value = math.exp(x.value)
+        return Dual(value, value * x.derivative)
+    return math.exp(x)
+
+
+def log(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.log(x.value), x.derivative / x.value)
+    return math.log(x)
+
+
+def sin(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.sin(x.value), math.cos(x.value) * x.derivative)
+    return math.sin(x)
+
+
+def cos(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.cos(x.value), -math.sin(x.value) * x.derivative)
+    return math.cos(x)
+
+
+def tan(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        value = math.tan(x.value)
+        return Dual(value, (1 + value * value) * x.derivative)
+    return math.tan(x)
+
+
+def asin(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.asin(x.value), x.derivative / math.sqrt(1 - x.value * x.value))
+    return math.asin(x)
+
+
+def acos(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.acos(x.value), -x.derivative / math.sqrt(1 - x.value * x.value))
+    return math.acos(x)
+
+
+def atan(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.atan(x.value), x.derivative / (1 + x.value * x.value))
+    return math.atan(x)
+
+
+def sinh(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.sinh(x.value), math.cosh(x.value) * x.derivative)
+    return math.sinh(x)
+
+
+def cosh(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        return Dual(math.cosh(x.value), math.sinh(x.value) * x.derivative)
+    return math.cosh(x)
+
+
+def tanh(x: Union[Dual, float]) -> Union[Dual, float]:
+    if isinstance(x, Dual):
+        value = math.tanh(x.value)
+        return Dual(value, (1 - value * value) * x.derivative)
+    return math.tanh(x)
+
+
+def value_and_derivative(f: Callable, x: float) -> Tuple[float, float]:
+    """
+    Evaluates a function and its derivative at a point, using a single call to the function.
+
+    Args:
+        f (Callable): A differentiable function, built from arithmetic operators and the functions in this file
+        x (float): The point to evaluate the function and its derivative at
+
+    Returns:
+        Tuple[float, float]: The value of f(x), and the value of f'(x)
+    """
+    y = f(Dual(x, 1.0))
+    if isinstance(y, Dual):
+        return y.value, y.derivative
+    return y, 0.0  # (f does not depend on x)
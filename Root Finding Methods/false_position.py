@@ -10,10 +10,14 @@
 #  produces a value that meets the precision required.
 #
 
-from typing import Callable
+from time import perf_counter
+from typing import Callable, Optional
 
+from root_result import RootResult
 
-def false_position(f: Callable, lower: float, upper: float, precision: float) -> float:
+
+def false_position(f: Callable, lower: float, upper: float, precision: float, xtol: float = 0.0, max_iter: int = 1000, max_evals: Optional[int] = None,
+                   callback: Optional[Callable] = None) -> RootResult:
     """
     Approximates the root to a function using the false position method.
 
@@ -22,34 +26,79 @@ def false_position(f: Callable, lower: float, upper: float, precision: float) ->
         lower (float): The lower bound of the interval which contains the root
         upper (float): The upper bound of the interval which contains the root
         precision (float): The maximum amount of error that is acceptable in method results
+        xtol (float, optional): The width of interval that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the root and the value of f there. Defaults to None.
 
     Returns:
-        float: Value which, when passed to f, returns a number of magnitude < precision.
+        RootResult: Value which, when passed to f, returns a number of magnitude < precision, along with
+            the number of iterations and function evaluations used.
         
     Raises:
-        ValueError: If precision is not greater than 0, if f(lower) and f(upper) are of the same sign, or if lower == upper.
+        ValueError: If precision is not greater than 0, if f(lower) and f(upper) are of the same sign, if lower == upper,
+            if xtol is negative, or if either budget is less than 1.
     """
     # Validating inputs:
     if lower >= upper:
         raise ValueError("Lower cannot be greater than or equal to upper.")
     
-    if f(lower) * f(upper) > 0:
-        raise ValueError("f(lower) and f(upper) must have different signs.")
-    
     if precision <= 0:
         raise ValueError("Precision cannot be zero or negative.")
     
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+    
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+    
+    start = perf_counter()
+    f_lower = f(lower)  # Each endpoint is only ever evaluated once
+    evaluations = 1
+    if max_evals == 1:  # (The evaluation budget is checked before every evaluation of f)
+        f_upper = f_lower
+    else:
+        f_upper = f(upper)
+        evaluations += 1
+        if f_lower * f_upper > 0:
+            raise ValueError("f(lower) and f(upper) must have different signs.")
+    
     # Actual Method:
-    root_guess = lower - (upper - lower) * f(lower) / (f(upper) - f(lower))
+    root_guess, f_guess = (lower, f_lower) if abs(f_lower) <= abs(f_upper) else (upper, f_upper)  # The best estimate so far
+    if abs(f_guess) > precision and (max_evals is None or evaluations < max_evals):
+        root_guess = lower - (upper - lower) * f_lower / (f_upper - f_lower)
+        f_guess = f(root_guess)
+        evaluations += 1
+    iterations = 0
+    message = ""
     
-    while abs(f(root_guess)) > precision:
+    while abs(f_guess) > precision and upper - lower > xtol:
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+        
+        if max_evals is not None and evaluations >= max_evals:
+            message = "The evaluation budget was used up."
+            break
+        
         # Choosing the range for the new interval:
-        if f(lower) * f(root_guess) < 0:
-            upper = root_guess
+        if f_lower * f_guess < 0:
+            upper, f_upper = root_guess, f_guess
         else:
-            lower = root_guess
+            lower, f_lower = root_guess, f_guess
         
         # Resetting the root guess:
-        root_guess = lower - (upper - lower) * f(lower) / (f(upper) - f(lower))
+        next_guess = lower - (upper - lower) * f_lower / (f_upper - f_lower)
+        if next_guess == root_guess:
+            message = "The interval cannot be split any further."
+            break
+        
+        root_guess = next_guess
+        f_guess = f(root_guess)
+        evaluations += 1
+        iterations += 1
+        if callback is not None:
+            callback(iterations, root_guess, f_guess)
     
-    return root_guess
+    return RootResult(root_guess, iterations, evaluations, not message, perf_counter() - start, message)
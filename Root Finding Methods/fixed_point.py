@@ -0,0 +1,224 @@
+# Author: Satya Jhaveri
+#
+# Fixed point iteration finds a value x for which x = g(x), by repeatedly applying
+#  x_(k+1) = g(x_k). If g is a contraction near the fixed point (|g'(x)| < 1), the iterates
+#  converge to it, but only linearly: the error shrinks by a factor of about |g'(x)| each step.
+#
+# Aitken's Δ² process accelerates a linearly converging sequence. Assuming the error shrinks by
+#  a constant factor each step, three consecutive iterates are enough to solve for the limit:
+#  x̂ = x_k - (x_(k+1) - x_k)² / (x_(k+2) - 2x_(k+1) + x_k)
+# Steffensen's method goes a step further, and restarts the iteration from each accelerated
+#  estimate, which gives quadratic convergence without needing any derivatives.
+#
+# For systems of equations (where x is a vector) this file also contains Anderson acceleration.
+#  Instead of only using the latest iterate, it finds the combination of the last few iterates
+#  whose residuals g(x) - x best cancel each other out (in the least squares sense), and uses the
+#  same combination of their images under g as the next iterate.
+#
+
+from time import perf_counter
+from typing import Callable, Optional
+
+import numpy as np
+
+from root_result import RootResult
+
+
+def fixed_point(g: Callable, x0: float, precision: float, method: str = "steffensen", xtol: float = 0.0, max_iter: int = 1000,
+                max_evals: Optional[int] = None, callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates a fixed point of a function (a value x where g(x) = x) using accelerated fixed point iteration.
+
+    Args:
+        g (Callable): A continuous function to approximate a fixed point of
+        x0 (float): The initial guess of the fixed point
+        precision (float): The maximum value of |g(x) - x| that is acceptable in method results. For the 'aitken' method,
+            this is instead the maximum change between consecutive accelerated estimates.
+        method (str, optional): The iteration to use, one of 'plain' (x = g(x)), 'aitken' (Aitken's Δ² process applied to
+            the plain iterates) or 'steffensen' (restarting from each Aitken estimate). Defaults to 'steffensen'.
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the fixed point and the residual g(x) - x there. Defaults to None.
+
+    Raises:
+        ValueError: If precision is not greater than zero, if the method is not recognised, if xtol is negative,
+            or if either budget is less than 1.
+
+    Returns:
+        RootResult: The approximated fixed point, along with the number of iterations and function evaluations used.
+    """
+    # Validating Inputs:
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if method not in ("plain", "aitken", "steffensen"):
+        raise ValueError("The method must be one of 'plain', 'aitken' or 'steffensen'.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+
+    # Actual Method:
+    start = perf_counter()
+    x = x0
+    gx = g(x)
+    evaluations = 1
+    iterations = 0
+    converged = False
+    message = ""
+    estimate = None  # The last Aitken estimate
+    evals_per_iter = 2 if method == "steffensen" else 1
+
+    while True:
+        if method != "aitken" and abs(gx - x) <= precision:
+            converged = True
+            break
+
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+
+        if max_evals is not None and evaluations + evals_per_iter > max_evals:
+            message = "The evaluation budget was used up."
+            break
+
+        if method == "plain":
+            step = gx - x
+            x = gx
+            gx = g(x)
+            evaluations += 1
+        elif method == "aitken":
+            # Continuing the plain iteration, and accelerating the last three iterates:
+            ggx = g(gx)
+            evaluations += 1
+            denominator = ggx - 2 * gx + x
+            previous = estimate
+            estimate = ggx if denominator == 0 else x - (gx - x) ** 2 / denominator
+            x, gx = gx, ggx
+            step = estimate - previous if previous is not None else float("inf")
+            if abs(step) <= precision:
+                converged = True
+                iterations += 1
+                if callback is not None:
+                    callback(iterations, estimate, gx - x)
+                break
+        else:
+            # Restarting from the Aitken estimate of x, g(x) and g(g(x)):
+            ggx = g(gx)
+            denominator = ggx - 2 * gx + x
+            if denominator == 0:
+                # (The iterates are no longer changing in a way Aitken's process can use)
+                x, gx = ggx, g(ggx)
+                evaluations += 2
+                iterations += 1
+                if callback is not None:
+                    callback(iterations, x, gx - x)
+                converged = abs(gx - x) <= precision
+                if not converged:
+                    message = "The iterates stopped changing in a way Aitken's process can use."
+                break
+            step = -(gx - x) ** 2 / denominator
+            x = x + step
+            gx = g(x)
+            evaluations += 2
+
+        iterations += 1
+        if callback is not None:
+            callback(iterations, estimate if method == "aitken" else x, gx - x)
+        if abs(step) <= xtol:
+            converged = True
+            break
+
+    root = estimate if method == "aitken" and estimate is not None else x
+    return RootResult(root, iterations, evaluations, converged, perf_counter() - start, message)
+
+
+def anderson(g: Callable, x0: np.ndarray, precision: float, depth: int = 5, beta: float = 1.0, xtol: float = 0.0, max_iter: int = 1000,
+             max_evals: Optional[int] = None, callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates a fixed point of a vector function (a vector x where g(x) = x) using Anderson acceleration.
+
+    Args:
+        g (Callable): A continuous function that maps a vector of length n to a vector of length n
+        x0 (np.ndarray): The initial guess of the fixed point
+        precision (float): The maximum size of any component of g(x) - x that is acceptable in method results
+        depth (int, optional): The number of previous iterates to combine (0 gives plain fixed point iteration). Defaults to 5.
+        beta (float, optional): The damping (mixing) parameter, where 1 is undamped. Defaults to 1.0.
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the fixed point and the residual g(x) - x there. Defaults to None.
+
+    Raises:
+        ValueError: If precision is not greater than zero, if depth is negative, if beta is not greater than zero,
+            if xtol is negative, or if either budget is less than 1.
+
+    Returns:
+        RootResult: The approximated fixed point, along with the number of iterations and function evaluations used.
+    """
+    # Validating Inputs:
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if depth < 0:
+        raise ValueError("The depth cannot be negative.")
+
+    if beta <= 0:
+        raise ValueError("Beta must be greater than zero.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+
+    # Actual Method:
+    start = perf_counter()
+    x = np.array(x0, dtype=float)
+    gx = np.asarray(g(x), dtype=float)
+    residual = gx - x
+    evaluations = 1
+    iterations = 0
+    converged = False
+
+    # The differences between consecutive iterates (dx) and consecutive residuals (dr), most recent last:
+    dx_history, dr_history = [], []
+
+    while iterations < max_iter and (max_evals is None or evaluations < max_evals):
+        if np.max(np.abs(residual)) <= precision:
+            converged = True
+            break
+
+        x_next = x + beta * residual
+        if dx_history:
+            # Finding the combination of previous residuals that best cancels out the current one:
+            dX, dR = np.column_stack(dx_history), np.column_stack(dr_history)
+            gamma = np.linalg.lstsq(dR, residual, rcond=None)[0]
+            x_next -= (dX + beta * dR) @ gamma
+
+        gx_next = np.asarray(g(x_next), dtype=float)
+        residual_next = gx_next - x_next
+        evaluations += 1
+        iterations += 1
+
+        if depth > 0:
+            dx_history.append(x_next - x)
+            dr_history.append(residual_next - residual)
+            if len(dx_history) > depth:
+                dx_history.pop(0)
+                dr_history.pop(0)
+
+        step = np.max(np.abs(x_next - x))
+        x, residual = x_next, residual_next
+        if callback is not None:
+            callback(iterations, x.copy(), residual)
+        if step <= xtol:
+            converged = True
+            break
+
+    return RootResult(x, iterations, evaluations, converged, perf_counter() - start)
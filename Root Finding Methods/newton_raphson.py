@@ -8,35 +8,152 @@
 #  satisfies the required precision.
 # 
 
-from typing import Callable  # (For type hinting function)
+from time import perf_counter
+from typing import Callable, Optional  # (For type hinting function)
 
+from dual_numbers import value_and_derivative
+from root_result import RootResult
 
-def newton_raphson(f: Callable, df: Callable, xi: float, precision: float) -> float:
+
+def newton_raphson(f: Callable, df: Optional[Callable], xi: float, precision: float, xtol: float = 0.0, max_iter: int = 1000, max_evals: Optional[int] = None,
+                   callback: Optional[Callable] = None) -> RootResult:
     """
     Approximates the root to a function using the false position method.
 
     Args:
         f (Callable): A continuous function to approximate a root of
-        df (Callable): The derivative of the function f, with respect to the independent variable
+        df (Optional[Callable]): The derivative of the function f, with respect to the independent variable. If None,
+            the derivative is found by automatic differentiation (see dual_numbers.py), in the same call as f.
         xi (float): The initial guess of the root of the function
         precision (float): The maximum amount of error that is acceptable in method results
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of evaluations of f and df to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the root and the value of f there. Defaults to None.
 
     Raises:
-        ValueError: If Precision is not greater than zero.
+        ValueError: If Precision is not greater than zero, if xtol is negative, or if either budget is less than 1.
 
     Returns:
-        float: Value which, when passed to f, returns a number of magnitude < precision.
+        RootResult: Value which, when passed to f, returns a number of magnitude < precision, along with
+            the number of iterations and evaluations of f and df used.
     """
     # Validating Inputs:
     if precision <= 0:
         raise ValueError("Precision cannot be zero or negative.")
+    
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+    
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
 
     # Actual Method:
-    x_next = xi - f(xi) / df(xi)
+    start = perf_counter()
+    if df is None:
+        f_xi, df_xi = value_and_derivative(f, xi)
+        evals_per_iter = 1
+    else:
+        f_xi = f(xi)  # (The derivative is only evaluated once the budget is checked)
+        evals_per_iter = 2
+    evaluations = 1
+    iterations = 0
+    message = ""
     
-    while abs(f(x_next)) > precision:
-        xi = x_next
-        x_next = xi - f(xi) / df(xi)
+    while True:
+        # Checking that there is budget for a whole iteration before evaluating anything:
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+        
+        if max_evals is not None and evaluations + evals_per_iter > max_evals:
+            message = "The evaluation budget was used up."
+            break
+        
+        if df is not None:
+            df_xi = df(xi)
+            evaluations += 1
+        if df_xi == 0:
+            message = "The derivative is zero, so the tangent has no root."
+            break
+        
+        step = f_xi / df_xi
+        xi = xi - step
+        iterations += 1
+        
+        # The value at the new point is re-used in the next iteration:
+        if df is None:
+            f_xi, df_xi = value_and_derivative(f, xi)
+        else:
+            f_xi = f(xi)
+        evaluations += 1
+        if callback is not None:
+            callback(iterations, xi, f_xi)
+        
+        if abs(f_xi) <= precision or abs(step) <= xtol:
+            break
     
-    return x_next
+    return RootResult(xi, iterations, evaluations, not message, perf_counter() - start, message)
+
+
+def newton_raphson_batch(f: Callable, xi, precision: float, xtol: float = 0.0, max_iter: int = 1000, callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates many roots at once using the Newton Raphson method, with derivatives found by automatic differentiation.
+    Every guess is updated with one vectorized call to f per iteration, so f can also depend elementwise on arrays of
+     parameters (for example f(x) = x**2 - a, where a is an array with the same shape as xi).
 
+    Args:
+        f (Callable): A continuous function, written using NumPy operations, that acts elementwise on an array
+        xi (np.ndarray): The initial guesses of the roots of the function
+        precision (float): The maximum amount of error that is acceptable in method results
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            array of current estimates and the values of f there. Defaults to None.
+
+    Raises:
+        ValueError: If Precision is not greater than zero, if xtol is negative, or if max_iter is less than 1.
+
+    Returns:
+        RootResult: An array of values which, when passed to f, return numbers of magnitude < precision. The result is
+            only marked as converged if every root met the precision.
+    """
+    import numpy as np  # (Only needed for the vectorized method)
+    from dual_array import values_and_derivatives
+
+    # Validating Inputs:
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+    
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+    
+    if max_iter < 1:
+        raise ValueError("The maximum number of iterations cannot be less than one.")
+
+    # Actual Method:
+    start = perf_counter()
+    xi = np.array(xi, dtype=float)
+    f_xi, df_xi = values_and_derivatives(f, xi)
+    evaluations = 1
+    iterations = 0
+    done = np.abs(f_xi) <= precision
+    
+    while not done.all() and iterations < max_iter:
+        # Only moving the guesses that have not converged yet, and have a finite, non-flat tangent:
+        active = ~done & (df_xi != 0) & np.isfinite(f_xi) & np.isfinite(df_xi)
+        if not active.any():
+            break
+        step = np.zeros_like(xi)
+        step[active] = f_xi[active] / df_xi[active]
+        xi -= step
+        iterations += 1
+        
+        f_xi, df_xi = values_and_derivatives(f, xi)
+        evaluations += 1
+        if callback is not None:
+            callback(iterations, xi.copy(), f_xi)
+        done |= active & ((np.abs(f_xi) <= precision) | (np.abs(step) <= xtol))
+    
+    return RootResult(xi, iterations, evaluations, bool(done.all()), perf_counter() - start)
@@ -0,0 +1,216 @@
+# Author: Satya Jhaveri
+#
+# These methods extend the Newton Raphson method to systems of n nonlinear equations in n
+#  unknowns, F(x) = 0, where F and x are vectors.
+#
+# Newton's method for systems replaces the derivative with the Jacobian matrix J (the matrix
+#  of partial derivatives dF_i/dx_j). Each iteration solves the linear system J(x_k) Δx = -F(x_k)
+#  (by LU factorization) and sets x_(k+1) = x_k + Δx. If the Jacobian is not known, it is
+#  approximated column by column with finite differences, costing n evaluations of F.
+#
+# Broyden's method is a quasi-Newton method that avoids recomputing the Jacobian. It starts
+#  from the inverse of one Jacobian, then after each step corrects that inverse with a rank-one
+#  update (using the Sherman-Morrison formula) so that it agrees with the change in F seen along
+#  the step. This costs one evaluation of F per iteration, and O(n²) work instead of O(n³).
+#
+
+from time import perf_counter
+from typing import Callable, Optional
+
+import numpy as np
+
+from root_result import RootResult
+
+
+def finite_difference_jacobian(F: Callable, x: np.ndarray, Fx: Optional[np.ndarray] = None, step: float = 1.5e-8) -> np.ndarray:
+    """
+    Approximates the Jacobian matrix of a vector function using forward differences.
+
+    Args:
+        F (Callable): A function that maps a vector of length n to a vector of length m
+        x (np.ndarray): The point to approximate the Jacobian at
+        Fx (Optional[np.ndarray], optional): The value of F(x), if it is already known. Defaults to None.
+        step (float, optional): The relative size of the finite difference step. Defaults to 1.5e-8.
+
+    Returns:
+        np.ndarray: The m by n matrix of partial derivatives of F at x
+    """
+    x = np.asarray(x, dtype=float)
+    Fx = np.asarray(F(x), dtype=float) if Fx is None else Fx
+    J = np.empty((Fx.size, x.size))
+    for j in range(x.size):
+        h = step * max(abs(x[j]), 1.0)
+        x_step = x.copy()
+        x_step[j] += h
+        J[:, j] = (np.asarray(F(x_step), dtype=float) - Fx) / h
+    return J
+
+
+def newton_system(F: Callable, x0: np.ndarray, precision: float, jacobian: Optional[Callable] = None, xtol: float = 0.0, max_iter: int = 100, max_evals: Optional[int] = None,
+                  callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates the root of a system of nonlinear equations using Newton's method.
+
+    Args:
+        F (Callable): A continuous function that maps a vector of length n to a vector of length n
+        x0 (np.ndarray): The initial guess of the root of the system
+        precision (float): The maximum size of any component of F(x) that is acceptable in method results
+        jacobian (Optional[Callable], optional): A function returning the n by n Jacobian matrix of F. Defaults to None,
+            which approximates the Jacobian with finite differences.
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 100.
+        max_evals (Optional[int], optional): The maximum number of evaluations of F (including those used by
+            finite differences) to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the root and the value of F there. Defaults to None.
+
+    Raises:
+        ValueError: If precision is not greater than zero, if xtol is negative, or if either budget is less than 1.
+
+    Returns:
+        RootResult: A vector which, when passed to F, returns a vector with no component of magnitude > precision,
+            along with the number of iterations and evaluations of F (and of the Jacobian, if given) used.
+    """
+    # Validating Inputs:
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+
+    # Actual Method:
+    start = perf_counter()
+    x = np.array(x0, dtype=float)
+    Fx = np.asarray(F(x), dtype=float)
+    evaluations = 1
+    evals_per_iter = 2 if jacobian is not None else x.size + 1
+    iterations = 0
+    converged = np.max(np.abs(Fx)) <= precision
+    message = ""
+
+    while not converged:
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+
+        if max_evals is not None and evaluations + evals_per_iter > max_evals:
+            message = "The evaluation budget was used up."
+            break
+
+        if jacobian is not None:
+            J = np.asarray(jacobian(x), dtype=float)
+        else:
+            J = finite_difference_jacobian(F, x, Fx)
+        evaluations += evals_per_iter - 1
+
+        # Solving J Δx = -F(x) (np.linalg.solve uses an LU factorization with partial pivoting):
+        try:
+            step = np.linalg.solve(J, -Fx)
+        except np.linalg.LinAlgError:
+            message = "The Jacobian is singular, so the Newton step has no solution."
+            break
+
+        x += step
+        Fx = np.asarray(F(x), dtype=float)
+        evaluations += 1
+        iterations += 1
+        if callback is not None:
+            callback(iterations, x.copy(), Fx)
+        converged = np.max(np.abs(Fx)) <= precision or np.max(np.abs(step)) <= xtol
+
+    return RootResult(x, iterations, evaluations, not message, perf_counter() - start, message)
+
+
+def broyden(F: Callable, x0: np.ndarray, precision: float, jacobian: Optional[Callable] = None, xtol: float = 0.0, max_iter: int = 1000, max_evals: Optional[int] = None,
+            callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates the root of a system of nonlinear equations using Broyden's (good) method.
+
+    Args:
+        F (Callable): A continuous function that maps a vector of length n to a vector of length n
+        x0 (np.ndarray): The initial guess of the root of the system
+        precision (float): The maximum size of any component of F(x) that is acceptable in method results
+        jacobian (Optional[Callable], optional): A function returning the n by n Jacobian matrix of F, which is only
+            called once at the initial guess. Defaults to None, which approximates it with finite differences.
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of evaluations of F (including those used by
+            finite differences) to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the root and the value of F there. Defaults to None.
+
+    Raises:
+        ValueError: If precision is not greater than zero, if xtol is negative, or if either budget is less than 1.
+
+    Returns:
+        RootResult: A vector which, when passed to F, returns a vector with no component of magnitude > precision,
+            along with the number of iterations and evaluations of F (and of the Jacobian, if given) used.
+    """
+    # Validating Inputs:
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+
+    # Actual Method:
+    start = perf_counter()
+    x = np.array(x0, dtype=float)
+    Fx = np.asarray(F(x), dtype=float)
+    evaluations = 1
+    iterations = 0
+    converged = np.max(np.abs(Fx)) <= precision
+    if converged:
+        return RootResult(x, iterations, evaluations, True, perf_counter() - start)
+
+    # Finding the inverse of the initial Jacobian (the only time it is computed, which is charged to the evaluation budget):
+    evals_for_jacobian = 1 if jacobian is not None else x.size
+    if max_evals is not None and evaluations + evals_for_jacobian > max_evals:
+        return RootResult(x, iterations, evaluations, False, perf_counter() - start, "The evaluation budget was used up.")
+
+    J = np.asarray(jacobian(x), dtype=float) if jacobian is not None else finite_difference_jacobian(F, x, Fx)
+    evaluations += evals_for_jacobian
+    try:
+        H = np.linalg.inv(J)
+    except np.linalg.LinAlgError:
+        return RootResult(x, iterations, evaluations, False, perf_counter() - start, "The Jacobian is singular, so the Newton step has no solution.")
+
+    message = ""
+    while not converged:
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+
+        if max_evals is not None and evaluations >= max_evals:
+            message = "The evaluation budget was used up."
+            break
+
+        step = -H @ Fx
+        x += step
+        F_next = np.asarray(F(x), dtype=float)
+        evaluations += 1
+        iterations += 1
+        if callback is not None:
+            callback(iterations, x.copy(), F_next)
+
+        converged = np.max(np.abs(F_next)) <= precision or np.max(np.abs(step)) <= xtol
+        if converged:
+            break
+
+        # Rank-one update of the inverse Jacobian (Sherman-Morrison):
+        #  H_new = H + (Δx - H ΔF) (Δx^T H) / (Δx^T H ΔF)
+        dF = F_next - Fx
+        H_dF = H @ dF
+        step_H = step @ H
+        denominator = step_H @ dF
+        if denominator != 0:
+            H += np.outer(step - H_dF, step_H) / denominator
+        Fx = F_next
+
+    return RootResult(x, iterations, evaluations, not message, perf_counter() - start, message)
@@ -0,0 +1,174 @@
+# Author: Satya Jhaveri
+#
+# Methods for finding the roots of polynomials.
+#
+# Every polynomial p(x) = x^n + c_1 x^(n-1) + ... + c_n is the characteristic polynomial of its
+#  companion matrix:
+#
+#      [-c_1  -c_2  ...  -c_(n-1)  -c_n]
+#      [  1     0   ...     0        0 ]
+#      [  0     1   ...     0        0 ]
+#      [  :     :           :        : ]
+#      [  0     0   ...     1        0 ]
+#
+#  so the eigenvalues of this matrix are exactly the roots of the polynomial. Finding them with
+#  an eigenvalue solver gives all n (possibly complex) roots at once, without needing any initial
+#  guesses. The roots can then optionally be 'polished' with a few Newton Raphson iterations on the
+#  original polynomial, which removes most of the rounding error introduced by the eigenvalue solver.
+#
+# This file also contains Horner's method for evaluating a polynomial (and its derivative) at many
+#  points at once, which can be used to pass polynomials to the other root finding methods.
+#
+# Coefficients are always given from the highest power of x to the lowest, so [1, -3, 2]
+#  represents x^2 - 3x + 2.
+#
+
+from typing import Callable, Tuple, Union
+
+import numpy as np
+
+
+def horner(coefficients: np.ndarray, x: Union[float, np.ndarray], derivative: bool = False) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Evaluates a polynomial at one or more points using Horner's method.
+
+    Args:
+        coefficients (np.ndarray): The coefficients of the polynomial, from the highest power to the lowest
+        x (Union[float, np.ndarray]): The point(s) to evaluate the polynomial at (may be complex)
+        derivative (bool, optional): Whether to also evaluate the derivative of the polynomial. Defaults to False.
+
+    Raises:
+        ValueError: If there are no coefficients
+
+    Returns:
+        Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]: The value of the polynomial at each point, and if derivative is True,
+            the value of its derivative at each point.
+    """
+    # Validating inputs:
+    if len(coefficients) == 0:
+        raise ValueError("A polynomial must have at least one coefficient.")
+
+    # Actual method:
+    x = np.asarray(x)
+    p = np.full(x.shape, coefficients[0], dtype=np.result_type(x, coefficients[0], float))
+    dp = np.zeros_like(p)
+    for c in coefficients[1:]:
+        if derivative:
+            dp = dp * x + p
+        p = p * x + c
+
+    if derivative:
+        return p, dp
+    return p
+
+
+def polynomial_function(coefficients: np.ndarray) -> Tuple[Callable, Callable]:
+    """
+    Creates functions that evaluate a polynomial and its derivative, for use with the other root finding methods.
+
+    Args:
+        coefficients (np.ndarray): The coefficients of the polynomial, from the highest power to the lowest
+
+    Returns:
+        Tuple[Callable, Callable]: The functions f(x) and df(x)
+    """
+    coefficients = np.array(coefficients)
+    derivative_coefficients = coefficients[:-1] * np.arange(len(coefficients) - 1, 0, -1)
+    if len(derivative_coefficients) == 0:
+        derivative_coefficients = np.zeros(1)
+
+    def f(x): return horner(coefficients, x)
+    def df(x): return horner(derivative_coefficients, x)
+    return f, df
+
+
+def _companion_matrices(coefficients: np.ndarray) -> np.ndarray:
+    # Builds a stack of companion matrices, one for each row of monic coefficients (without the leading 1):
+    m, n = coefficients.shape
+    companion = np.zeros((m, n, n), dtype=coefficients.dtype)
+    companion[:, 0, :] = -coefficients
+    companion[:, np.arange(1, n), np.arange(n - 1)] = 1
+    return companion
+
+
+def _polish(coefficients: np.ndarray, roots: np.ndarray, iterations: int) -> np.ndarray:
+    # Applies Newton Raphson iterations to every root, only keeping steps that reduce |p|:
+    p, dp = horner(coefficients, roots, derivative=True)
+    for _ in range(iterations):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidate = roots - p / dp
+        p_candidate, dp_candidate = horner(coefficients, candidate, derivative=True)
+        better = np.isfinite(candidate) & (np.abs(p_candidate) < np.abs(p))
+        roots = np.where(better, candidate, roots)
+        p, dp = np.where(better, p_candidate, p), np.where(better, dp_candidate, dp)
+    return roots
+
+
+def polynomial_roots(coefficients: np.ndarray, polish: bool = False, polish_iter: int = 3) -> np.ndarray:
+    """
+    Finds all of the roots of a polynomial from the eigenvalues of its companion matrix.
+
+    Args:
+        coefficients (np.ndarray): The coefficients of the polynomial, from the highest power to the lowest
+        polish (bool, optional): Whether to refine the roots with Newton Raphson iterations. Defaults to False.
+        polish_iter (int, optional): The number of Newton Raphson iterations to use when polishing. Defaults to 3.
+
+    Raises:
+        ValueError: If every coefficient is zero
+
+    Returns:
+        np.ndarray: The complex roots of the polynomial, with repeated roots listed once for each multiplicity
+    """
+    # Validating inputs:
+    coefficients = np.trim_zeros(np.atleast_1d(np.asarray(coefficients)), "f")
+    if len(coefficients) == 0:
+        raise ValueError("The polynomial cannot have every coefficient equal to zero.")
+
+    # Actual method:
+    # Trailing zero coefficients are roots at x = 0:
+    trimmed = np.trim_zeros(coefficients, "b")
+    zero_roots = np.zeros(len(coefficients) - len(trimmed), dtype=complex)
+    if len(trimmed) == 1:
+        return zero_roots
+
+    roots = np.linalg.eigvals(_companion_matrices(trimmed[None, 1:] / trimmed[0]))[0]
+    if polish:
+        roots = _polish(trimmed, roots.astype(complex), polish_iter)
+    return np.concatenate((roots.astype(complex), zero_roots))
+
+
+def polynomial_roots_batch(coefficients: np.ndarray, polish: bool = False, polish_iter: int = 3) -> np.ndarray:
+    """
+    Finds all of the roots of many polynomials of the same degree at once.
+
+    Args:
+        coefficients (np.ndarray): An m by (n + 1) array, where each row holds the coefficients of a polynomial of degree n,
+            from the highest power to the lowest
+        polish (bool, optional): Whether to refine the roots with Newton Raphson iterations. Defaults to False.
+        polish_iter (int, optional): The number of Newton Raphson iterations to use when polishing. Defaults to 3.
+
+    Raises:
+        ValueError: If the coefficients are not a two dimensional array, if the polynomials have a degree less than one,
+            or if any polynomial has a leading coefficient of zero.
+
+    Returns:
+        np.ndarray: An m by n array, where each row holds the complex roots of the corresponding polynomial
+    """
+    # Validating inputs:
+    coefficients = np.asarray(coefficients)
+    if coefficients.ndim != 2:
+        raise ValueError("The coefficients must be a two dimensional array.")
+
+    if coefficients.shape[1] < 2:
+        raise ValueError("The polynomials must have a degree of at least one.")
+
+    if np.any(coefficients[:, 0] == 0):
+        raise ValueError("The leading coefficient of each polynomial cannot be zero.")
+
+    # Actual method:
+    roots = np.linalg.eigvals(_companion_matrices(coefficients[:, 1:] / coefficients[:, :1])).astype(complex)
+    if polish:
+        # Horner's method runs down the columns, so every root of every polynomial is polished at once:
+        p_coefficients = coefficients.T[:, :, None]
+        roots = _polish(p_coefficients, roots, polish_iter)
+    return roots
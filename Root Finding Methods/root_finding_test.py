@@ -2,9 +2,20 @@
 # Author: Satya Jhaveri
 
 import unittest
+import asyncio
+import numpy as np
+import dual_numbers
+from async_root_finding import async_bisection, async_secant, async_find_all_roots
 from bisection_method import bisection
+from brent_method import brent
+from continuation import continuation
+from dual_array import DualArray, values_and_derivatives
 from false_position import false_position
-from newton_raphson import newton_raphson
+from fixed_point import fixed_point, anderson
+from newton_raphson import newton_raphson, newton_raphson_batch
+from nonlinear_systems import newton_system, broyden
+from polynomial import horner, polynomial_function, polynomial_roots, polynomial_roots_batch
+from root_scanner import find_all_roots
 from secant_method import secant
 
 
@@ -19,6 +30,79 @@ class TestRootFinding(unittest.TestCase):
             print(e)
         print(f"Number of errors: {len(self.errorList)}")
 
+    def test_async_methods(self) -> None:
+        in_progress, most_in_progress = [0], [0]
+        async def f(x: float) -> float:
+            in_progress[0] += 1
+            most_in_progress[0] = max(most_in_progress[0], in_progress[0])
+            await asyncio.sleep(0)
+            in_progress[0] -= 1
+            return (x-1) * (x+6)
+        precision = 0.0001
+        actual_root = 1
+        
+        # Evaluating several points of the interval on each iteration of the bisection method:
+        for points in [1, 3]:
+            result = asyncio.run(async_bisection(f, 0, 10, precision, points=points))
+            try:
+                self.assertGreaterEqual(precision, abs(result.root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {result.root}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        try:
+            self.assertLess(asyncio.run(async_bisection(f, 0, 10, precision, points=3)).iterations, bisection(lambda x: (x-1) * (x+6), 0, 10, precision).iterations,
+                            msg="Asynchronous bisection method with several points did not use fewer iterations")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        result = asyncio.run(async_secant(f, 0, 5, precision))
+        try:
+            self.assertGreaterEqual(precision, abs(result.root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {result.root}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Stopping on the budgets (checked before every evaluation) and when the interval cannot be split any further:
+        for max_evals in [1, 2, 3, 4]:
+            for name, method in [("Bisection", lambda: async_bisection(f, 0, 10, precision, points=2, max_evals=max_evals)),
+                                 ("Secant", lambda: async_secant(f, 0, 5, precision, max_evals=max_evals))]:
+                result = asyncio.run(method())
+                try:
+                    self.assertGreaterEqual(max_evals, result.evaluations, msg=f"Asynchronous {name} method went over max_evals = {max_evals}")
+                    self.assertFalse(result.converged, msg=f"Asynchronous {name} method converged with max_evals = {max_evals}")
+                    self.assertEqual("The evaluation budget was used up.", result.message, msg=f"Asynchronous {name} method did not report its budget stop")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        
+        async def g(x: float) -> float: return x*x - 2
+        result = asyncio.run(async_bisection(g, 0, 2, 1e-300))
+        try:
+            self.assertFalse(result.converged, msg="Asynchronous bisection method converged when the interval could not be split any further")
+            self.assertEqual("The interval cannot be split any further.", result.message, msg="Asynchronous bisection method did not report that the interval could not be split")
+            self.assertEqual(bisection(lambda x: x*x - 2, 0, 2, 1e-300).message, result.message, msg="Asynchronous and synchronous bisection methods disagree")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Scanning for every root, with a limit on the number of evaluations in progress:
+        most_in_progress[0] = 0
+        result = asyncio.run(async_find_all_roots(f, -10, 10, precision, n=30, concurrency=4))
+        try:
+            self.assertEqual(2, len(result.root), msg=f"Wrong number of roots found: {result.root}")
+            self.assertGreaterEqual(precision, max(abs(result.root[0] + 6), abs(result.root[1] - 1)), msg=f"Not precise enough: {result.root}")
+            self.assertTrue(1 < most_in_progress[0] <= 4, msg="Asynchronous root scan did not evaluate concurrently within the limit")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, asyncio.run, async_bisection(f, -20, -10, precision))
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when f(lower) and f(upper) have same sign")
+        
+        try:
+            self.assertRaises(ValueError, asyncio.run, async_secant(f, 0, 10, -0.12345))
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when precision <= 0")
+
     def test_bisection(self) -> None:
         def f(x: float) -> float: return (x-1) * (x+6)
         precision = 0.0001
@@ -26,7 +110,7 @@ class TestRootFinding(unittest.TestCase):
         # Finding the left root (x = -6):
         lower, upper = -10, 0
         actual_root = -6
-        approximated_root = bisection(f, lower, upper, precision)
+        approximated_root = bisection(f, lower, upper, precision).root
         
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
@@ -37,7 +121,7 @@ class TestRootFinding(unittest.TestCase):
         # Finding the right root (x = 1):
         lower, upper = 0, 10
         actual_root = 1
-        approximated_root = bisection(f, lower, upper, precision)
+        approximated_root = bisection(f, lower, upper, precision).root
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
         except AssertionError as e:
@@ -66,6 +150,255 @@ class TestRootFinding(unittest.TestCase):
         except AssertionError as e:
             self.errorList.append("ValueError not raised when precision <= 0")
 
+    def test_brent(self) -> None:
+        def f(x: float) -> float: return (x-1) * (x+6)
+        precision = 0.0001
+        
+        # Finding the left root (x = -6):
+        lower, upper = -10, 0
+        actual_root = -6
+        result = brent(f, lower, upper, precision)
+        
+        try:
+            self.assertGreaterEqual(precision, abs(result.root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {result.root}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Finding the right root (x = 1) to machine precision:
+        lower, upper = 0, 10
+        actual_root = 1
+        result = brent(f, lower, upper, 1e-300)
+        try:
+            self.assertTrue(result.converged, msg="Brent's method did not converge")
+            self.assertGreaterEqual(1e-15, abs(result.root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {result.root}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Using fewer function evaluations than the bisection method:
+        def g(x: float) -> float: return x**3 - 2*x - 5
+        try:
+            self.assertLess(brent(g, 2, 3, 1e-12).evaluations, bisection(g, 2, 3, 1e-12).evaluations // 2, msg="Brent's method not using fewer evaluations than bisection")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        # Invalid values of lower and upper:
+        lower, upper = 0, 0  # Lower = upper
+        try:
+            self.assertRaises(ValueError, brent, f, lower, upper, precision)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when lower == upper")
+            
+        lower, upper = -20,-10  # f(lower) and f(upper) have same sign
+        try:
+            self.assertRaises(ValueError, brent, f, lower, upper, precision)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when f(lower) and f(upper) have same sign")
+        
+        # Negative Precision
+        lower, upper = 0, 10
+        precision = -0.12345
+        try:
+            self.assertRaises(ValueError, brent, f, lower, upper, precision)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when precision <= 0")
+
+    def test_callbacks(self) -> None:
+        def f(x: float) -> float: return (x-1) * (x+6)
+        def df(x: float) -> float: return 2*x + 5
+        precision = 1e-10
+        
+        # The callback should be called once per iteration, with the latest estimate and the value of f there:
+        for name, method, args in [("bisection", bisection, (f, 0, 3)), ("false position", false_position, (f, 0, 3)),
+                                   ("secant", secant, (f, 0, 3)), ("Brent", brent, (f, 0, 3)), ("Newton Raphson", newton_raphson, (f, df, 3))]:
+            trace = []
+            result = method(*args, precision, callback=lambda *values: trace.append(values))
+            try:
+                self.assertEqual(result.iterations, len(trace), msg=f"{name} callback not called once per iteration")
+                self.assertEqual(list(range(1, result.iterations + 1)), [values[0] for values in trace], msg=f"{name} callback given incorrect iteration numbers")
+                self.assertEqual((result.root, f(result.root)), trace[-1][1:], msg=f"{name} callback given incorrect estimate")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # The methods that work on arrays or systems should be given copies of the estimates, once per iteration:
+        def F(x: np.ndarray) -> np.ndarray: return np.array([x[0]**2 + x[1]**2 - 4, x[0] - x[1]])
+        for name, method, args in [("batched Newton Raphson", newton_raphson_batch, (f, np.array([3.0, -9.0]))),
+                                   ("Newton's method for systems", newton_system, (F, np.array([1.0, 2.0]))),
+                                   ("Broyden's method", broyden, (F, np.array([1.0, 2.0]))),
+                                   ("fixed point iteration", fixed_point, (np.cos, 1.0)), ("Anderson acceleration", anderson, (np.cos, np.array([1.0, 0.5]))),
+                                   ("root scanner", find_all_roots, (np.sin, 1, 10))]:
+            trace = []
+            result = method(*args, precision, callback=lambda *values: trace.append(values))
+            try:
+                self.assertEqual(result.iterations, len(trace), msg=f"{name} callback not called once per iteration")
+                self.assertEqual(list(range(1, result.iterations + 1)), [values[0] for values in trace], msg=f"{name} callback given incorrect iteration numbers")
+                self.assertTrue(np.allclose(result.root, trace[-1][1]), msg=f"{name} callback given incorrect estimate")
+                self.assertFalse(isinstance(result.root, np.ndarray) and any(values[1] is result.root for values in trace), msg=f"{name} callback not given a copy of the estimate")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # The continuation method calls it once per parameter value:
+        trace = []
+        result = continuation(lambda x, p: x**3 + x - p, 0.0, np.linspace(0, 2, 11), precision, callback=lambda *values: trace.append(values))
+        try:
+            self.assertEqual(list(range(1, 12)), [values[0] for values in trace], msg="Continuation callback not called once per parameter value")
+            self.assertEqual(list(zip(result.parameters, result.roots)), [values[1:] for values in trace], msg="Continuation callback given incorrect roots")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+    
+    def test_continuation(self) -> None:
+        def f(x: float, p: float) -> float: return x**3 + x - p
+        precision = 1e-12
+        
+        # Tracking the root as p sweeps from 0 to 10:
+        parameters = np.linspace(0, 10, 1001)
+        result = continuation(f, 0.0, parameters, precision)
+        try:
+            self.assertTrue(result.converged, msg="Continuation method did not converge")
+            self.assertEqual(len(parameters), len(result.roots), msg="Continuation method did not find a root for every parameter")
+            self.assertGreaterEqual(precision, max(abs(f(x, p)) for x, p in zip(result.roots, result.parameters)), msg="Continuation method not precise enough")
+            self.assertGreaterEqual(2, max(result.iterations[1:]), msg="Continuation method using more than two iterations per root")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Using given derivatives:
+        result = continuation(f, 0.0, parameters, precision, lambda x, p: 3*x*x + 1, lambda x, p: -1)
+        try:
+            self.assertTrue(result.converged, msg="Continuation method did not converge with given derivatives")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # The roots of x^2 - p have a turning point at p = 0:
+        result = continuation(lambda x, p: x*x - p, 1.0, np.linspace(1, -1, 201), precision)
+        try:
+            self.assertFalse(result.converged, msg="Continuation method did not stop at a turning point")
+            self.assertEqual(1, len(result.turning_points), msg="Turning point not detected")
+            self.assertGreaterEqual(1e-6, abs(result.turning_points[0]), msg=f"Turning point detected at the wrong place: {result.turning_points[0]}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, continuation, f, 0.0, parameters, -0.12345)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when precision <= 0")
+
+    def test_evaluation_budgets(self) -> None:
+        calls = [0]
+        def f(x: float) -> float:
+            calls[0] += 1
+            return (x-1) * (x+6)
+        def df(x: float) -> float:
+            calls[0] += 1
+            return 2 * x + 5
+        precision = 1e-12
+        
+        # Each method should report every evaluation it makes, and only make one new evaluation per iteration:
+        for name, method, args, evals_per_iter in [("Bisection", bisection, (f, 0, 10), 1), ("False position", false_position, (f, 0, 10), 1),
+                                                   ("Secant", secant, (f, 0, 5), 1), ("Brent", brent, (f, 0, 10), 1),
+                                                   ("Newton Raphson", newton_raphson, (f, df, 10), 2)]:
+            calls[0] = 0
+            result = method(*args, precision)
+            try:
+                self.assertTrue(result.converged, msg=f"{name} method did not converge")
+                self.assertEqual(calls[0], result.evaluations, msg=f"{name} method did not report the correct number of evaluations")
+                self.assertLessEqual(result.evaluations, 2 + evals_per_iter * (result.iterations + 1), msg=f"{name} method used more than one new evaluation per iteration")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            # Limiting the number of iterations and evaluations:
+            result = method(*args, precision, max_iter=2)
+            try:
+                self.assertFalse(result.converged, msg=f"{name} method reported convergence after exceeding max_iter")
+                self.assertLessEqual(result.iterations, 2, msg=f"{name} method exceeded max_iter")
+                self.assertEqual("The iteration budget was used up.", result.message, msg=f"{name} method gave the wrong reason for stopping")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            calls[0] = 0
+            result = method(*args, precision, max_evals=5)
+            try:
+                self.assertLessEqual(calls[0], 5, msg=f"{name} method exceeded max_evals")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            try:
+                self.assertRaises(ValueError, method, *args, precision, max_iter=0)
+            except AssertionError:
+                self.errorList.append(f"ValueError not raised in {name} method when max_iter < 1")
+        
+        # The budget should be checked before every evaluation, even the first few:
+        for name, method, args in [("Bisection", bisection, (f, 0, 10)), ("False position", false_position, (f, 0, 10)), ("Secant", secant, (f, 0, 5)),
+                                   ("Brent", brent, (f, 0, 10)), ("Newton Raphson", newton_raphson, (f, df, 10))]:
+            for max_evals in [1, 2, 3]:
+                calls[0] = 0
+                result = method(*args, precision, max_evals=max_evals)
+                try:
+                    self.assertLessEqual(calls[0], max_evals, msg=f"{name} method exceeded max_evals = {max_evals}")
+                    self.assertFalse(result.converged, msg=f"{name} method reported convergence after exceeding max_evals = {max_evals}")
+                    self.assertEqual("The evaluation budget was used up.", result.message, msg=f"{name} method gave the wrong reason for stopping")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        
+        # A precision that cannot be met should not be reported as met once the interval cannot be split any further:
+        for name, method in [("Bisection", bisection), ("False position", false_position)]:
+            result = method(lambda x: x*x - 2, 0, 2, 1e-300)
+            try:
+                self.assertFalse(result.converged, msg=f"{name} method reported convergence without meeting the precision")
+                self.assertEqual("The interval cannot be split any further.", result.message, msg=f"{name} method gave the wrong reason for stopping")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # Newton Raphson cannot continue from a point where the derivative is zero:
+        result = newton_raphson(lambda x: x*x + 1, lambda x: 2*x, 0.0, precision)
+        try:
+            self.assertFalse(result.converged, msg="Newton Raphson method reported convergence at a zero derivative")
+            self.assertIn("derivative is zero", result.message, msg="Newton Raphson method did not record why it stopped")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+
+    def test_find_all_roots(self) -> None:
+        precision = 1e-12
+        
+        # Finding every root of sin(x) in [-0.5, 50]:
+        actual_roots = np.pi * np.arange(16)
+        result = find_all_roots(np.sin, -0.5, 50, precision, n=200)
+        try:
+            self.assertEqual(len(actual_roots), len(result.root), msg=f"Wrong number of roots found:\n\tActual Roots = {actual_roots}, Approximated Roots = {result.root}")
+            self.assertGreaterEqual(1e-10, np.max(np.abs(result.root - actual_roots)), msg=f"Not precise enough:\n\tActual Roots = {actual_roots}, Approximated Roots = {result.root}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Two roots closer together than the grid spacing are only found with adaptive refinement:
+        def f(x: np.ndarray) -> np.ndarray: return (x - 1.03) * (x - 1.0305) * (x + 3.01)
+        actual_roots = np.array([-3.01, 1.03, 1.0305])
+        result = find_all_roots(f, -5, 5, precision, n=100, adaptive=True)
+        try:
+            self.assertEqual(len(actual_roots), len(result.root), msg=f"Adaptive refinement did not find close roots:\n\tActual Roots = {actual_roots}, Approximated Roots = {result.root}")
+            self.assertGreaterEqual(1e-10, np.max(np.abs(result.root - actual_roots)), msg=f"Not precise enough:\n\tActual Roots = {actual_roots}, Approximated Roots = {result.root}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Many grid points are within precision of a multiple root, but they are still only one root:
+        for g, name in ((lambda x: (x - 1) ** 3, "(x - 1)^3"), (lambda x: (x - 1) ** 2, "(x - 1)^2")):
+            result = find_all_roots(g, 0, 2, 1e-6, n=2000)
+            try:
+                self.assertEqual(1, len(result.root), msg=f"Multiple root of {name} found more than once:\n\tApproximated Roots = {result.root}")
+                self.assertGreaterEqual(1e-2, abs(result.root[0] - 1), msg=f"Not precise enough for {name}:\n\tActual Root = 1, Approximated Root = {result.root[0]}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, find_all_roots, f, 0, 0, precision)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when lower == upper")
+        
+        try:
+            self.assertRaises(ValueError, find_all_roots, f, -5, 5, -0.12345)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when precision <= 0")
+
     def test_false_position(self) -> None:
         def f(x: float) -> float: return (x-1) * (x+6)
         precision = 0.0001
@@ -73,7 +406,7 @@ class TestRootFinding(unittest.TestCase):
         # Finding the left root (x = -6):
         lower, upper = -10, 0
         actual_root = -6
-        approximated_root = false_position(f, lower, upper, precision)
+        approximated_root = false_position(f, lower, upper, precision).root
         
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
@@ -84,7 +417,7 @@ class TestRootFinding(unittest.TestCase):
         # Finding the right root (x = 1):
         lower, upper = 0, 10
         actual_root = 1
-        approximated_root = false_position(f, lower, upper, precision)
+        approximated_root = false_position(f, lower, upper, precision).root
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
         except AssertionError as e:
@@ -113,6 +446,65 @@ class TestRootFinding(unittest.TestCase):
         except AssertionError as e:
             self.errorList.append("ValueError not raised when precision <= 0")
 
+    def test_fixed_point(self) -> None:
+        from math import cos
+        actual_root = 0.7390851332151607  # (The solution of x = cos(x))
+        precision = 1e-10
+        
+        evaluations = {}
+        for method in ["plain", "aitken", "steffensen"]:
+            result = fixed_point(cos, 1.0, precision, method)
+            evaluations[method] = result.evaluations
+            try:
+                self.assertTrue(result.converged, msg=f"Fixed point iteration ({method}) did not converge")
+                self.assertGreaterEqual(1e-8, abs(result.root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {result.root}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        try:
+            self.assertLess(evaluations["aitken"], evaluations["plain"], msg="Aitken's process did not use fewer evaluations than plain iteration")
+            self.assertLess(evaluations["steffensen"], evaluations["aitken"], msg="Steffensen's method did not use fewer evaluations than Aitken's process")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Stopping on the evaluation budget, including Steffensen's method, which uses two evaluations per iteration:
+        for method in ["plain", "aitken", "steffensen"]:
+            for max_evals in [1, 2, 3, 4, 5, 6]:
+                result = fixed_point(cos, 1.0, precision, method, max_evals=max_evals)
+                try:
+                    self.assertGreaterEqual(max_evals, result.evaluations, msg=f"Fixed point iteration ({method}) went over max_evals = {max_evals}")
+                    self.assertFalse(result.converged, msg=f"Fixed point iteration ({method}) converged with max_evals = {max_evals}")
+                    self.assertEqual("The evaluation budget was used up.", result.message, msg=f"Fixed point iteration ({method}) did not report its budget stop")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        
+        # Anderson acceleration on a system of equations x = Mx + b + sin(x)/20:
+        rng = np.random.default_rng(1)
+        n = 50
+        Q = np.linalg.qr(rng.normal(size=(n, n)))[0]
+        M = Q @ np.diag(np.linspace(-0.5, 0.95, n)) @ Q.T
+        b = rng.normal(size=n)
+        def g(x: np.ndarray) -> np.ndarray: return M @ x + b + 0.05 * np.sin(x)
+        plain, accelerated = anderson(g, np.zeros(n), precision, depth=0), anderson(g, np.zeros(n), precision, depth=5)
+        try:
+            self.assertTrue(accelerated.converged, msg="Anderson acceleration did not converge")
+            self.assertGreaterEqual(precision, np.max(np.abs(g(accelerated.root) - accelerated.root)), msg="Anderson acceleration not precise enough")
+            self.assertLess(accelerated.iterations, plain.iterations / 2, msg="Anderson acceleration did not use fewer iterations than plain iteration")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, fixed_point, cos, 1.0, -0.12345)
+            self.assertRaises(ValueError, anderson, g, np.zeros(n), -0.12345)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when precision <= 0")
+        
+        try:
+            self.assertRaises(ValueError, fixed_point, cos, 1.0, precision, "newton")
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when the method is not recognised")
+
     def test_newton_raphson(self) -> None:
         def f(x: float) -> float: return (x-1) * (x+6)
         def df(x: float) -> float: return 2 * x + 5
@@ -121,7 +513,7 @@ class TestRootFinding(unittest.TestCase):
         # Finding the left root (x = -6):
         initial = -10
         actual_root = -6
-        approximated_root = newton_raphson(f, df, initial, precision)
+        approximated_root = newton_raphson(f, df, initial, precision).root
         
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
@@ -132,7 +524,7 @@ class TestRootFinding(unittest.TestCase):
         initial = 10
         precision = 0.0001
         actual_root = 1
-        approximated_root = newton_raphson(f, df, initial, precision)
+        approximated_root = newton_raphson(f, df, initial, precision).root
         
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
@@ -147,6 +539,158 @@ class TestRootFinding(unittest.TestCase):
         except AssertionError as e:
             self.errorList.append("ValueError not raised when precision <= 0")
 
+    def test_newton_raphson_autodiff(self) -> None:
+        def f(x: float) -> float: return (x-1) * (x+6)
+        precision = 0.0001
+        
+        # Finding the right root without a derivative, using one evaluation per iteration:
+        initial = 10
+        actual_root = 1
+        result = newton_raphson(f, None, initial, precision)
+        try:
+            self.assertGreaterEqual(precision, abs(result.root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {result.root}")
+            self.assertEqual(result.iterations + 1, result.evaluations, msg="Automatic differentiation used more than one evaluation per iteration")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Using the elementary functions for dual numbers:
+        def g(x: float) -> float: return dual_numbers.cos(x) - x
+        actual_root = 0.7390851332151607
+        result = newton_raphson(g, None, 1, 1e-12)
+        try:
+            self.assertGreaterEqual(1e-12, abs(result.root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {result.root}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Finding many roots at once (the square roots of a):
+        a = np.array([2.0, 9.0, 10.0, 1e4])
+        result = newton_raphson_batch(lambda x: np.square(x) - a, np.ones(4), 1e-10)
+        try:
+            self.assertTrue(result.converged, msg="Batched Newton Raphson method did not converge")
+            self.assertGreaterEqual(1e-10, np.max(np.abs(result.root - np.sqrt(a))), msg=f"Not precise enough:\n\tActual Roots = {np.sqrt(a)}, Approximated Roots = {result.root}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Powers with a constant exponent should use the power rule, which (unlike log(x)) is defined at x = 0:
+        x = np.array([0.0, 1.0, 2.0])
+        for exponent, derivative in [(0, [0, 0, 0]), (1, [1, 1, 1]), (2, [0, 2, 4]), (DualArray(np.full(3, 2.0)), [0, 2, 4])]:
+            try:
+                self.assertEqual(derivative, list(values_and_derivatives(lambda x: x**exponent, x)[1]), msg=f"Incorrect derivative of x**{exponent}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # Storing the result of a ufunc in an existing array would lose the derivatives:
+        try:
+            self.assertRaisesRegex(TypeError, "out=", np.sin, DualArray(x, np.ones(3)), out=np.empty(3))
+        except AssertionError:
+            self.errorList.append("Clear TypeError not raised when a ufunc is given out=")
+        
+        # Passing Invalid Values:
+        # Negative Precision:
+        try:
+            self.assertRaises(ValueError, newton_raphson, f, None, initial, -0.12345)
+            self.assertRaises(ValueError, newton_raphson_batch, f, np.ones(4), -0.12345)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when precision <= 0")
+
+    def test_nonlinear_systems(self) -> None:
+        # Broyden's tridiagonal system of n equations:
+        def F(x: np.ndarray) -> np.ndarray:
+            previous, following = np.concatenate(([0], x[:-1])), np.concatenate((x[1:], [0]))
+            return (3 - 2*x) * x - previous - 2 * following + 1
+        def J(x: np.ndarray) -> np.ndarray:
+            return np.diag(3 - 4*x) - np.eye(len(x), k=-1) - 2 * np.eye(len(x), k=1)
+        n = 100
+        initial = -np.ones(n)
+        precision = 1e-10
+        
+        for name, method in [("Newton's method for systems", newton_system), ("Broyden's method", broyden)]:
+            for jacobian in [J, None]:
+                result = method(F, initial, precision, jacobian)
+                try:
+                    self.assertTrue(result.converged, msg=f"{name} did not converge")
+                    self.assertGreaterEqual(precision, np.max(np.abs(F(result.root))), msg=f"{name} not precise enough")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        
+        # Broyden's method only needs the Jacobian once, so should use far fewer evaluations:
+        try:
+            self.assertLess(broyden(F, initial, precision).evaluations, newton_system(F, initial, precision).evaluations / 2, msg="Broyden's method not using fewer evaluations than Newton's method")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Both methods stop without converging on a singular Jacobian, and charge every Jacobian to the evaluation budget:
+        def G(x: np.ndarray) -> np.ndarray: return np.array([x[0] + x[1] - 1, 2*x[0] + 2*x[1] - 3])
+        for name, method in [("Newton's method for systems", newton_system), ("Broyden's method", broyden)]:
+            result = method(G, np.zeros(2), precision)
+            try:
+                self.assertFalse(result.converged, msg=f"{name} converged with a singular Jacobian")
+                self.assertEqual("The Jacobian is singular, so the Newton step has no solution.", result.message, msg=f"{name} did not report a singular Jacobian")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            for max_evals in range(1, n + 3):
+                result = method(F, initial, precision, max_evals=max_evals)
+                try:
+                    self.assertGreaterEqual(max_evals, result.evaluations, msg=f"{name} went over max_evals = {max_evals}")
+                    self.assertEqual("The evaluation budget was used up.", result.message, msg=f"{name} did not report its budget stop with max_evals = {max_evals}")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        
+        # Passing Invalid Values:
+        # Negative Precision:
+        try:
+            self.assertRaises(ValueError, newton_system, F, initial, -0.12345)
+            self.assertRaises(ValueError, broyden, F, initial, -0.12345)
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when precision <= 0")
+
+    def test_polynomial_roots(self) -> None:
+        # (x-1)(x+6)(x^2+4) = x^4 + 5x^3 - 2x^2 + 20x - 24:
+        coefficients = [1, 5, -2, 20, -24]
+        actual_roots = np.sort_complex(np.array([-6, 1, -2j, 2j]))
+        precision = 1e-10
+        
+        for polish in [False, True]:
+            approximated_roots = np.sort_complex(polynomial_roots(coefficients, polish=polish))
+            try:
+                self.assertGreaterEqual(precision, np.max(np.abs(approximated_roots - actual_roots)), msg=f"Not precise enough:\n\tActual Roots = {actual_roots}, Approximated Roots = {approximated_roots}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # Leading and trailing zero coefficients:
+        approximated_roots = np.sort_complex(polynomial_roots([0, 1, 5, -6, 0]))
+        try:
+            self.assertGreaterEqual(precision, np.max(np.abs(approximated_roots - np.array([-6, 0, 1]))), msg=f"Roots at zero not found: {approximated_roots}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Many polynomials at once, (x-1)(x+6) and (x-2)(x-3):
+        approximated_roots = np.sort(polynomial_roots_batch([[1, 5, -6], [1, -5, 6]], polish=True), axis=1)
+        try:
+            self.assertGreaterEqual(precision, np.max(np.abs(approximated_roots - np.array([[-6, 1], [2, 3]]))), msg=f"Batched roots not precise enough: {approximated_roots}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Using Horner's method with the other root finding methods:
+        f, df = polynomial_function([1, 5, -6])
+        try:
+            self.assertEqual(list(horner([1, 5, -6], np.array([1.0, 2.0]))), [0.0, 8.0], msg="Horner's method not evaluating correctly")
+            self.assertGreaterEqual(0.0001, abs(newton_raphson(f, df, 10, 0.0001).root - 1), msg="Horner's method not working with the Newton Raphson method")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, polynomial_roots, [0, 0, 0])
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when every coefficient is zero")
+        
+        try:
+            self.assertRaises(ValueError, polynomial_roots_batch, [[0, 1, 2], [1, 2, 3]])
+        except AssertionError as e:
+            self.errorList.append("ValueError not raised when a leading coefficient is zero")
+
     def test_secant(self) -> None:
          # Basic testing:
         precision = 0.0001
@@ -156,7 +700,7 @@ class TestRootFinding(unittest.TestCase):
         # Finding the left root (x = -6):
         x1, x2 = -10, -5
         actual_root = -6
-        approximated_root = secant(f, x1, x2, precision)
+        approximated_root = secant(f, x1, x2, precision).root
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
         except AssertionError as e:
@@ -166,7 +710,7 @@ class TestRootFinding(unittest.TestCase):
         x1, x2 = 0, 5
         precision = 0.0001
         actual_root = 1
-        approximated_root = secant(f, x1, x2, precision)
+        approximated_root = secant(f, x1, x2, precision).root
         try:
             self.assertGreaterEqual(precision, abs(approximated_root - actual_root), msg=f"Not precise enough:\n\tActual Root = {actual_root}, Approximated Root = {approximated_root}")
         except AssertionError as e:
@@ -0,0 +1,32 @@
+# Author: Satya Jhaveri
+#
+# A small container for the output of the root finding methods.
+# As well as the approximated root, it records how much work the method did to find it
+#  (the number of iterations and the number of times the function was evaluated), whether
+#  the required precision was actually met (and if not, why the method stopped), and how long
+#  the method took to run.
+#
+
+from dataclasses import dataclass
+
+
+@dataclass
+class RootResult:
+    """
+    The result of a root finding method.
+
+    Attributes:
+        root (float): The approximated root of the function
+        iterations (int): The number of iterations the method performed
+        evaluations (int): The number of times the function was evaluated
+        converged (bool): Whether the method met the required precision
+        elapsed (float): The time (in seconds) the method took to run
+        message (str): Why the method stopped without meeting the required precision (empty if it converged, or if the
+            method does not record a reason)
+    """
+    root: float
+    iterations: int
+    evaluations: int
+    converged: bool
+    elapsed: float
+    message: str = ""
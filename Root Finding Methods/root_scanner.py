@@ -0,0 +1,212 @@
+# Author: Satya Jhaveri
+#
+# The bracketing methods (bisection, false position, Brent's method) all need to be given an
+#  interval that contains a root. This file contains a method that finds every root of a
+#  function in an interval, without being given any brackets.
+#
+# It works by sampling the function on a grid of points, then looking for consecutive points
+#  where the function changes sign. By the Intermediate Value Theorem, each of these intervals
+#  contains a root. All of these brackets are then refined at the same time with a vectorized
+#  version of the Illinois method (a version of the false position method that halves the
+#  function value of an endpoint that has been kept for two iterations in a row, which stops one
+#  side of the bracket from getting stuck and gives superlinear convergence).
+#
+# Two roots that are closer together than the spacing of the grid do not produce a sign change.
+#  When adaptive refinement is turned on, the grid is made finer around any point where the
+#  magnitude of the function dips towards zero without changing sign, which is what such a pair
+#  of roots looks like on a coarse grid.
+#
+
+from sys import float_info
+from time import perf_counter
+from typing import Callable, Optional
+
+import numpy as np
+
+from root_result import RootResult
+
+
+def bracket_batch(f: Callable, lower: np.ndarray, upper: np.ndarray, precision: float, f_lower: Optional[np.ndarray] = None,
+                  f_upper: Optional[np.ndarray] = None, xtol: float = 0.0, max_iter: int = 100, callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates the roots inside many brackets at once, using a vectorized Illinois (modified false position) method.
+
+    Args:
+        f (Callable): A continuous function that acts elementwise on an array
+        lower (np.ndarray): The lower bounds of the intervals which contain the roots
+        upper (np.ndarray): The upper bounds of the intervals which contain the roots
+        precision (float): The maximum amount of error that is acceptable in method results
+        f_lower (Optional[np.ndarray], optional): The values of f at the lower bounds, if already known. Defaults to None.
+        f_upper (Optional[np.ndarray], optional): The values of f at the upper bounds, if already known. Defaults to None.
+        xtol (float, optional): The width of interval that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 100.
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            array of current estimates of the roots and the values of f there. Defaults to None.
+
+    Raises:
+        ValueError: If precision is not greater than 0, if the bounds have different shapes, if any lower bound is not less
+            than its upper bound, if f has the same sign at both ends of any interval, if xtol is negative,
+            or if max_iter is less than 1.
+
+    Returns:
+        RootResult: An array of values which, when passed to f, return numbers of magnitude < precision. Evaluations are
+            counted as vectorized calls to f, and the result is only marked as converged if every root met the precision.
+    """
+    # Validating inputs:
+    lower, upper = np.array(lower, dtype=float), np.array(upper, dtype=float)
+    if lower.shape != upper.shape:
+        raise ValueError("The lower and upper bounds must have the same shape.")
+
+    if np.any(lower >= upper):
+        raise ValueError("Lower cannot be greater than or equal to upper.")
+
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+
+    if max_iter < 1:
+        raise ValueError("The maximum number of iterations cannot be less than one.")
+
+    start = perf_counter()
+    evaluations = 0
+    if f_lower is None:
+        f_lower = f(lower)
+        evaluations += 1
+    if f_upper is None:
+        f_upper = f(upper)
+        evaluations += 1
+    f_lower, f_upper = np.array(f_lower, dtype=float), np.array(f_upper, dtype=float)
+
+    if np.any(f_lower * f_upper > 0):
+        raise ValueError("f(lower) and f(upper) must have different signs.")
+
+    # Actual method:
+    # Starting from whichever endpoint is closer to being a root:
+    roots = np.where(np.abs(f_lower) <= np.abs(f_upper), lower, upper)
+    f_roots = np.where(np.abs(f_lower) <= np.abs(f_upper), f_lower, f_upper)
+    done = (np.abs(f_lower) <= precision) | (np.abs(f_upper) <= precision)
+    side = np.zeros(lower.shape, dtype=int)  # Which endpoint was replaced last (-1 for lower, 1 for upper)
+    iterations = 0
+
+    while not done.all() and iterations < max_iter:
+        active = np.flatnonzero(~done)
+        a, b = lower[active], upper[active]
+        fa, fb = f_lower[active], f_upper[active]
+
+        # Finding the root of the secant line, falling back to the midpoint if it is not strictly inside the bracket:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = (a * fb - b * fa) / (fb - fa)
+        outside = ~((c > a) & (c < b))
+        c[outside] = 0.5 * (a[outside] + b[outside])
+
+        fc = np.asarray(f(c), dtype=float)
+        evaluations += 1
+        iterations += 1
+        roots[active], f_roots[active] = c, fc
+
+        # Choosing the range for the new intervals, halving the value at an endpoint that is kept twice in a row:
+        replace_upper = fc * fb > 0
+        replace_lower = fc * fa > 0
+        s = side[active]
+        fa = np.where(replace_upper & (s == 1), 0.5 * fa, fa)
+        fb = np.where(replace_lower & (s == -1), 0.5 * fb, fb)
+        a, fa = np.where(replace_lower, c, a), np.where(replace_lower, fc, fa)
+        b, fb = np.where(replace_upper, c, b), np.where(replace_upper, fc, fb)
+        side[active] = np.where(replace_upper, 1, np.where(replace_lower, -1, s))
+        lower[active], upper[active], f_lower[active], f_upper[active] = a, b, fa, fb
+
+        tol = xtol + 4 * float_info.epsilon * np.abs(c)
+        done[active] = (np.abs(fc) <= precision) | (b - a <= tol)
+        if callback is not None:
+            callback(iterations, roots.copy(), f_roots.copy())
+
+    return RootResult(roots, iterations, evaluations, bool(done.all()), perf_counter() - start)
+
+
+def find_all_roots(f: Callable, lower: float, upper: float, precision: float, n: int = 1000, adaptive: bool = False,
+                   max_depth: int = 6, refine: int = 8, xtol: float = 0.0, max_iter: int = 100, callback: Optional[Callable] = None) -> RootResult:
+    """
+    Approximates all of the roots of a function in an interval, by scanning a grid of points for sign changes.
+
+    Args:
+        f (Callable): A continuous function that acts elementwise on an array
+        lower (float): The lower bound of the interval to search
+        upper (float): The upper bound of the interval to search
+        precision (float): The maximum amount of error that is acceptable in method results
+        n (int, optional): The number of subintervals in the initial grid. Defaults to 1000.
+        adaptive (bool, optional): Whether to refine the grid where the function suggests there are two close roots.
+            Defaults to False.
+        max_depth (int, optional): The maximum number of times the grid is refined. Defaults to 6.
+        refine (int, optional): The number of new points added around each suspicious point per refinement. Defaults to 8.
+        xtol (float, optional): The width of interval that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations of the bracketing method. Defaults to 100.
+        callback (Optional[Callable], optional): A function called after each iteration of the bracketing method (see
+            bracket_batch). Defaults to None.
+
+    Raises:
+        ValueError: If precision is not greater than 0, if lower >= upper, if n is less than 1, or if refine is less than 1.
+
+    Returns:
+        RootResult: A sorted array of every root found. Evaluations are counted as vectorized calls to f.
+    """
+    # Validating inputs:
+    if lower >= upper:
+        raise ValueError("Lower cannot be greater than or equal to upper.")
+
+    if precision <= 0:
+        raise ValueError("Precision cannot be zero or negative.")
+
+    if n < 1 or refine < 1:
+        raise ValueError("The number of grid points cannot be less than one.")
+
+    # Actual method:
+    start = perf_counter()
+    x = np.linspace(lower, upper, n + 1)
+    y = np.asarray(f(x), dtype=float)
+    evaluations = 1
+
+    for _ in range(max_depth if adaptive else 0):
+        # Looking for interior points where |f| has a local minimum without f changing sign, and the dip towards zero
+        #  is at least as large as the distance left to zero:
+        left, mid, right = np.abs(y[:-2]), np.abs(y[1:-1]), np.abs(y[2:])
+        same_sign = (y[:-2] * y[1:-1] > 0) & (y[1:-1] * y[2:] > 0)
+        suspicious = np.flatnonzero(same_sign & (mid < left) & (mid < right) & (mid <= np.maximum(left, right) - mid)) + 1
+        if suspicious.size == 0:
+            break
+
+        # Sampling every suspicious region at once with a finer grid:
+        t = np.linspace(0, 1, refine + 2)[1:-1]
+        new_x = (x[suspicious - 1, None] + t * (x[suspicious + 1] - x[suspicious - 1])[:, None]).ravel()
+        new_y = np.asarray(f(new_x), dtype=float)
+        evaluations += 1
+
+        x, indices = np.unique(np.concatenate((x, new_x)), return_index=True)
+        y = np.concatenate((y, new_y))[indices]
+
+    # Grid points within precision of zero come in runs around each root (many points long around a multiple root), so each
+    #  run gives one root: the point in it closest to zero if that point is an exact root, or if f does not change sign
+    #  across the run, and otherwise the root found by refining the bracket around the run:
+    near = np.concatenate(([False], np.abs(y) <= precision, [False]))
+    exact, run_lower, run_upper = [], [], []
+    for first, last in zip(np.flatnonzero(~near[:-1] & near[1:]), np.flatnonzero(near[:-1] & ~near[1:]) - 1):
+        closest = first + np.argmin(np.abs(y[first:last + 1]))
+        if y[closest] != 0 and first > 0 and last < len(y) - 1 and y[first - 1] * y[last + 1] < 0:
+            run_lower.append(first - 1)
+            run_upper.append(last + 1)
+        else:
+            exact.append(x[closest])
+    exact = np.array(exact)
+
+    # Refining every sign change (and every bracketed run) at once:
+    changes = np.flatnonzero(y[:-1] * y[1:] < 0)
+    changes = changes[(np.abs(y[changes]) > precision) & (np.abs(y[changes + 1]) > precision)]
+    brackets_lower = np.concatenate((changes, run_lower)).astype(int)
+    brackets_upper = np.concatenate((changes + 1, run_upper)).astype(int)
+    if brackets_lower.size == 0:
+        return RootResult(exact, 0, evaluations, True, perf_counter() - start)
+
+    refined = bracket_batch(f, x[brackets_lower], x[brackets_upper], precision, y[brackets_lower], y[brackets_upper], xtol, max_iter, callback)
+    roots = np.sort(np.concatenate((exact, refined.root)))
+    return RootResult(roots, refined.iterations, evaluations + refined.evaluations, refined.converged, perf_counter() - start)
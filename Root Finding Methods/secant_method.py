@@ -8,10 +8,14 @@
 #  with the new values for a and b until the precision is met.
 #
 
-from typing import Callable
+from time import perf_counter
+from typing import Callable, Optional
 
+from root_result import RootResult
 
-def secant(f: Callable, x1: float, x2: float, precision: float) -> float:
+
+def secant(f: Callable, x1: float, x2: float, precision: float, xtol: float = 0.0, max_iter: int = 1000, max_evals: Optional[int] = None,
+           callback: Optional[Callable] = None) -> RootResult:
     """
     Approximates the root to a function using the secant method.
 
@@ -20,33 +24,77 @@ def secant(f: Callable, x1: float, x2: float, precision: float) -> float:
         x1 (float): The lower bound of the interval which contains the root
         x2 (float): The upper bound of the interval which contains the root
         precision (float): The maximum amount of error that is acceptable in method results
+        xtol (float, optional): The size of step that is small enough to stop at. Defaults to 0.0.
+        max_iter (int, optional): The maximum number of iterations to perform. Defaults to 1000.
+        max_evals (Optional[int], optional): The maximum number of function evaluations to perform. Defaults to None (no limit).
+        callback (Optional[Callable], optional): A function called after each iteration with the iteration number, the
+            current estimate of the root and the value of f there. Defaults to None.
 
     Returns:
-        float: Value which, when passed to f, returns a number of magnitude < precision.
+        RootResult: Value which, when passed to f, returns a number of magnitude < precision, along with
+            the number of iterations and function evaluations used.
         
     Raises:
-        ValueError: If x1 and x2 are equal, if f(x1) and f(x2) have different signs, or if Precision is not greater than zero.
+        ValueError: If x1 and x2 are equal, if f(x1) and f(x2) have different signs, if Precision is not greater than zero,
+            if xtol is negative, or if either budget is less than 1.
     """
     # Validating Inputs:
     if x1 == x2:
         raise ValueError("x1 and x2 cannot be the same value.")
     
-    if f(x1) * f(x2) >= 0:
-        raise ValueError("x1 and x2 must have different signs.")
-    
     if precision <= 0:
         raise ValueError("Precision cannot be zero or negative.")
     
+    if xtol < 0:
+        raise ValueError("xtol cannot be negative.")
+    
+    if max_iter < 1 or (max_evals is not None and max_evals < 1):
+        raise ValueError("The iteration and evaluation budgets cannot be less than one.")
+    
+    start = perf_counter()
+    f1 = f(x1)  # The values at the last two points are carried between iterations
+    evaluations = 1
+    if max_evals == 1:  # (The evaluation budget is checked before every evaluation of f)
+        x2, f2 = x1, f1
+    else:
+        f2 = f(x2)
+        evaluations += 1
+        if f1 * f2 >= 0:
+            raise ValueError("x1 and x2 must have different signs.")
+    
     # Actual Method:
-    x_next = (x1 * f(x2) - x2 * f(x1)) / (f(x2) - f(x1))
+    iterations = 0
+    converged = abs(f2) <= precision
+    message = ""
     
-    while abs(f(x_next)) > precision:
+    while not converged:
+        if iterations >= max_iter:
+            message = "The iteration budget was used up."
+            break
+        
+        if max_evals is not None and evaluations >= max_evals:
+            message = "The evaluation budget was used up."
+            break
+        
+        if f2 == f1:
+            message = "The secant is flat, so it has no root."
+            break
+        
+        x_next = (x1 * f2 - x2 * f1) / (f2 - f1)
+        f_next = f(x_next)
+        evaluations += 1
+        iterations += 1
+        
         # Updating the series of x values:
-        x1 = x2
-        x2 = x_next
-        x_next = (x1 * f(x2) - x2 * f(x1)) / (f(x2) - f(x1))
+        step = x_next - x2
+        x1, f1 = x2, f2
+        x2, f2 = x_next, f_next
+        if callback is not None:
+            callback(iterations, x2, f2)
+        
+        converged = abs(f2) <= precision or abs(step) <= xtol
     
-    return x_next
+    return RootResult(x2, iterations, evaluations, converged, perf_counter() - start, message)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+# Author: Satya Jhaveri
+#
+# An importable package for the numerical methods in this repository, split into namespaces:
+#  - numerical_methods.roots: Root finding methods
+#  - numerical_methods.integrate: Integral approximating methods
+#  - numerical_methods.ode: Methods for ordinary differential equations
+#  - numerical_methods.fit: Curve fitting methods
+#
+# Nothing is imported until it is used: 'import numerical_methods' loads none of the namespaces,
+#  and each namespace only imports the file a method lives in when that method is first accessed.
+#  For example:
+#
+#  from numerical_methods.roots import bisection  (only imports bisection_method.py)
+#  import numerical_methods as nm
+#  nm.integrate.simpsons_13(f, 0, 1, 101)          (only imports simpsons_13.py)
+#
+# (The typing module is deliberately not imported here, since it takes longer to import than the
+#  rest of the package.)
+#
+
+import importlib
+
+_NAMESPACES = ("roots", "integrate", "ode", "fit")
+
+__all__ = list(_NAMESPACES)
+
+
+def __getattr__(name: str) -> object:
+    if name not in _NAMESPACES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f"{__name__}.{name}")  # (Importing a submodule also sets it as an attribute of this package)
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_NAMESPACES))
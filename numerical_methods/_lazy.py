@@ -0,0 +1,112 @@
+# Author: Satya Jhaveri
+#
+# The methods live in directories whose names contain spaces, so they cannot be imported as
+#  submodules of a package. Instead, each namespace of this package lists which file each of its
+#  names comes from, and only loads that file (by its path, as a private module named
+#  'numerical_methods._impl.<file>') the first time the name is used. Importing the package itself
+#  therefore costs almost nothing, and heavy dependencies such as NumPy are only loaded by the
+#  methods that need them. sys.path is never changed, so the files cannot hide other modules.
+#
+# The method files import each other by their plain module names (for example
+#  'from root_result import RootResult'), as they do when they are run from their own directories.
+#  Before a file is run, those imports are rewritten to the private names (for example
+#  'from numerical_methods._impl.root_result import RootResult'), which a finder resolves with the
+#  same loader. No plain names are ever registered, so a user's own root_result.py neither breaks
+#  the package nor is replaced by it.
+#
+# Each method is also wrapped so that it can be recorded by numerical_methods.instrument.collect().
+#
+
+import ast
+import importlib.util
+import os
+import sys
+import types
+from typing import Optional
+
+from numerical_methods.instrument import instrumented
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_PRIVATE = "numerical_methods._impl"  # (The package the method files are loaded into)
+
+
+def _directory_of(name: str) -> Optional[str]:
+    # The method directory containing the file for a plain module name, or None if there is no such file:
+    if "." in name:
+        return None
+    for directory in sorted(os.listdir(_ROOT)):
+        if directory[0] != "." and directory != "numerical_methods" and os.path.isfile(os.path.join(_ROOT, directory, f"{name}.py")):
+            return directory
+    return None
+
+
+def load(directory: str, name: str) -> types.ModuleType:
+    # Loads a method file by its path (once), as a private module of this package:
+    private_name = f"{_PRIVATE}.{name}"
+    if private_name in sys.modules:
+        return sys.modules[private_name]
+    path = os.path.join(_ROOT, directory, f"{name}.py")
+
+    # Rewriting its imports of other method files (including inside its functions) to their private names:
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if _directory_of(alias.name) is not None:
+                    alias.name, alias.asname = f"{_PRIVATE}.{alias.name}", alias.asname or alias.name
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and _directory_of(node.module) is not None:
+            node.module = f"{_PRIVATE}.{node.module}"
+
+    spec = importlib.util.spec_from_file_location(private_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[private_name] = module  # (Before running it, as the import system does, so that dataclasses and pickle can find it)
+    try:
+        exec(compile(tree, path, "exec"), module.__dict__)
+    except BaseException:
+        del sys.modules[private_name]
+        raise
+    return module
+
+
+class _PrivateFinder:
+    # Finds the private package and the method files in it for the rewritten imports (and no other names):
+    @staticmethod
+    def find_spec(name: str, path: object = None, target: object = None) -> object:
+        if name == _PRIVATE:
+            return importlib.util.spec_from_loader(name, _PrivateFinder, is_package=True)
+        if name.startswith(f"{_PRIVATE}.") and _directory_of(name[len(_PRIVATE) + 1:]) is not None:
+            return importlib.util.spec_from_loader(name, _PrivateFinder)
+        return None
+
+    @staticmethod
+    def create_module(spec: object) -> Optional[types.ModuleType]:
+        if spec.name == _PRIVATE:
+            return None  # (An empty package)
+        name = spec.name[len(_PRIVATE) + 1:]
+        return load(_directory_of(name), name)
+
+    @staticmethod
+    def exec_module(module: types.ModuleType) -> None:
+        pass  # (The method files are run by load())
+
+
+if _PrivateFinder not in sys.meta_path:
+    sys.meta_path.append(_PrivateFinder)
+
+
+def lazy_namespace(namespace: str, directory: str, exports: dict) -> tuple:
+    # Creates the module level __getattr__ and __dir__ functions for a namespace, where exports maps each name to its module:
+    module_globals = sys.modules[namespace].__dict__
+
+    def __getattr__(name: str) -> object:
+        if name not in exports:
+            raise AttributeError(f"module {namespace!r} has no attribute {name!r}")
+        value = instrumented(f"{namespace.rsplit('.', 1)[-1]}.{name}", getattr(load(directory, exports[name]), name))
+        module_globals[name] = value  # (Later lookups find the name directly, without calling __getattr__)
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,259 @@
+# Author: Satya Jhaveri
+#
+# A command line runner for batches of problems, read as JSON lines (one problem per line) from a
+#  file or from standard input. Each problem names a method from the package namespaces, and
+#  gives its arguments by name. Function arguments (f, df, g) can be given as an expression in x
+#  (or in x and y for the ODE methods), which is compiled by numerical_methods.expressions, or as
+#  an import path of the form 'module:attribute'. For newton_raphson, a missing df is found by
+#  differentiating the expression for f exactly. For example:
+#
+#  {"id": 1, "method": "integrate.simpsons_13", "f": "exp(-x**2)", "a": 0, "b": 1, "n": 101}
+#  {"id": 2, "method": "roots.bisection", "f": "(x-1)*(x+6)", "lower": 0, "upper": 3, "precision": 1e-10}
+#  {"id": 3, "method": "ode.heun", "df": "x*y", "initial_x": 0, "final_x": 1, "initial_y": 1, "step": 0.01}
+#
+# The problems are read as a stream and handed to a pool of worker processes. At most --queue
+#  problems are in progress (or finished but waiting to be written) at once, so memory does not
+#  grow with the size of the input. Each result is written as a JSON line, either in the same
+#  order as the input, or in the order the problems finish. A problem that fails produces a line
+#  with an 'error' instead of a 'result', and the run carries on. Throughput statistics are
+#  printed to standard error at the end. Usage:
+#
+#  python -m numerical_methods.batch [FILE] [--output FILE] [--workers N] [--queue N] [--order input|completion]
+#                                    [--cache FILE] [--cache-size MB]
+#
+# With --cache, results are stored in (and read back from) a numerical_methods.cache.ResultCache,
+#  so problems solved in earlier runs are not solved again. Their results are marked 'cached'.
+#
+
+import argparse
+import importlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, is_dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numerical_methods
+from numerical_methods.cache import ResultCache
+from numerical_methods.expressions import compile_expression
+
+NAMESPACES = ("roots", "integrate", "ode", "fit")
+FUNCTION_ARGUMENTS = ("f", "df", "g")
+
+
+def resolve_function(value: str, variables: Tuple[str, ...] = ("x",)) -> Callable:
+    """
+    Finds the function described by a string, either an import path ('module:attribute') or an expression.
+
+    Args:
+        value (str): The import path or expression
+        variables (Tuple[str, ...], optional): The names of the arguments of an expression. Defaults to ('x',).
+
+    Raises:
+        ValueError: If the import path or expression is not valid.
+
+    Returns:
+        Callable: The function
+    """
+    if ":" in value:
+        module, _, attribute = value.partition(":")
+        try:
+            function = importlib.import_module(module)
+            for part in attribute.split("."):
+                function = getattr(function, part)
+        except (ImportError, AttributeError) as e:
+            raise ValueError(f"Cannot import '{value}': {e}")
+        return function
+    return compile_expression(value, variables)
+
+
+def _jsonable(value):
+    # Converts a method's result into values that can be written as JSON:
+    if is_dataclass(value):
+        return _jsonable(asdict(value))
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if hasattr(value, "tolist"):  # (NumPy arrays and scalars)
+        return _jsonable(value.tolist())
+    if isinstance(value, complex):
+        return {"real": value.real, "imag": value.imag}
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    return value
+
+
+def solve(problem: Dict, cache: Optional[ResultCache] = None) -> Dict:
+    """
+    Solves one problem.
+
+    Args:
+        problem (Dict): The problem, with the 'method' (for example 'roots.bisection'), an optional 'id', and the arguments
+            of the method by name
+        cache (Optional[ResultCache], optional): A cache to read the result from, or store it in. Defaults to None.
+
+    Returns:
+        Dict: The 'id' and 'method' of the problem, with either the 'result' or the 'error' raised, and the time taken
+    """
+    start = time.perf_counter()
+    output = {"id": problem.get("id"), "method": problem.get("method")}
+    try:
+        namespace, _, name = str(problem.get("method")).partition(".")
+        if namespace not in NAMESPACES or name.startswith("_") or name not in getattr(numerical_methods, namespace).__all__:
+            raise ValueError(f"Unknown method '{problem.get('method')}'.")
+        method = getattr(getattr(numerical_methods, namespace), name)
+
+        variables = ("x", "y") if namespace == "ode" else ("x",)
+        arguments = {key: value for key, value in problem.items() if key not in ("id", "method")}
+        if problem.get("method") == "roots.newton_raphson" and arguments.get("df") is None and isinstance(arguments.get("f"), str) \
+                and ":" not in arguments["f"]:
+            arguments["df"] = compile_expression(arguments["f"], variables).derivative()  # (The exact derivative of the expression)
+        for key in FUNCTION_ARGUMENTS:
+            if isinstance(arguments.get(key), str):
+                arguments[key] = resolve_function(arguments[key], variables)
+
+        if cache is None:
+            output["result"] = _jsonable(method(**arguments))
+        else:
+            hits = cache.hits
+            output["result"] = _jsonable(cache.call(method, **arguments))
+            output["cached"] = cache.hits > hits
+    except Exception as e:
+        output["error"] = f"{type(e).__name__}: {e}"
+    output["elapsed"] = time.perf_counter() - start
+    return output
+
+
+def _read(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    # Numbers each non-empty line:
+    index = 0
+    for line in lines:
+        if line.strip():
+            yield index, line
+            index += 1
+
+
+def _solve_line(index: int, line: str, cache: Optional[ResultCache] = None) -> Tuple[int, Dict]:
+    # Parses and solves one line (in a worker process), where a line that is not a JSON object is reported as an error:
+    try:
+        problem = json.loads(line)
+        if not isinstance(problem, dict):
+            raise ValueError("each line must be a JSON object")
+    except ValueError as e:
+        return index, {"id": None, "method": None, "error": f"Invalid problem: {e}", "elapsed": 0.0}
+    return index, solve(problem, cache)
+
+
+def run(lines: Iterable[str], output: TextIO, workers: Optional[int] = None, queue: Optional[int] = None, order: str = "input",
+        cache: Optional[ResultCache] = None) -> Dict:
+    """
+    Solves a stream of problems, writing each result as a JSON line.
+
+    Args:
+        lines (Iterable[str]): The problems, one JSON object per line
+        output (TextIO): Where to write the results
+        workers (Optional[int], optional): The number of worker processes, where 0 solves the problems in this process.
+            Defaults to None (the number of CPUs).
+        queue (Optional[int], optional): The largest number of problems in progress or waiting to be written at once.
+            Defaults to None (twice the number of workers).
+        order (str, optional): The order to write the results in, either 'input' or 'completion'. Defaults to 'input'.
+        cache (Optional[ResultCache], optional): A cache to read results from, or store them in. Defaults to None.
+
+    Raises:
+        ValueError: If the number of workers is negative, if the queue depth is less than 1, or if the order is not recognised.
+
+    Returns:
+        Dict: The throughput statistics, with the number of problems, the number that failed, the wall time, the problems
+            solved per second, and the mean time spent on each problem
+    """
+    # Validating inputs:
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    queue = max(2 * workers, 1) if queue is None else queue
+    if workers < 0:
+        raise ValueError("The number of workers cannot be negative.")
+
+    if queue < 1:
+        raise ValueError("The queue depth cannot be less than one.")
+
+    if order not in ("input", "completion"):
+        raise ValueError("The order must be either 'input' or 'completion'.")
+
+    start = time.perf_counter()
+    statistics = {"problems": 0, "errors": 0, "solve_time": 0.0}
+
+    def write(result: Dict) -> None:
+        statistics["problems"] += 1
+        statistics["errors"] += "error" in result
+        statistics["solve_time"] += result["elapsed"]
+        output.write(json.dumps(result) + "\n")
+
+    if workers == 0:
+        for index, line in _read(lines):
+            write(_solve_line(index, line, cache)[1])
+    else:
+        pending: Dict[Future, int] = {}
+        finished: Dict[int, Dict] = {}  # (Results waiting for earlier problems to finish, when writing in input order)
+        next_index = 0
+
+        def collect(block: bool) -> None:
+            nonlocal next_index
+            done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                index, result = future.result()
+                if order == "completion":
+                    write(result)
+                else:
+                    finished[index] = result
+            while next_index in finished:
+                write(finished.pop(next_index))
+                next_index += 1
+
+        with ProcessPoolExecutor(workers) as pool:
+            for index, line in _read(lines):
+                while len(pending) + len(finished) >= queue:
+                    collect(block=True)
+                pending[pool.submit(_solve_line, index, line, cache)] = index
+                collect(block=False)
+            while pending:
+                collect(block=True)
+
+    elapsed = time.perf_counter() - start
+    return {"problems": statistics["problems"], "errors": statistics["errors"], "wall_time": elapsed,
+            "problems_per_second": statistics["problems"] / elapsed if elapsed > 0 else math.inf,
+            "mean_solve_time": statistics["solve_time"] / statistics["problems"] if statistics["problems"] else 0.0}
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m numerical_methods.batch", description="Solves a JSON lines file of problems.")
+    parser.add_argument("input", nargs="?", default="-", help="The file of problems, or - for standard input (default)")
+    parser.add_argument("--output", default="-", help="The file to write the results to, or - for standard output (default)")
+    parser.add_argument("--workers", type=int, help="The number of worker processes, or 0 to solve in this process (default: the number of CPUs)")
+    parser.add_argument("--queue", type=int, help="The largest number of problems in progress at once (default: twice the number of workers)")
+    parser.add_argument("--order", choices=["input", "completion"], default="input", help="The order to write the results in (default input)")
+    parser.add_argument("--cache", help="A cache file to reuse the results of earlier runs from")
+    parser.add_argument("--cache-size", type=float, default=100, help="The largest size of the cache, in MB (default 100)")
+    args = parser.parse_args(arguments)
+
+    cache = ResultCache(args.cache, int(args.cache_size * 2**20)) if args.cache else None
+    source = sys.stdin if args.input == "-" else open(args.input)
+    destination = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        statistics = run(source, destination, args.workers, args.queue, args.order, cache)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if destination is not sys.stdout:
+            destination.close()
+
+    print(f"{statistics['problems']} problems ({statistics['errors']} failed) in {statistics['wall_time']:.3f} s: "
+          f"{statistics['problems_per_second']:.1f} problems/s, {1000 * statistics['mean_solve_time']:.3f} ms per problem", file=sys.stderr)
+    return 1 if statistics["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
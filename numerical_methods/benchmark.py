@@ -0,0 +1,378 @@
+# Author: Satya Jhaveri
+#
+# A throughput benchmark for the integral approximating methods, the ODE methods and the root
+#  finding methods. Each method is timed over problem sizes from 1e2 upwards (by powers of ten):
+#  - Integral approximating methods: The number of points. The 'scalar' variant passes a function
+#    to the method, which calls it once per point, and the 'vectorized' variant evaluates the
+#    integrand with NumPy and passes the values to the '_vec' version of the method.
+#  - ODE methods: The number of steps.
+#  - Root finding methods: The number of independent root finding problems (such as the roots of
+#    sin(x) in the brackets [kπ - 0.7, kπ + 1.1]). The 'scalar' variant solves them one at a time,
+#    and the 'vectorized' variant solves them all at once with the batched methods. For
+#    continuation, it is the number of parameter values the root is tracked through.
+#
+# For each run, the wall time (the fastest of a few repeats), the number of function evaluations
+#  per second and the peak memory allocated (measured with tracemalloc, in a separate run so that
+#  it does not slow down the timing) are recorded. Once a method takes long enough that the next
+#  size would exceed the time limit, its larger sizes are skipped.
+#
+# The results of every run are appended to a JSON history file, and the compare command checks the
+#  latest run against an earlier one, flagging any method whose throughput dropped by more than a
+#  threshold. Usage:
+#
+#  python -m numerical_methods.benchmark run [--max-size 1e8] [--only integrate] [--history FILE]
+#  python -m numerical_methods.benchmark compare [--threshold 0.1] [--baseline -2] [--history FILE]
+#
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from numerical_methods import integrate, ode, roots
+
+DEFAULT_HISTORY = "benchmark_history.json"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    variant: str
+    size: int
+    wall_time: float
+    evaluations: int
+    evaluations_per_second: float
+    peak_memory: int
+
+
+class EvaluationCounter:
+    """
+    Wraps a function to count how many points it is evaluated at, where a NumPy array (as the last argument) counts as
+     one evaluation per element.
+
+    Args:
+        f (Callable): The function to wrap
+    """
+
+    def __init__(self, f: Callable) -> None:
+        self.f = f
+        self.count = 0
+
+    def __call__(self, *args: float) -> float:
+        self.count += np.size(args[-1])
+        return self.f(*args)
+
+
+def _integral_cases() -> List[Tuple[str, str, Callable]]:
+    # Each case takes (size, wrap), where wrap is applied to the function, and returns the work to time:
+    def scalar(method: Callable, points: Callable) -> Callable:
+        return lambda size, wrap: lambda: method(wrap(math.sin), 0, math.pi, points(size))
+
+    def vectorized(method: Callable, points: Callable) -> Callable:
+        def case(size: int, wrap: Callable) -> Callable:
+            def work() -> float:
+                x = np.linspace(0, math.pi, points(size))
+                return method(x, wrap(np.sin)(x))
+            return work
+        return case
+
+    odd = lambda size: size + 1 if size % 2 == 0 else size  # (Simpson's 1/3 rule needs an odd number of points)
+    three = lambda size: size - (size - 1) % 3  # (Simpson's 3/8 rule needs a number of points congruent to 4 (mod 3))
+    same = lambda size: size
+    return [
+        ("integrate.rectangle", "scalar", scalar(integrate.rectangle, same)),
+        ("integrate.trapezoidal", "scalar", scalar(integrate.trapezoidal, same)),
+        ("integrate.simpsons_13", "scalar", scalar(integrate.simpsons_13, odd)),
+        ("integrate.simpsons_38", "scalar", scalar(integrate.simpsons_38, three)),
+        ("integrate.rectangle", "vectorized", vectorized(integrate.rectangle_vec, same)),
+        ("integrate.trapezoidal", "vectorized", vectorized(integrate.trapezoidal_vec, same)),
+        ("integrate.simpsons_13", "vectorized", vectorized(integrate.simpsons_13_vec, odd)),
+        ("integrate.simpsons_38", "vectorized", vectorized(integrate.simpsons_38_vec, three)),
+    ]
+
+
+def _ode_cases() -> List[Tuple[str, str, Callable]]:
+    def case(method: Callable) -> Callable:
+        return lambda size, wrap: lambda: method(wrap(lambda x, y: -y), 0, 1, 1, 1 / size)
+
+    return [(f"ode.{name}", "scalar", case(getattr(ode, name))) for name in ("forward_euler", "heun", "midpoint")]
+
+
+def _root_cases() -> List[Tuple[str, str, Callable]]:
+    # The brackets are not centred on the roots, since the first midpoint (or secant point) would then be the root itself:
+    def scalar(method: Callable) -> Callable:
+        def case(size: int, wrap: Callable) -> Callable:
+            f = wrap(math.sin)
+            return lambda: [method(f, k * math.pi - 0.7, k * math.pi + 1.1, 1e-10) for k in range(1, size + 1)]
+        return case
+
+    def newton(size: int, wrap: Callable) -> Callable:
+        f, df = wrap(math.sin), wrap(math.cos)
+        return lambda: [roots.newton_raphson(f, df, k * math.pi + 0.3, 1e-10) for k in range(1, size + 1)]
+
+    def newton_batch(size: int, wrap: Callable) -> Callable:
+        return lambda: roots.newton_raphson_batch(wrap(np.sin), np.arange(1, size + 1) * math.pi + 0.3, 1e-10)
+
+    def bracket_batch(size: int, wrap: Callable) -> Callable:
+        centres = np.arange(1, size + 1) * math.pi
+        return lambda: roots.bracket_batch(wrap(np.sin), centres - 0.7, centres + 1.1, 1e-10)
+
+    def find_all_roots(size: int, wrap: Callable) -> Callable:
+        return lambda: roots.find_all_roots(wrap(np.sin), 0.5, size * math.pi + 0.5, 1e-10, n=3 * size + 1)
+
+    def system(method: Callable) -> Callable:
+        # Intersections of the circles x² + y² = k with the line y = 2x, as independent two dimensional systems:
+        def case(size: int, wrap: Callable) -> Callable:
+            F = wrap(lambda v, k: np.array([v[0]**2 + v[1]**2 - k, v[1] - 2 * v[0]]))
+            return lambda: [method(lambda v, k=k: F(v, k), np.array([1.0, 1.0]), 1e-10) for k in range(1, size + 1)]
+        return case
+
+    def fixed_point(size: int, wrap: Callable) -> Callable:
+        # The fixed points of cos(x) + c, for values of c between 0 and 1:
+        g = wrap(lambda x, c: math.cos(x) + c)
+        return lambda: [roots.fixed_point(lambda x, c=k / size: g(x, c), 0.5, 1e-10) for k in range(size)]
+
+    def continuation(size: int, wrap: Callable) -> Callable:
+        # The real root of x³ + x - p as p goes from 0 to 10:
+        return lambda: roots.continuation(wrap(lambda x, p: x**3 + x - p), 0.0, np.linspace(0, 10, size), 1e-10)
+
+    def polynomials(batched: bool) -> Callable:
+        # The roots of quintics with random coefficients (which take no function evaluations):
+        def case(size: int, wrap: Callable) -> Callable:
+            coefficients = np.random.default_rng(0).normal(size=(size, 6))
+            if batched:
+                return lambda: roots.polynomial_roots_batch(coefficients)
+            return lambda: [roots.polynomial_roots(row) for row in coefficients]
+        return case
+
+    return [
+        ("roots.bisection", "scalar", scalar(roots.bisection)),
+        ("roots.false_position", "scalar", scalar(roots.false_position)),
+        ("roots.secant", "scalar", scalar(roots.secant)),
+        ("roots.brent", "scalar", scalar(roots.brent)),
+        ("roots.newton_raphson", "scalar", newton),
+        ("roots.newton_raphson", "vectorized", newton_batch),
+        ("roots.bracket_batch", "vectorized", bracket_batch),
+        ("roots.find_all_roots", "vectorized", find_all_roots),
+        ("roots.newton_system", "scalar", system(roots.newton_system)),
+        ("roots.broyden", "scalar", system(roots.broyden)),
+        ("roots.fixed_point", "scalar", fixed_point),
+        ("roots.continuation", "scalar", continuation),
+        ("roots.polynomial_roots", "scalar", polynomials(False)),
+        ("roots.polynomial_roots", "vectorized", polynomials(True)),
+    ]
+
+
+def cases() -> List[Tuple[str, str, Callable]]:
+    """
+    Lists every benchmark case.
+
+    Returns:
+        List[Tuple[str, str, Callable]]: The name, variant and work function of each case, where the work function takes the
+            problem size and a function wrapper, and returns a function that runs the method once
+    """
+    return _integral_cases() + _ode_cases() + _root_cases()
+
+
+def measure(case: Callable, size: int, repeat: int = 3, memory: bool = True) -> Tuple[float, int, int]:
+    """
+    Times one benchmark case at one problem size.
+
+    Args:
+        case (Callable): The work function of the case
+        size (int): The problem size
+        repeat (int, optional): The number of timed runs, where the fastest is kept (runs taking over a second are not repeated).
+            Defaults to 3.
+        memory (bool, optional): Whether to measure the peak memory, which takes an extra run. Defaults to True.
+
+    Returns:
+        Tuple[float, int, int]: The wall time in seconds, the number of function evaluations, and the peak memory in bytes
+    """
+    # Timing, without any wrapper around the function:
+    work = case(size, lambda f: f)
+    wall_time = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        work()
+        wall_time = min(wall_time, time.perf_counter() - start)
+        if wall_time > 1:
+            break
+
+    # Counting the evaluations (and measuring the memory) in a separate run:
+    counters = []
+
+    def wrap(f: Callable) -> Callable:
+        counters.append(EvaluationCounter(f))
+        return counters[-1]
+
+    work = case(size, wrap)
+    peak_memory = 0
+    if memory:
+        tracemalloc.start()
+        work()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        work()
+    return wall_time, sum(counter.count for counter in counters), peak_memory
+
+
+def run(max_size: int = 10**6, only: Optional[str] = None, repeat: int = 3, time_limit: float = 10.0, memory: bool = True,
+        output: Callable = print) -> List[BenchmarkResult]:
+    """
+    Runs every benchmark case over problem sizes from 1e2 to max_size.
+
+    Args:
+        max_size (int, optional): The largest problem size. Defaults to 10**6.
+        only (Optional[str], optional): Only runs the cases whose name contains this string. Defaults to None (every case).
+        repeat (int, optional): The number of timed runs of each case, where the fastest is kept. Defaults to 3.
+        time_limit (float, optional): The longest (predicted) time in seconds to spend on one run. Defaults to 10.0.
+        memory (bool, optional): Whether to measure the peak memory. Defaults to True.
+        output (Callable, optional): Where to report each result as it finishes. Defaults to print.
+
+    Raises:
+        ValueError: If max_size is less than 100, or if repeat or time_limit are not greater than zero.
+
+    Returns:
+        List[BenchmarkResult]: The result of each run
+    """
+    # Validating inputs:
+    if max_size < 100:
+        raise ValueError("The maximum size cannot be less than 100.")
+
+    if repeat < 1 or time_limit <= 0:
+        raise ValueError("repeat and time_limit must be greater than zero.")
+
+    results = []
+    for name, variant, case in cases():
+        if only is not None and only not in name:
+            continue
+
+        size = 100
+        while size <= max_size:
+            wall_time, evaluations, peak_memory = measure(case, size, repeat, memory)
+            result = BenchmarkResult(name, variant, size, wall_time, evaluations, evaluations / wall_time if wall_time > 0 else math.inf, peak_memory)
+            results.append(result)
+            output(f"{name:<24} {variant:<10} {size:>10} {wall_time:>10.4f} s {result.evaluations_per_second:>14.4g} evals/s {peak_memory / 2**20:>10.2f} MiB")
+
+            # The methods take time proportional to the size, so stopping before the next size would pass the time limit:
+            if wall_time * 10 > time_limit:
+                break
+            size *= 10
+    return results
+
+
+def save(results: List[BenchmarkResult], history: str = DEFAULT_HISTORY) -> None:
+    """
+    Appends the results of a run to a JSON history file.
+
+    Args:
+        results (List[BenchmarkResult]): The results of the run
+        history (str, optional): The path of the history file. Defaults to 'benchmark_history.json'.
+    """
+    try:
+        with open(history) as file:
+            runs = json.load(file)["runs"]
+    except FileNotFoundError:
+        runs = []
+
+    runs.append({
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    })
+    with open(history, "w") as file:
+        json.dump({"runs": runs}, file, indent=1)
+
+
+def _throughput(result: Dict) -> float:
+    # The evaluations per second, or the runs per second for methods that do not evaluate a function (such as polynomial_roots):
+    return result["evaluations_per_second"] if result["evaluations"] > 0 else 1 / result["wall_time"]
+
+
+def compare(history: str = DEFAULT_HISTORY, threshold: float = 0.1, baseline: int = -2, current: int = -1) -> List[Dict]:
+    """
+    Compares the throughput of two runs in a history file.
+
+    Args:
+        history (str, optional): The path of the history file. Defaults to 'benchmark_history.json'.
+        threshold (float, optional): The fraction that the throughput must drop by to count as a regression. Defaults to 0.1.
+        baseline (int, optional): The index of the run to compare against. Defaults to -2 (the second latest run).
+        current (int, optional): The index of the run to check. Defaults to -1 (the latest run).
+
+    Raises:
+        ValueError: If the threshold is not between zero and one, or if the history does not contain both runs.
+
+    Returns:
+        List[Dict]: The comparison of every case and size found in both runs, with its name, variant, size, the throughput of
+            each run, the ratio of the current throughput to the baseline, and whether it is a regression
+    """
+    # Validating inputs:
+    if not 0 < threshold < 1:
+        raise ValueError("The threshold must be between zero and one.")
+
+    with open(history) as file:
+        runs = json.load(file)["runs"]
+    try:
+        old, new = runs[baseline]["results"], runs[current]["results"]
+    except IndexError:
+        raise ValueError("The history does not contain both runs.")
+
+    # Matching up the results of each case and size:
+    old = {(r["name"], r["variant"], r["size"]): r for r in old}
+    comparison = []
+    for r in new:
+        key = (r["name"], r["variant"], r["size"])
+        if key not in old:
+            continue
+        before, after = _throughput(old[key]), _throughput(r)
+        ratio = after / before if before > 0 else math.inf
+        comparison.append({"name": key[0], "variant": key[1], "size": key[2], "baseline": before, "current": after,
+                           "ratio": ratio, "regression": ratio < 1 - threshold})
+    return comparison
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m numerical_methods.benchmark", description="Throughput benchmarks for the numerical methods.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and append the results to the history file")
+    run_parser.add_argument("--max-size", type=float, default=1e6, help="The largest problem size (default 1e6, up to 1e8)")
+    run_parser.add_argument("--only", help="Only run the methods whose name contains this string")
+    run_parser.add_argument("--repeat", type=int, default=3, help="The number of timed runs of each case (default 3)")
+    run_parser.add_argument("--time-limit", type=float, default=10.0, help="The longest time in seconds for one run (default 10)")
+    run_parser.add_argument("--no-memory", action="store_true", help="Do not measure the peak memory")
+    run_parser.add_argument("--history", default=DEFAULT_HISTORY, help=f"The history file (default {DEFAULT_HISTORY})")
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs in the history file")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="The drop in throughput that counts as a regression (default 0.1)")
+    compare_parser.add_argument("--baseline", type=int, default=-2, help="The index of the run to compare against (default -2)")
+    compare_parser.add_argument("--current", type=int, default=-1, help="The index of the run to check (default -1)")
+    compare_parser.add_argument("--history", default=DEFAULT_HISTORY, help=f"The history file (default {DEFAULT_HISTORY})")
+
+    args = parser.parse_args(arguments)
+    if args.command == "run":
+        results = run(int(args.max_size), args.only, args.repeat, args.time_limit, not args.no_memory)
+        save(results, args.history)
+        return 0
+
+    comparison = compare(args.history, args.threshold, args.baseline, args.current)
+    for c in comparison:
+        flag = "REGRESSION" if c["regression"] else ""
+        print(f"{c['name']:<24} {c['variant']:<10} {c['size']:>10} {c['baseline']:>14.4g} {c['current']:>14.4g} {c['ratio']:>8.3f} {flag}")
+    regressions = sum(c["regression"] for c in comparison)
+    print(f"{regressions} regression(s) in {len(comparison)} comparison(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+# Author: Satya Jhaveri
+#
+# An opt-in cache of method results, stored in an SQLite database on disk so that it lasts between
+#  runs and can be shared by several processes at once. For example:
+#
+#  cache = ResultCache("results.sqlite")
+#  cache.call(nm.integrate.simpsons_13, f, 0, 1, 10001)  (computed, and stored)
+#  cache.call(nm.integrate.simpsons_13, f, 0, 1, 10001)  (read from the cache, without calling f)
+#
+# A result is stored under a key built from:
+#  - The method: its module, name and bytecode (so that changing the method invalidates it).
+#  - Every argument, by name (so positional and keyword calls share entries), where numbers,
+#    strings and NumPy arrays are used by value (the exact repr of a float, or a hash of an array).
+#  - A fingerprint of every function argument: its bytecode and constants, the values in its
+#    closure and default arguments, the values of simple global variables it uses (numbers,
+#    strings and arrays), and the fingerprints of the global functions it calls. Compiled
+#    expressions are fingerprinted by their expression. If a function cannot be fingerprinted
+#    (for example, it uses a global dict or list, or depends on state the fingerprint cannot see,
+#    such as a file), a key can be given instead, either to call() or as a 'cache_key' attribute
+#    of the function.
+#
+# The database uses write-ahead logging, and every write happens in its own transaction, so many
+#  processes can read and write the same cache safely. Each entry records its size and when it
+#  was last used, and once the cache grows past max_bytes, the least recently used entries are
+#  evicted. Results are stored with pickle, so a cache file should only be shared with trusted
+#  users.
+#
+# Calls that pass a callback are not cached, since the callback would not be called on a hit.
+#
+
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import time
+import types
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+_SIMPLE = (int, float, complex, str, bytes, bool, type(None), type(Ellipsis))
+
+
+def _value(value: Any, seen: tuple = ()) -> Any:
+    # A representation of a value that can be hashed reliably, where functions are fingerprinted:
+    if isinstance(value, _SIMPLE) or isinstance(value, np.generic):
+        return (type(value).__name__, repr(value))
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest())
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_value(item, seen) for item in value)
+    if isinstance(value, frozenset):
+        return ("frozenset",) + tuple(sorted(repr(_value(item, seen)) for item in value))
+    if isinstance(value, slice):
+        return ("slice", _value(value.start, seen), _value(value.stop, seen), _value(value.step, seen))
+    if isinstance(value, dict):
+        return ("dict",) + tuple(sorted((repr(key), _value(item, seen)) for key, item in value.items()))
+    if callable(value):
+        return fingerprint(value, seen)
+    raise ValueError(f"Cannot build a cache key from a {type(value).__name__}, so a key must be given instead.")
+
+
+def _code(code: types.CodeType) -> tuple:
+    # The bytecode of a function, with its constants (including nested functions) and the names it uses:
+    constants = tuple(_code(constant) if isinstance(constant, types.CodeType) else _value(constant) for constant in code.co_consts)
+    return (code.co_code.hex(), constants, code.co_names, code.co_varnames[:code.co_argcount])
+
+
+def fingerprint(f: Callable, seen: tuple = ()) -> tuple:
+    """
+    Finds a fingerprint of a function, which is the same in every process and changes when the function's code, or the
+     values it uses from its closure, default arguments, simple global variables or global functions, change.
+
+    Args:
+        f (Callable): The function
+        seen (tuple, optional): The functions already being fingerprinted (to stop recursion). Defaults to ().
+
+    Raises:
+        ValueError: If the function uses a value that cannot be fingerprinted (including global variables other than
+            numbers, strings, tuples, frozensets, arrays, functions and modules).
+
+    Returns:
+        tuple: The fingerprint
+    """
+    key = getattr(f, "cache_key", None)
+    if key is not None:
+        return ("key", str(key))
+    if hasattr(f, "expression") and hasattr(f, "variables"):  # (A compiled expression)
+        return ("expression", f.expression, tuple(f.variables))
+    f = getattr(f, "__wrapped__", f)  # (A function wrapped by the package or by functools.wraps)
+    if isinstance(f, types.MethodType):
+        return ("method", _value(f.__self__, seen), fingerprint(f.__func__, seen))
+    if not isinstance(f, types.FunctionType):  # (Builtin functions, NumPy ufuncs and classes are identified by name)
+        name = getattr(f, "__qualname__", getattr(f, "__name__", None))
+        if name is None:
+            raise ValueError(f"Cannot fingerprint a {type(f).__name__}, so a key must be given instead.")
+        return ("named", getattr(f, "__module__", None) or type(f).__name__, name)
+    if f in seen:
+        return ("recursive", f.__qualname__)
+
+    seen = seen + (f,)
+    closure = tuple(_value(cell.cell_contents, seen) for cell in f.__closure__ or ())
+    defaults = _value(f.__defaults__ or (), seen)
+    used = []  # (The global variables the function uses, where functions are fingerprinted and modules are identified by name)
+    for name in f.__code__.co_names:
+        if name in f.__globals__:
+            value = f.__globals__[name]
+            if isinstance(value, types.ModuleType):
+                used.append((name, value.__name__))
+            elif callable(value):
+                used.append((name, fingerprint(value, seen)))
+            elif isinstance(value, _SIMPLE + (np.ndarray, np.generic, tuple, frozenset, slice)):
+                used.append((name, _value(value, seen)))
+            else:  # (Such as a dict or list, which could be changed after the result is stored)
+                raise ValueError(f"Cannot fingerprint a function that uses the global {type(value).__name__} '{name}', so a key must be given instead.")
+    return ("function", f.__module__, f.__qualname__, _code(f.__code__), closure, defaults, tuple(used))
+
+
+class ResultCache:
+    """
+    A cache of method results in an SQLite database, shared between runs and processes, which evicts the least recently
+     used results once it is larger than max_bytes.
+
+    Args:
+        path (str): The database file, which is created if it does not exist
+        max_bytes (int, optional): The largest total size of the stored results. Defaults to 100 MB.
+        timeout (float, optional): The number of seconds to wait for another process to finish writing. Defaults to 30.
+
+    Raises:
+        ValueError: If max_bytes is not positive.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 100 * 2**20, timeout: float = 30.0) -> None:
+        # Validating inputs:
+        if max_bytes <= 0:
+            raise ValueError("The maximum size of the cache must be positive.")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+        connection = self._connect()
+        connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Each process opens its own connection (a connection cannot be shared with a forked process):
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    def __getstate__(self) -> dict:
+        # (So that a cache can be passed to worker processes, which then open their own connections)
+        return {**self.__dict__, "_connection": None, "_pid": None}
+
+    def key(self, method: Callable, *args, key: Optional[str] = None, **kwargs) -> str:
+        """
+        Builds the key a method call is stored under.
+
+        Args:
+            method (Callable): The method
+            *args, **kwargs: The arguments of the call
+            key (Optional[str], optional): A key to use for the function arguments instead of their fingerprints.
+                Defaults to None.
+
+        Raises:
+            ValueError: If an argument cannot be used in a key.
+
+        Returns:
+            str: The key
+        """
+        arguments = inspect.signature(method).bind(*args, **kwargs)
+        arguments.apply_defaults()
+        parts = []
+        for name, value in arguments.arguments.items():
+            if key is not None and callable(value):
+                parts.append((name, ("key", str(key))))
+            else:
+                parts.append((name, _value(value)))
+        description = repr((fingerprint(method), tuple(parts)))
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def call(self, method: Callable, *args, key: Optional[str] = None, **kwargs) -> Any:
+        """
+        Calls a method, or returns its stored result if it was called with the same arguments before.
+
+        Args:
+            method (Callable): The method
+            *args, **kwargs: The arguments of the call
+            key (Optional[str], optional): A key to use for the function arguments instead of their fingerprints.
+                Defaults to None.
+
+        Raises:
+            ValueError: If an argument cannot be used in a key.
+
+        Returns:
+            Any: The result of the method
+        """
+        if kwargs.get("callback") is not None:
+            return method(*args, **kwargs)
+        entry = self.key(method, *args, key=key, **kwargs)
+        found, result = self.get(entry)
+        if found:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = method(*args, **kwargs)
+        self.put(entry, result)
+        return result
+
+    def get(self, key: str) -> tuple:
+        """
+        Reads a result from the cache, marking it as recently used.
+
+        Args:
+            key (str): The key of the result
+
+        Returns:
+            tuple: Whether the result was found, and the result (None if it was not)
+        """
+        connection = self._connect()
+        row = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False, None
+        connection.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        return True, pickle.loads(row[0])
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Stores a result in the cache, then evicts the least recently used results until the cache fits in max_bytes.
+         A result larger than max_bytes is not stored.
+
+        Args:
+            key (str): The key of the result
+            result (Any): The result
+        """
+        value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(value) > self.max_bytes:
+            return
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")  # (Holding the write lock, so that the size and eviction are consistent)
+        try:
+            connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (key, value, len(value), time.time()))
+            excess = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0] - self.max_bytes
+            if excess > 0:
+                evicted = 0
+                for old_key, size in connection.execute("SELECT key, size FROM results WHERE key != ? ORDER BY used", (key,)).fetchall():
+                    if evicted >= excess:
+                        break
+                    connection.execute("DELETE FROM results WHERE key = ?", (old_key,))
+                    evicted += size
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def size(self) -> int:
+        """
+        Finds the total size of the stored results, in bytes.
+
+        Returns:
+            int: The size
+        """
+        return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Removes every stored result.
+        """
+        self._connect().execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """
+        Closes this process's connection to the database (it is reopened if the cache is used again).
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
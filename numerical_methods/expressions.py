@@ -0,0 +1,272 @@
+# Author: Satya Jhaveri
+#
+# A compiler for mathematical expressions given as strings, such as 'exp(-x**2) * sin(3*x)', so that
+#  integrands and ODE right hand sides can come from configuration files.
+#
+# The expression is parsed with Python's own parser, and then checked so that it only contains
+#  numbers, the named variables, the constants pi and e, arithmetic (+, -, *, /, **) and calls to a
+#  fixed set of single argument functions. Anything else (attribute access, indexing, other names)
+#  is rejected, so untrusted expressions cannot run arbitrary code. The numbers are compiled as
+#  floats, so that arithmetic on them overflows quickly instead of building huge integers (an
+#  untrusted '9**9**9**9' would otherwise keep a process busy for ever).
+#
+# The checked expression is compiled once into two Python functions: one that uses the math module,
+#  which is fastest when the methods call it with one float at a time, and one that uses NumPy,
+#  which evaluates whole arrays at once. The compiled expression calls whichever one suits its
+#  arguments. Dual numbers go to the NumPy one, whose functions call the matching methods of the
+#  dual numbers, so methods such as newton_raphson can differentiate it without being given f'(x).
+#  It can also find its exact derivative with respect to any variable, by applying the rules of
+#  differentiation to the parsed expression (and simplifying the result a little), for methods
+#  that need f'(x).
+#
+# Compiled expressions are kept in a least recently used cache, keyed by the expression with its
+#  whitespace removed, so compiling the same expression again costs only a dictionary lookup.
+#
+
+import ast
+import copy
+import math
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, Union
+
+import numpy as np
+
+# The functions allowed in expressions, with their math and NumPy versions:
+FUNCTIONS: Dict[str, Tuple[Callable, Callable]] = {
+    "sin": (math.sin, np.sin), "cos": (math.cos, np.cos), "tan": (math.tan, np.tan),
+    "asin": (math.asin, np.arcsin), "acos": (math.acos, np.arccos), "atan": (math.atan, np.arctan),
+    "sinh": (math.sinh, np.sinh), "cosh": (math.cosh, np.cosh), "tanh": (math.tanh, np.tanh),
+    "exp": (math.exp, np.exp), "log": (math.log, np.log), "sqrt": (math.sqrt, np.sqrt), "abs": (abs, np.abs),
+}
+CONSTANTS = {"pi": math.pi, "e": math.e}
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)
+
+
+def _validate(tree: ast.Expression, expression: str, variables: Tuple[str, ...]) -> None:
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            if not (isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS and len(node.args) == 1 and not node.keywords):
+                raise ValueError(f"'{expression}' calls something other than one of: {', '.join(FUNCTIONS)}.")
+        elif isinstance(node, ast.Name):
+            if node.id not in variables and node.id not in CONSTANTS and node.id not in FUNCTIONS:
+                raise ValueError(f"'{expression}' uses an unknown name ({node.id}).")
+        elif isinstance(node, ast.Constant):
+            if type(node.value) not in (int, float):
+                raise ValueError(f"'{expression}' contains a constant that is not a number.")
+        elif not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load) + _OPERATORS):
+            raise ValueError(f"'{expression}' uses syntax that is not allowed ({type(node).__name__}).")
+
+
+def _floats(tree: ast.Expression, expression: str) -> ast.Expression:
+    # A copy of a (checked) expression where every number is a float:
+    tree = copy.deepcopy(tree)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant):
+            try:
+                node.value = float(node.value)
+            except OverflowError:
+                raise ValueError(f"'{expression}' contains a number that is too large.")
+    return tree
+
+
+class CompiledExpression:
+    """
+    An expression compiled into a function of its variables, which accepts floats or NumPy arrays.
+
+    Args:
+        expression (str): The expression
+        variables (Tuple[str, ...]): The names of the function's arguments, in order
+
+    Raises:
+        ValueError: If the expression is not valid, or uses anything other than numbers, the variables, pi, e, arithmetic
+            and the allowed functions.
+    """
+
+    def __init__(self, expression: str, variables: Tuple[str, ...]) -> None:
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError:
+            raise ValueError(f"'{expression}' is not a valid expression.")
+        _validate(tree, expression, variables)
+
+        self.tree = tree
+        self.expression = ast.unparse(tree)
+        self.variables = variables
+        code = compile(ast.fix_missing_locations(ast.Expression(ast.Lambda(
+            ast.arguments(posonlyargs=[], args=[ast.arg(v) for v in variables], kwonlyargs=[], kw_defaults=[], defaults=[]),
+            _floats(tree, expression).body))),
+            "<expression>", "eval")
+        self.scalar = eval(code, {"__builtins__": {}, **CONSTANTS, **{name: f[0] for name, f in FUNCTIONS.items()}})
+        self.vectorized = eval(code, {"__builtins__": {}, **CONSTANTS, **{name: f[1] for name, f in FUNCTIONS.items()}})
+
+    def __call__(self, *args: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        for arg in args:
+            if type(arg) is not float and type(arg) is not int:
+                return self.vectorized(*args)
+        return self.scalar(*args)
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression('{self.expression}', {self.variables})"
+
+    def derivative(self, variable: str = "x") -> "CompiledExpression":
+        """
+        Finds the exact derivative of the expression.
+
+        Args:
+            variable (str, optional): The variable to differentiate with respect to. Defaults to 'x'.
+
+        Raises:
+            ValueError: If the variable is not one of the expression's variables.
+
+        Returns:
+            CompiledExpression: The derivative, as a function of the same variables
+        """
+        if variable not in self.variables:
+            raise ValueError(f"'{variable}' is not a variable of the expression.")
+        return compile_expression(ast.unparse(_differentiate(self.tree.body, variable)), self.variables)
+
+
+def compile_expression(expression: str, variables: Tuple[str, ...] = ("x",)) -> CompiledExpression:
+    """
+    Compiles an expression into a function of its variables, or returns the cached result of compiling it before.
+
+    Args:
+        expression (str): The expression, for example 'exp(-x**2) * sin(3*x)'
+        variables (Tuple[str, ...], optional): The names of the function's arguments, in order. Defaults to ('x',).
+
+    Raises:
+        ValueError: If the expression is not valid, or uses anything other than numbers, the variables, pi, e, arithmetic
+            and the allowed functions.
+
+    Returns:
+        CompiledExpression: The compiled expression
+    """
+    return _compile("".join(expression.split()), tuple(variables))
+
+
+@lru_cache(maxsize=1024)
+def _compile(expression: str, variables: Tuple[str, ...]) -> CompiledExpression:
+    return CompiledExpression(expression, variables)
+
+
+# Building expressions, with some simplification so that derivatives do not fill up with 0 + 1 * ... terms:
+def _number(node: ast.expr) -> Union[int, float, None]:
+    return node.value if isinstance(node, ast.Constant) else None
+
+
+def _constant(value: float) -> ast.expr:
+    return ast.Constant(value) if value >= 0 else ast.UnaryOp(ast.USub(), ast.Constant(-value))
+
+
+def _add(a: ast.expr, b: ast.expr) -> ast.expr:
+    if _number(a) == 0:
+        return b
+    if _number(b) == 0:
+        return a
+    return ast.BinOp(a, ast.Add(), b)
+
+
+def _sub(a: ast.expr, b: ast.expr) -> ast.expr:
+    if _number(b) == 0:
+        return a
+    if _number(a) == 0:
+        return _neg(b)
+    return ast.BinOp(a, ast.Sub(), b)
+
+
+def _neg(a: ast.expr) -> ast.expr:
+    if _number(a) is not None:
+        return _constant(-_number(a))
+    if isinstance(a, ast.UnaryOp) and isinstance(a.op, ast.USub):
+        return a.operand
+    return ast.UnaryOp(ast.USub(), a)
+
+
+def _mul(a: ast.expr, b: ast.expr) -> ast.expr:
+    if _number(a) == 0 or _number(b) == 0:
+        return ast.Constant(0)
+    if _number(a) == 1:
+        return b
+    if _number(b) == 1:
+        return a
+    if _number(a) is not None and _number(b) is not None:
+        return _constant(_number(a) * _number(b))
+    return ast.BinOp(a, ast.Mult(), b)
+
+
+def _div(a: ast.expr, b: ast.expr) -> ast.expr:
+    if _number(a) == 0:
+        return ast.Constant(0)
+    if _number(b) == 1:
+        return a
+    return ast.BinOp(a, ast.Div(), b)
+
+
+def _pow(a: ast.expr, b: ast.expr) -> ast.expr:
+    if _number(b) == 0:
+        return ast.Constant(1)
+    if _number(b) == 1:
+        return a
+    return ast.BinOp(a, ast.Pow(), b)
+
+
+def _call(name: str, a: ast.expr) -> ast.expr:
+    return ast.Call(ast.Name(name, ast.Load()), [a], [])
+
+
+def _depends_on(node: ast.expr, variable: str) -> bool:
+    return any(isinstance(child, ast.Name) and child.id == variable for child in ast.walk(node))
+
+
+def _differentiate(node: ast.expr, variable: str) -> ast.expr:
+    # The derivative of a (checked) expression with respect to variable, using the sum, product, quotient and chain rules:
+    if not _depends_on(node, variable):
+        return ast.Constant(0)
+
+    if isinstance(node, ast.Name):
+        return ast.Constant(1)
+
+    if isinstance(node, ast.UnaryOp):
+        derivative = _differentiate(node.operand, variable)
+        return _neg(derivative) if isinstance(node.op, ast.USub) else derivative
+
+    if isinstance(node, ast.BinOp):
+        u, v = node.left, node.right
+        du, dv = _differentiate(u, variable), _differentiate(v, variable)
+        if isinstance(node.op, ast.Add):
+            return _add(du, dv)
+        if isinstance(node.op, ast.Sub):
+            return _sub(du, dv)
+        if isinstance(node.op, ast.Mult):
+            return _add(_mul(du, v), _mul(u, dv))
+        if isinstance(node.op, ast.Div):
+            if not _depends_on(v, variable):
+                return _div(du, v)
+            return _div(_sub(_mul(du, v), _mul(u, dv)), _pow(v, ast.Constant(2)))
+        # Powers, where a constant exponent uses the power rule, and otherwise u^v = exp(v log(u)):
+        if not _depends_on(v, variable):
+            exponent = _number(v)
+            reduced = _constant(exponent - 1) if exponent is not None else _sub(v, ast.Constant(1))
+            return _mul(_mul(v, _pow(u, reduced)), du)
+        return _mul(node, _add(_mul(dv, _call("log", u)), _div(_mul(v, du), u)))
+
+    # A call to one of the functions, using the chain rule:
+    name, argument = node.func.id, node.args[0]
+    inner = _differentiate(argument, variable)
+    outer = {
+        "sin": lambda a: _call("cos", a),
+        "cos": lambda a: _neg(_call("sin", a)),
+        "tan": lambda a: _div(ast.Constant(1), _pow(_call("cos", a), ast.Constant(2))),
+        "asin": lambda a: _div(ast.Constant(1), _call("sqrt", _sub(ast.Constant(1), _pow(a, ast.Constant(2))))),
+        "acos": lambda a: _neg(_div(ast.Constant(1), _call("sqrt", _sub(ast.Constant(1), _pow(a, ast.Constant(2)))))),
+        "atan": lambda a: _div(ast.Constant(1), _add(ast.Constant(1), _pow(a, ast.Constant(2)))),
+        "sinh": lambda a: _call("cosh", a),
+        "cosh": lambda a: _call("sinh", a),
+        "tanh": lambda a: _div(ast.Constant(1), _pow(_call("cosh", a), ast.Constant(2))),
+        "exp": lambda a: _call("exp", a),
+        "log": lambda a: _div(ast.Constant(1), a),
+        "sqrt": lambda a: _div(ast.Constant(1), _mul(ast.Constant(2), _call("sqrt", a))),
+        "abs": lambda a: _div(a, _call("abs", a)),
+    }[name](argument)
+    return _mul(outer, inner)
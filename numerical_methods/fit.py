@@ -0,0 +1,22 @@
+# Author: Satya Jhaveri
+#
+# The curve fitting methods (from 'Curve Fitting'), loaded the first time each one is used.
+#
+
+from numerical_methods._lazy import lazy_namespace
+
+_EXPORTS = {
+    "linear_least_squares": "least_squares",
+    "polynomial_fit": "least_squares",
+    "polynomial_fit_batch": "least_squares",
+    "chunked_least_squares": "least_squares",
+    "FitResult": "levenberg_marquardt",
+    "levenberg_marquardt": "levenberg_marquardt",
+    "levenberg_marquardt_batch": "levenberg_marquardt",
+    "RecursiveLeastSquares": "recursive_least_squares",
+    "CubicSpline": "cubic_spline",
+    "Chebyshev": "chebyshev",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_namespace(__name__, "Curve Fitting", _EXPORTS)
@@ -0,0 +1,186 @@
+# Author: Satya Jhaveri
+#
+# Instrumentation for seeing how much work the methods do, in three layers:
+#  - counted(f) wraps a function (such as the f or df passed to a root finding method) so that it
+#    counts its calls and the time spent in them.
+#  - The iterative root finding methods and the ODE methods take a 'callback' argument, which is
+#    called after every iteration (with the iteration number, the estimate and f there) or step
+#    (with the step number, x and y), for tracing a single run.
+#  - collect() is a context manager that records statistics for every method called through the
+#    numerical_methods namespaces while it is active: the number of calls, the time spent, the
+#    number of iterations, and the number of calls to each function argument. The statistics can
+#    be exported as a dictionary (for example to JSON, or to a monitoring system).
+#
+# Every method from the namespaces is wrapped so that it can be recorded, but while no collect()
+#  block is active, the wrapper only checks a list and calls the method, so it costs well under a
+#  microsecond per call and can be left in place in hot paths. Methods called by other methods
+#  (rather than through a namespace) are not recorded separately.
+#
+# (The typing module is not imported, to keep the package fast to import.)
+#
+
+from time import perf_counter
+
+_active = []  # The statistics of every collect() block in progress
+
+
+class CountedFunction:
+    """
+    A wrapper around a function that counts how many times it is called and the total time spent in it.
+
+    Args:
+        f (Callable): The function to wrap
+    """
+    __slots__ = ("f", "calls", "time")
+
+    def __init__(self, f) -> None:
+        self.f = f
+        self.calls = 0
+        self.time = 0.0
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return self.f(*args, **kwargs)
+        finally:
+            self.time += perf_counter() - start
+            self.calls += 1
+
+    @property
+    def __wrapped__(self):
+        return self.f  # (So that the wrapped function can be found, as with functools.wraps)
+
+
+def counted(f) -> CountedFunction:
+    """
+    Wraps a function to count its calls and the time spent in them.
+
+    Args:
+        f (Callable): The function to wrap
+
+    Returns:
+        CountedFunction: The wrapped function, with 'calls' and 'time' attributes
+    """
+    return CountedFunction(f)
+
+
+class MethodStatistics:
+    """
+    The statistics gathered for one method inside a collect() block.
+    """
+    __slots__ = ("calls", "time", "iterations", "evaluations", "evaluation_time", "errors")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.time = 0.0
+        self.iterations = 0
+        self.evaluations = {}  # The number of calls to each function argument, by argument name
+        self.evaluation_time = 0.0  # The time spent inside the function arguments
+        self.errors = 0
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Statistics:
+    """
+    The statistics of every method called through the numerical_methods namespaces inside a collect() block.
+    """
+
+    def __init__(self) -> None:
+        self.methods = {}  # MethodStatistics for each method, by its name in the package (for example 'roots.bisection')
+
+    def __enter__(self) -> "Statistics":
+        _active.append(self)
+        return self
+
+    def __exit__(self, *exception) -> None:
+        _active.remove(self)
+
+    def as_dict(self) -> dict:
+        """
+        Exports the statistics.
+
+        Returns:
+            dict: The statistics of each method, by name
+        """
+        return {name: statistics.as_dict() for name, statistics in self.methods.items()}
+
+
+def collect() -> Statistics:
+    """
+    Creates a context manager that records statistics for every method called through the numerical_methods namespaces
+     inside it. For example:
+
+     with collect() as statistics:
+         roots.bisection(f, 0, 3, 1e-10)
+     statistics.methods["roots.bisection"].evaluations["f"]
+
+    Returns:
+        Statistics: The statistics, which are filled in while the block runs
+    """
+    return Statistics()
+
+
+def _record(name: str, method, args: tuple, kwargs: dict):
+    # Runs a method with every function argument counted, and adds the statistics to each active collect() block:
+    code = getattr(method, "__code__", None)
+    names = code.co_varnames[:code.co_argcount] if code is not None else ()
+    wrapped = {}
+    args = list(args)
+    for i, value in enumerate(args):
+        argument = names[i] if i < len(names) else f"arg{i}"
+        if callable(value) and not isinstance(value, type) and argument != "callback":
+            args[i] = wrapped[argument] = CountedFunction(value)
+    for key, value in kwargs.items():
+        if callable(value) and not isinstance(value, type) and key != "callback":
+            kwargs[key] = wrapped[key] = CountedFunction(value)
+
+    start = perf_counter()
+    failed = True
+    try:
+        result = method(*args, **kwargs)
+        failed = False
+        return result
+    finally:
+        elapsed = perf_counter() - start
+        iterations = getattr(result, "iterations", 0) if not failed else 0
+        try:
+            iterations = int(iterations)
+        except TypeError:
+            iterations = int(sum(iterations))  # (Some methods give the iterations used at each step)
+        for statistics in _active:
+            method_statistics = statistics.methods.get(name)
+            if method_statistics is None:
+                method_statistics = statistics.methods[name] = MethodStatistics()
+            method_statistics.calls += 1
+            method_statistics.time += elapsed
+            method_statistics.errors += failed
+            method_statistics.iterations += iterations
+            for argument, function in wrapped.items():
+                method_statistics.evaluations[argument] = method_statistics.evaluations.get(argument, 0) + function.calls
+                method_statistics.evaluation_time += function.time
+
+
+def instrumented(name: str, method):
+    """
+    Wraps a method so that it is recorded by any active collect() block. Classes and coroutine functions are returned unchanged.
+
+    Args:
+        name (str): The name to record the method under
+        method (Callable): The method to wrap
+
+    Returns:
+        Callable: The wrapped method
+    """
+    if isinstance(method, type) or not callable(method) or getattr(method, "__code__", None) is None or method.__code__.co_flags & 0x80:
+        return method  # (0x80 is the flag of a coroutine function)
+
+    def wrapper(*args, **kwargs):
+        if not _active:
+            return method(*args, **kwargs)
+        return _record(name, method, args, kwargs)
+
+    wrapper.__name__, wrapper.__qualname__, wrapper.__doc__ = method.__name__, method.__qualname__, method.__doc__
+    wrapper.__module__, wrapper.__wrapped__ = method.__module__, method
+    return wrapper
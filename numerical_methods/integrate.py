@@ -0,0 +1,29 @@
+# Author: Satya Jhaveri
+#
+# The integral approximating methods (from 'Integral Approximating Methods'), loaded the first
+#  time each one is used.
+#
+
+from numerical_methods._lazy import lazy_namespace
+
+_EXPORTS = {
+    "rectangle": "rectangle_method",
+    "rectangle_vec": "rectangle_method",
+    "trapezoidal": "trapezoidal_method",
+    "trapezoidal_vec": "trapezoidal_method",
+    "simpsons_13": "simpsons_13",
+    "simpsons_13_vec": "simpsons_13",
+    "simpsons_38": "simpsons_38",
+    "simpsons_38_vec": "simpsons_38",
+    "tanh_sinh": "tanh_sinh",
+    "MemoizedIntegrand": "memoized_integrand",
+    "parallel_trapezoidal_vec": "parallel_integration",
+    "parallel_simpsons_13_vec": "parallel_integration",
+    "async_rectangle": "async_integration",
+    "async_trapezoidal": "async_integration",
+    "async_simpsons_13": "async_integration",
+    "async_simpsons_38": "async_integration",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_namespace(__name__, "Integral Approximating Methods", _EXPORTS)
@@ -0,0 +1,16 @@
+# Author: Satya Jhaveri
+#
+# The methods for ordinary differential equations (from 'Ordinary Differential Equations'),
+#  loaded the first time each one is used.
+#
+
+from numerical_methods._lazy import lazy_namespace
+
+_EXPORTS = {
+    "forward_euler": "euler",
+    "heun": "heun",
+    "midpoint": "midpoint",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_namespace(__name__, "Ordinary Differential Equations", _EXPORTS)
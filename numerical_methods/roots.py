@@ -0,0 +1,40 @@
+# Author: Satya Jhaveri
+#
+# The root finding methods (from 'Root Finding Methods'), loaded the first time each one is used.
+#
+
+from numerical_methods._lazy import lazy_namespace
+
+_EXPORTS = {
+    "RootResult": "root_result",
+    "bisection": "bisection_method",
+    "false_position": "false_position",
+    "secant": "secant_method",
+    "brent": "brent_method",
+    "newton_raphson": "newton_raphson",
+    "newton_raphson_batch": "newton_raphson",
+    "Dual": "dual_numbers",
+    "value_and_derivative": "dual_numbers",
+    "DualArray": "dual_array",
+    "values_and_derivatives": "dual_array",
+    "finite_difference_jacobian": "nonlinear_systems",
+    "newton_system": "nonlinear_systems",
+    "broyden": "nonlinear_systems",
+    "bracket_batch": "root_scanner",
+    "find_all_roots": "root_scanner",
+    "horner": "polynomial",
+    "polynomial_function": "polynomial",
+    "polynomial_roots": "polynomial",
+    "polynomial_roots_batch": "polynomial",
+    "ContinuationResult": "continuation",
+    "continuation": "continuation",
+    "fixed_point": "fixed_point",
+    "anderson": "fixed_point",
+    "async_bisection": "async_root_finding",
+    "async_secant": "async_root_finding",
+    "async_find_brackets": "async_root_finding",
+    "async_find_all_roots": "async_root_finding",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_namespace(__name__, "Root Finding Methods", _EXPORTS)
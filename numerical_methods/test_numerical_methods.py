@@ -0,0 +1,412 @@
+# Testing file for the numerical_methods package
+# Author: Satya Jhaveri
+
+import unittest
+import subprocess
+import sys
+import os
+import io
+import json
+import math
+import tempfile
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)  # (So that this file can also be run from its own directory)
+
+import numerical_methods
+from numerical_methods import batch, benchmark, cache, expressions, instrument, work_precision
+
+
+def loaded_modules(code: str) -> set:
+    # Runs code in a fresh interpreter, and returns the names of the modules it imported:
+    result = subprocess.run([sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestPackage(unittest.TestCase):
+    def setUp(self) -> None:
+        # Create list of error to collect over all tests:
+        self.errorList = []
+    
+    def tearDown(self) -> None:
+        # Print all errors found:
+        for e in self.errorList:
+            print(e)
+        print(f"Number of errors: {len(self.errorList)}")
+    
+    def test_namespaces(self) -> None:
+        # Every exported name should be found in its file:
+        for name in numerical_methods.__all__:
+            namespace = getattr(numerical_methods, name)
+            for export in namespace.__all__:
+                try:
+                    self.assertTrue(callable(getattr(namespace, export)), msg=f"{name}.{export} is not callable")
+                except (AssertionError, ImportError, AttributeError) as e:
+                    self.errorList.append(f"{name}.{export}: {e}")
+        
+        # Testing methods through the package:
+        try:
+            self.assertAlmostEqual(1 / 3, numerical_methods.integrate.simpsons_13(lambda x: x * x, 0, 1, 101), delta=1e-12, msg="Incorrect integral through package")
+            self.assertAlmostEqual(1, numerical_methods.roots.bisection(lambda x: (x - 1) * (x + 6), 0, 3, 1e-10).root, delta=1e-8, msg="Incorrect root through package")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Accessing names that do not exist:
+        try:
+            self.assertRaises(AttributeError, getattr, numerical_methods, "statistics")
+            self.assertRaises(AttributeError, getattr, numerical_methods.roots, "not_a_method")
+        except AssertionError:
+            self.errorList.append("AttributeError not raised for a name that does not exist")
+    
+    def test_batch(self) -> None:
+        problems = [
+            '{"id": 1, "method": "integrate.simpsons_13", "f": "x*x", "a": 0, "b": 1, "n": 101}',
+            '{"id": 2, "method": "roots.bisection", "f": "(x-1)*(x+6)", "lower": 0, "upper": 3, "precision": 1e-10}',
+            '{"id": 3, "method": "ode.forward_euler", "df": "y", "initial_x": 0, "final_x": 1, "initial_y": 1, "step": 0.5}',
+            '{"id": 4, "method": "roots.newton_raphson", "f": "math:sin", "df": "math:cos", "xi": 3, "precision": 1e-12}',
+            '',
+            'not json',
+            '{"id": 6, "method": "roots.bisection", "f": "__import__(\'os\')", "lower": 0, "upper": 3, "precision": 1e-10}',
+            '{"id": 7, "method": "os.system", "f": "x"}',
+        ]
+        
+        # Solving the problems in this process, and with a pool of workers:
+        for workers in [0, 2]:
+            output = io.StringIO()
+            statistics = batch.run(problems, output, workers=workers, queue=2)
+            results = [json.loads(line) for line in output.getvalue().splitlines()]
+            try:
+                self.assertEqual([1, 2, 3, 4, None, 6, 7], [result["id"] for result in results], msg="Batch results not in input order")
+                self.assertAlmostEqual(1 / 3, results[0]["result"], delta=1e-12, msg="Incorrect batch integral")
+                self.assertAlmostEqual(1, results[1]["result"]["root"], delta=1e-8, msg="Incorrect batch root")
+                self.assertEqual([list(values) for values in numerical_methods.ode.forward_euler(lambda x, y: y, 0, 1, 1, 0.5)], results[2]["result"], msg="Incorrect batch ODE solution")
+                self.assertAlmostEqual(3.141592653589793, results[3]["result"]["root"], delta=1e-12, msg="Incorrect batch root from imported functions")
+                self.assertEqual([False] * 4 + [True] * 3, ["error" in result for result in results], msg="Incorrect batch errors")
+                self.assertEqual((7, 3), (statistics["problems"], statistics["errors"]), msg="Incorrect batch statistics")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        try:
+            self.assertRaises(ValueError, batch.run, problems, io.StringIO(), 0, order="random")
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the order is not recognised")
+    
+    def test_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            results = cache.ResultCache(os.path.join(directory, "cache.sqlite"))
+            f = instrument.counted(lambda x: x * x)
+            
+            # A repeated call (positional or by keyword) should be read from the cache without calling f:
+            try:
+                self.assertAlmostEqual(1 / 3, results.call(numerical_methods.integrate.simpsons_13, f, 0, 1, 101), delta=1e-12, msg="Incorrect cached result")
+                self.assertAlmostEqual(1 / 3, results.call(numerical_methods.integrate.simpsons_13, f=f, a=0, b=1, n=101), delta=1e-12, msg="Incorrect cached result")
+                self.assertEqual((101, 1, 1), (f.calls, results.hits, results.misses), msg="Repeated call not read from the cache")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            # Changing an argument, or a value in the function's closure, should not hit the cache:
+            scales = [1.0, 2.0]
+            functions = [(lambda x: scale * x * x) for scale in scales[:1]] + [(lambda x, scale=scale: scale * x * x) for scale in scales]
+            try:
+                self.assertNotEqual(results.key(numerical_methods.integrate.simpsons_13, f, 0, 1, 101),
+                                    results.key(numerical_methods.integrate.simpsons_13, f, 0, 1, 103), msg="Different arguments share a key")
+                self.assertNotEqual(results.key(numerical_methods.integrate.simpsons_13, functions[1], 0, 1, 101),
+                                    results.key(numerical_methods.integrate.simpsons_13, functions[2], 0, 1, 101), msg="Different defaults share a key")
+                self.assertEqual(results.key(numerical_methods.integrate.simpsons_13, lambda x: x**2, 0, 1, 101),
+                                 results.key(numerical_methods.integrate.simpsons_13, lambda x: x**2, 0, 1, 101), msg="Identical functions have different keys")
+                self.assertEqual(results.key(numerical_methods.integrate.simpsons_13, expressions.compile_expression("x**2"), 0, 1, 101),
+                                 results.key(numerical_methods.integrate.simpsons_13, expressions.compile_expression("x ** 2"), 0, 1, 101),
+                                 msg="Identical expressions have different keys")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            # Changing a global function the function calls should change the key, and mutable globals should need a key:
+            namespace = {}
+            exec("def helper(x): return 2 * x\ndef g(x): return helper(x) * x", namespace)
+            before = results.key(numerical_methods.integrate.simpsons_13, namespace["g"], 0, 1, 101)
+            exec("def helper(x): return 3 * x", namespace)
+            namespace["parameters"] = {"k": 1.0}
+            exec("def h(x): return parameters['k'] * x", namespace)
+            try:
+                self.assertNotEqual(before, results.key(numerical_methods.integrate.simpsons_13, namespace["g"], 0, 1, 101),
+                                    msg="Changing a global function does not change the key")
+                self.assertRaises(ValueError, results.call, numerical_methods.integrate.simpsons_13, namespace["h"], 0, 1, 101)
+                self.assertAlmostEqual(0.5, results.call(numerical_methods.integrate.simpsons_13, namespace["h"], 0, 1, 101, key="h, k=1"), delta=1e-12,
+                                       msg="Incorrect cached result with a key")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            # Every method of the package should have a fingerprint (their code contains constants such as ...):
+            for name in numerical_methods.__all__:
+                namespace = getattr(numerical_methods, name)
+                for export in namespace.__all__:
+                    try:
+                        cache.fingerprint(getattr(namespace, export))
+                    except ValueError as e:
+                        self.errorList.append(f"{name}.{export} cannot be fingerprinted: {e}")
+            
+            # The least recently used results should be evicted once the cache is too large:
+            small = cache.ResultCache(os.path.join(directory, "small.sqlite"), max_bytes=4000)
+            for n in range(10):
+                small.call(numerical_methods.ode.heun, lambda x, y: y, 0, 1, 1, 0.1 / (n + 1))
+            small.call(numerical_methods.ode.heun, lambda x, y: y, 0, 1, 1, 0.1)
+            try:
+                self.assertLessEqual(small.size(), 4000, msg="Cache larger than its maximum size")
+                self.assertEqual(0, small.hits, msg="Evicted result read from the cache")
+                self.assertLess(len(small), 10, msg="No results evicted")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+            
+            # Sharing the cache between worker processes, where the second run should read every result from the cache:
+            problems = ['{"id": %d, "method": "integrate.trapezoidal", "f": "exp(x)", "a": 0, "b": 1, "n": %d}' % (i, 100 + i) for i in range(8)]
+            for run in range(2):
+                output = io.StringIO()
+                batch.run(problems, output, workers=2, cache=results)
+                lines = [json.loads(line) for line in output.getvalue().splitlines()]
+                try:
+                    self.assertEqual([run == 1] * 8, [line["cached"] for line in lines], msg="Batch results not cached")
+                    self.assertAlmostEqual(math.e - 1, lines[-1]["result"], delta=1e-4, msg="Incorrect cached batch result")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+            
+            # Arguments that cannot be used in a key:
+            try:
+                self.assertRaises(ValueError, results.call, numerical_methods.integrate.simpsons_13, f, object(), 1, 101)
+                self.assertRaises(ValueError, cache.ResultCache, os.path.join(directory, "empty.sqlite"), 0)
+            except AssertionError:
+                self.errorList.append("ValueError not raised for an argument that cannot be cached")
+            results.close()
+            small.close()
+    
+    def test_expressions(self) -> None:
+        f = expressions.compile_expression("exp(-x**2) * sin(3*x)")
+        x = np.linspace(-2, 2, 9)
+        
+        # The same values for floats and arrays:
+        try:
+            self.assertAlmostEqual(math.exp(-0.25) * math.sin(1.5), f(0.5), delta=1e-15, msg="Incorrect compiled expression")
+            self.assertTrue(np.allclose(np.exp(-x**2) * np.sin(3 * x), f(x), rtol=1e-15, atol=0), msg="Incorrect vectorized compiled expression")
+            self.assertIs(f, expressions.compile_expression(" exp( -x ** 2 )*sin(3 * x)"), msg="Compiled expression not cached")
+            self.assertAlmostEqual(math.exp(-1) + 4, expressions.compile_expression("exp(-x) + x*y", ("x", "y"))(1, 4), delta=1e-15,
+                                   msg="Incorrect compiled expression of two variables")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Exact derivatives, compared to central differences:
+        h = 1e-6
+        for expression in ["exp(-x**2) * sin(3*x)", "x**x", "sqrt(1 + x**2) / (2 - x)", "log(cosh(x)) - atan(x)*tanh(2*x)", "abs(x)**3 - 1/x"]:
+            g = expressions.compile_expression(expression)
+            for point in [0.3, 1.1, 1.7]:
+                try:
+                    self.assertAlmostEqual((g(point + h) - g(point - h)) / (2 * h), g.derivative()(point), delta=1e-7,
+                                           msg=f"Incorrect derivative of {expression} at {point}")
+                except AssertionError as e:
+                    self.errorList.append(str(e))
+        try:
+            self.assertEqual("2 * x", expressions.compile_expression("x**2 + 3").derivative().expression, msg="Derivative not simplified")
+            self.assertEqual("x", expressions.compile_expression("x*y", ("x", "y")).derivative("y").expression, msg="Incorrect partial derivative")
+            self.assertAlmostEqual(math.pi, batch.solve({"method": "roots.newton_raphson", "f": "sin(x)", "xi": 3, "precision": 1e-12})["result"]["root"],
+                                   delta=1e-12, msg="Incorrect batch root with an exact derivative")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Dual numbers (used by methods such as newton_raphson when no derivative is given) work with every function:
+        for name in expressions.FUNCTIONS:
+            g = expressions.compile_expression(f"{name}(x / 3) * x")
+            try:
+                self.assertTrue(np.allclose((g(0.6), g.derivative()(0.6)), numerical_methods.roots.value_and_derivative(g, 0.6), rtol=1e-14, atol=0),
+                                msg=f"Incorrect dual number derivative of {g.expression}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        try:
+            self.assertAlmostEqual(math.pi / 6, numerical_methods.roots.newton_raphson(expressions.compile_expression("sin(x) - 0.5"), None, 1.0, 1e-10).root,
+                                   delta=1e-10, msg="Incorrect Newton-Raphson root of a compiled expression without a derivative")
+        except (AssertionError, TypeError) as e:
+            self.errorList.append(str(e))
+        
+        # Expressions that are not plain arithmetic should be rejected:
+        for expression in ["x.__class__", "open('file')", "[x for x in y]", "lambda: 1", "x +", "z", "sin(x, x)", "'x'", "x + 1" + "0" * 400]:
+            try:
+                self.assertRaises(ValueError, expressions.compile_expression, expression)
+            except AssertionError:
+                self.errorList.append(f"ValueError not raised for expression {expression}")
+        
+        # Powers of constants should overflow straight away, rather than building enormous integers:
+        g = expressions.compile_expression("x + 9**9**9**9")
+        for x in [1.0, np.ones(3)]:
+            try:
+                self.assertRaises(OverflowError, g, x)
+            except AssertionError:
+                self.errorList.append(f"OverflowError not raised for a huge power of a constant, with x = {x}")
+        
+        try:
+            self.assertRaises(ValueError, f.derivative, "y")
+        except AssertionError:
+            self.errorList.append("ValueError not raised when differentiating by an unknown variable")
+    
+    def test_benchmark(self) -> None:
+        results = benchmark.run(max_size=1000, only="simpsons_13", repeat=1, output=lambda line: None)
+        
+        # Both variants should run at every size, with the evaluations counted:
+        try:
+            self.assertEqual([("scalar", 100), ("scalar", 1000), ("vectorized", 100), ("vectorized", 1000)], [(r.variant, r.size) for r in results],
+                             msg="Incorrect benchmark runs")
+            self.assertEqual([101, 1001, 101, 1001], [r.evaluations for r in results], msg="Incorrect benchmark evaluation counts")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Every root finder should have a case, and the bracketing methods should not find the roots on their first step:
+        names = {name for name, _, _ in benchmark.cases()}
+        for name in ["bisection", "false_position", "secant", "brent", "newton_raphson", "bracket_batch", "find_all_roots", "newton_system",
+                     "broyden", "fixed_point", "polynomial_roots", "continuation"]:
+            try:
+                self.assertIn(f"roots.{name}", names, msg=f"No benchmark case for roots.{name}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        for root_result in benchmark.run(max_size=100, only="roots.b", repeat=1, memory=False, output=lambda line: None):
+            try:
+                self.assertLess(5 * root_result.size, root_result.evaluations, msg=f"Benchmark of {root_result.name} finds the roots too easily")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        
+        # Comparing runs from the history file, where one has been made slower:
+        with tempfile.TemporaryDirectory() as directory:
+            history = os.path.join(directory, "history.json")
+            benchmark.save(results, history)
+            benchmark.save(results, history)
+            with open(history) as file:
+                runs = json.load(file)
+            runs["runs"][-1]["results"][0]["evaluations_per_second"] /= 2
+            with open(history, "w") as file:
+                json.dump(runs, file)
+            comparison = benchmark.compare(history, threshold=0.1)
+        try:
+            self.assertEqual([True, False, False, False], [c["regression"] for c in comparison], msg="Incorrect benchmark regressions")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, benchmark.run, 10)
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the maximum size is too small")
+    
+    def test_instrumentation(self) -> None:
+        def f(x: float) -> float: return (x - 1) * (x + 6)
+        def df(x: float) -> float: return 2 * x + 5
+        
+        # Statistics should be collected for every method called through the package inside the block:
+        with instrument.collect() as statistics:
+            bisection = numerical_methods.roots.bisection(f, 0, 3, 1e-10)
+            newton = numerical_methods.roots.newton_raphson(f, df, 3, 1e-10)
+            numerical_methods.roots.newton_raphson(f, df, 3, 1e-10)
+            numerical_methods.ode.heun(lambda x, y: y, 0, 1, 1, 0.1)
+            try:
+                numerical_methods.roots.bisection(f, 2, 3, 1e-10)
+            except ValueError:
+                pass
+        numerical_methods.roots.bisection(f, 0, 3, 1e-10)  # (Outside the block, so not recorded)
+        exported = statistics.as_dict()
+        try:
+            self.assertEqual({"roots.bisection", "roots.newton_raphson", "ode.heun"}, set(exported), msg="Incorrect methods recorded")
+            self.assertEqual(2, exported["roots.bisection"]["calls"], msg="Incorrect number of calls recorded")
+            self.assertEqual(1, exported["roots.bisection"]["errors"], msg="Incorrect number of errors recorded")
+            self.assertEqual(bisection.iterations, exported["roots.bisection"]["iterations"], msg="Incorrect number of iterations recorded")
+            self.assertEqual(bisection.evaluations + 2, exported["roots.bisection"]["evaluations"]["f"], msg="Incorrect number of evaluations recorded")
+            self.assertEqual(2 * newton.evaluations, sum(exported["roots.newton_raphson"]["evaluations"].values()), msg="Incorrect Newton Raphson evaluations recorded")
+            self.assertIn("df", exported["ode.heun"]["evaluations"], msg="ODE function evaluations not recorded")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Counting the calls to a function directly:
+        counted = instrument.counted(f)
+        result = numerical_methods.roots.bisection(counted, 0, 3, 1e-10)
+        try:
+            self.assertEqual(result.evaluations, counted.calls, msg="Incorrect number of calls counted")
+            self.assertGreater(counted.time, 0, msg="Time in counted function not recorded")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+    
+    def test_lazy_loading(self) -> None:
+        # Importing the package should not import any namespace, method or heavy dependency:
+        modules = loaded_modules("import numerical_methods")
+        try:
+            self.assertFalse({"numerical_methods.roots", "numerical_methods.fit", "numpy", "typing"} & modules, msg=f"Package import loaded too much: {modules}")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Using one method should only import the file it lives in:
+        modules = loaded_modules("from numerical_methods.roots import bisection")
+        try:
+            self.assertIn("numerical_methods._impl.bisection_method", modules, msg="bisection_method was not loaded")
+            self.assertFalse({"numpy", "bisection_method", "root_result", "numerical_methods._impl.brent_method", "numerical_methods._impl.polynomial"} & modules,
+                             msg="Importing bisection loaded other methods, or loaded it under its plain name")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # The method files should be loaded without changing sys.path, while still importing each other by their plain names:
+        code = "import sys\npath = list(sys.path)\nimport numerical_methods as nm\nnm.roots.newton_raphson_batch(lambda x: x*x - 2, [1.0, 3.0], 1e-12)\n" \
+               "nm.fit.levenberg_marquardt(lambda x, p: p[0] * x, [1.0, 2.0], [2.0, 4.0], [1.0], 'dual')\nprint(sys.path == path)"
+        try:
+            self.assertEqual("True", subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip(),
+                             msg="Loading the methods changed sys.path")
+        except (AssertionError, subprocess.CalledProcessError) as e:
+            self.errorList.append(str(e))
+        
+        # A user's own module with the same name as a method file should neither break the package nor be replaced by it:
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "root_result.py"), "w") as file:
+                file.write("USER_MODULE = True\n")
+            code = "import numerical_methods as nm\nresult = nm.roots.bisection(lambda x: x - 1, 0, 3, 1e-9)\nimport root_result\n" \
+                   "print(result.converged, root_result.USER_MODULE)"
+            try:
+                output = subprocess.run([sys.executable, "-c", code], cwd=directory, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": ROOT})
+                self.assertEqual("True True", output.stdout.strip(), msg=f"A user's root_result.py clashed with the package: {output.stderr}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+    
+    def test_work_precision(self) -> None:
+        points = work_precision.sweep("integrate", ["exp"], max_evaluations=1000)
+        rows = work_precision.cheapest(points, [1e-3, 1e-6])
+        
+        # The errors should shrink as each method uses more evaluations, and the higher order methods should be cheaper:
+        for method in work_precision.INTEGRAL_METHODS:
+            errors = [point.error for point in points if point.method == method]
+            try:
+                self.assertTrue(all(later < earlier for earlier, later in zip(errors, errors[1:])), msg=f"{method} errors did not shrink: {errors}")
+            except AssertionError as e:
+                self.errorList.append(str(e))
+        try:
+            self.assertIsNone(rows[1]["costs"]["rectangle"], msg="Rectangle method reached a tolerance of 1e-6 too cheaply")
+            self.assertIn(rows[1]["cheapest"], ["simpsons_13", "simpsons_38"], msg="Incorrect cheapest method")
+            self.assertIn("simpsons_13", work_precision.table(rows), msg="Incorrect work-precision table")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # The ODE methods should also improve with smaller steps:
+        points = work_precision.sweep("ode", ["decay"], ["heun"], max_evaluations=1000)
+        try:
+            self.assertGreater(points[0].error, points[-1].error * 100, msg="Heun method error did not shrink")
+            self.assertEqual([3 * point.resolution for point in points], [point.evaluations for point in points],
+                             msg="The resolution of the ODE runs is not the number of steps taken")
+        except AssertionError as e:
+            self.errorList.append(str(e))
+        
+        # Passing invalid values to function:
+        try:
+            self.assertRaises(ValueError, work_precision.sweep, "derivative")
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the kind of method is not recognised")
+        
+        try:
+            self.assertRaises(ValueError, work_precision.sweep, "ode", ["sin"])
+        except AssertionError:
+            self.errorList.append("ValueError not raised when the problem is not recognised")
+
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestPackage)
+    unittest.TextTestRunner(verbosity=0).run(suite)
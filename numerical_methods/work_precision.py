@@ -0,0 +1,201 @@
+# Author: Satya Jhaveri
+#
+# A work-precision harness, for choosing the cheapest method that reaches a given accuracy.
+#
+# Each integral approximating method (rectangle, trapezoidal, Simpson's 1/3 and 3/8 rules) and
+#  each ODE method (forward Euler, Heun, midpoint) is run over a sweep of its resolution (the
+#  number of points n, or the number of steps the method actually took) on a library of reference
+#  problems with known exact solutions. For every run the achieved error, the number of function
+#  evaluations and the wall time are recorded.
+#
+# A higher order method needs fewer evaluations for the same error once n is large enough, but
+#  may cost more per step, so the cheapest method depends on the tolerance. The work-precision
+#  table shows, for each problem and tolerance, the fewest evaluations each method needed to
+#  reach that tolerance, and which method was cheapest. Usage:
+#
+#  python -m numerical_methods.work_precision [--kind integrate|ode] [--problem NAME] [--json FILE]
+#
+
+import argparse
+import json
+import math
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from numerical_methods import integrate, ode
+from numerical_methods.benchmark import EvaluationCounter
+
+# The reference integrals, as (f, a, b, exact value):
+INTEGRALS = {
+    "sin": (math.sin, 0, math.pi, 2.0),
+    "exp": (math.exp, 0, 1, math.e - 1),
+    "arctan": (lambda x: 1 / (1 + x * x), 0, 1, math.pi / 4),
+    "sqrt": (math.sqrt, 0, 1, 2 / 3),  # (The derivative is infinite at 0, which limits every method's order)
+}
+
+# The reference ODEs, as (dy/dx, initial x, final x, initial y, exact final y):
+ODES = {
+    "decay": (lambda x, y: -y, 0, 1, 1, math.exp(-1)),
+    "gaussian": (lambda x, y: -2 * x * y, 0, 2, 1, math.exp(-4)),
+    "logistic": (lambda x, y: y * (1 - y), 0, 4, 0.5, 1 / (1 + math.exp(-4))),
+    "oscillating": (lambda x, y: math.cos(x), 0, 10, 0, math.sin(10)),
+}
+
+INTEGRAL_METHODS = {
+    "rectangle": (integrate.rectangle, lambda n: n),
+    "trapezoidal": (integrate.trapezoidal, lambda n: n),
+    "simpsons_13": (integrate.simpsons_13, lambda n: n + 1 if n % 2 == 0 else n),
+    "simpsons_38": (integrate.simpsons_38, lambda n: n - (n - 1) % 3),
+}
+
+ODE_METHODS = {
+    "forward_euler": ode.forward_euler,
+    "heun": ode.heun,
+    "midpoint": ode.midpoint,
+}
+
+DEFAULT_TOLERANCES = [10.0**-k for k in range(2, 11)]
+
+
+@dataclass
+class WorkPrecisionPoint:
+    problem: str
+    method: str
+    resolution: int
+    evaluations: int
+    error: float
+    wall_time: float
+
+
+def sweep(kind: str = "integrate", problems: Optional[List[str]] = None, methods: Optional[List[str]] = None,
+          max_evaluations: int = 10**5) -> List[WorkPrecisionPoint]:
+    """
+    Runs each method on each reference problem over a sweep of resolutions, doubling the number of points (or halving the
+     step size) until the method uses more than max_evaluations function evaluations.
+
+    Args:
+        kind (str, optional): The kind of method, either 'integrate' or 'ode'. Defaults to 'integrate'.
+        problems (Optional[List[str]], optional): The names of the reference problems to use. Defaults to None (all of them).
+        methods (Optional[List[str]], optional): The names of the methods to run. Defaults to None (all of them).
+        max_evaluations (int, optional): The largest number of function evaluations to sweep up to. Defaults to 100000.
+
+    Raises:
+        ValueError: If the kind, a problem or a method is not recognised, or if max_evaluations is less than 10.
+
+    Returns:
+        List[WorkPrecisionPoint]: The error, evaluations and wall time of every run
+    """
+    # Validating inputs:
+    if kind not in ("integrate", "ode"):
+        raise ValueError("The kind must be either 'integrate' or 'ode'.")
+    library, all_methods = (INTEGRALS, INTEGRAL_METHODS) if kind == "integrate" else (ODES, ODE_METHODS)
+    problems = list(library) if problems is None else problems
+    methods = list(all_methods) if methods is None else methods
+    if any(problem not in library for problem in problems):
+        raise ValueError(f"The problems must be from: {', '.join(library)}.")
+
+    if any(method not in all_methods for method in methods):
+        raise ValueError(f"The methods must be from: {', '.join(all_methods)}.")
+
+    if max_evaluations < 10:
+        raise ValueError("The maximum number of evaluations cannot be less than 10.")
+
+    # Actual method:
+    points = []
+    for problem in problems:
+        for method in methods:
+            resolution = 4
+            while True:
+                if kind == "integrate":
+                    f, a, b, exact = library[problem]
+                    function, points_used = all_methods[method]
+                    counter = EvaluationCounter(f)
+                    n = points_used(resolution)
+                    start = time.perf_counter()
+                    value = function(counter, a, b, n)
+                    parameter = n
+                else:
+                    df, initial_x, final_x, initial_y, exact = library[problem]
+                    counter = EvaluationCounter(df)
+                    start = time.perf_counter()
+                    x, y = all_methods[method](counter, initial_x, final_x, initial_y, (final_x - initial_x) / resolution)
+                    value = y[-1]
+                    parameter = len(x) - 1  # (The number of steps actually taken, which can differ from the number requested)
+                wall_time = time.perf_counter() - start
+
+                points.append(WorkPrecisionPoint(problem, method, parameter, counter.count, abs(value - exact), wall_time))
+                if counter.count * 2 > max_evaluations:
+                    break
+                resolution *= 2
+    return points
+
+
+def cheapest(points: List[WorkPrecisionPoint], tolerances: List[float] = DEFAULT_TOLERANCES) -> List[Dict]:
+    """
+    Finds the fewest function evaluations each method needed to reach each tolerance on each problem.
+
+    Args:
+        points (List[WorkPrecisionPoint]): The results of a sweep
+        tolerances (List[float], optional): The tolerances to check. Defaults to 1e-2, 1e-3, ..., 1e-10.
+
+    Returns:
+        List[Dict]: For each problem and tolerance, the problem, the tolerance, the fewest evaluations (and the wall time of
+            that run) for each method (None if it never reached the tolerance), and the cheapest method (None if no method did)
+    """
+    problems = list(dict.fromkeys(point.problem for point in points))
+    methods = list(dict.fromkeys(point.method for point in points))
+    rows = []
+    for problem in problems:
+        for tolerance in tolerances:
+            costs = {}
+            for method in methods:
+                reached = [point for point in points if point.problem == problem and point.method == method and point.error <= tolerance]
+                best = min(reached, key=lambda point: point.evaluations, default=None)
+                costs[method] = None if best is None else {"evaluations": best.evaluations, "wall_time": best.wall_time}
+            candidates = [method for method in methods if costs[method] is not None]
+            best_method = min(candidates, key=lambda method: costs[method]["evaluations"], default=None)
+            rows.append({"problem": problem, "tolerance": tolerance, "costs": costs, "cheapest": best_method})
+    return rows
+
+
+def table(rows: List[Dict]) -> str:
+    """
+    Formats the result of cheapest as a text table, with one row per problem and tolerance, and one column per method.
+
+    Args:
+        rows (List[Dict]): The result of cheapest
+
+    Returns:
+        str: The work-precision table
+    """
+    if len(rows) == 0:
+        return ""
+    methods = list(rows[0]["costs"])
+    lines = [f"{'problem':<12} {'tolerance':>9} " + " ".join(f"{method:>14}" for method in methods) + "  cheapest"]
+    for row in rows:
+        cells = [("-" if row["costs"][method] is None else str(row["costs"][method]["evaluations"])) for method in methods]
+        lines.append(f"{row['problem']:<12} {row['tolerance']:>9.0e} " + " ".join(f"{cell:>14}" for cell in cells) + f"  {row['cheapest'] or '-'}")
+    return "\n".join(lines)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m numerical_methods.work_precision",
+                                     description="Work-precision tables for the integral approximating and ODE methods.")
+    parser.add_argument("--kind", choices=["integrate", "ode"], default="integrate", help="The kind of method to compare (default integrate)")
+    parser.add_argument("--problem", action="append", help="A reference problem to use (can be repeated, default all of them)")
+    parser.add_argument("--max-evaluations", type=float, default=1e5, help="The largest number of evaluations to sweep up to (default 1e5)")
+    parser.add_argument("--json", help="A file to write every point of the sweep to")
+    args = parser.parse_args(arguments)
+
+    points = sweep(args.kind, args.problem, max_evaluations=int(args.max_evaluations))
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([asdict(point) for point in points], file, indent=1)
+    print(table(cheapest(points)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())